@@ -14,12 +14,64 @@ DATABASES = {
 CACHES = {
     "default": {},
     "local": {
+        "engine": "LocalCache",
         "backend": "spaceone.core.cache.local_cache.LocalCache",
-        "max_size": 128,
+        "max_size": 1024,
         "ttl": 300,
     },
 }
 
+# Config Cache Settings (seconds)
+DOMAIN_CONFIG_CACHE_EXPIRE = 3600
+SHARED_CONFIG_RESOLVE_CACHE_EXPIRE = 600
+
+# Config Data Compression Settings (requires zstandard)
+DATA_COMPRESSION = {
+    "enabled": False,
+    "threshold": 16384,  # bytes, data with a larger BSON encoding is compressed
+    "level": 3,  # zstd compression level
+}
+
+# Identity Cache Settings (seconds)
+IDENTITY_CACHE = {
+    "workspace_expire": 300,  # existing workspaces
+    "negative_expire": 10,  # workspaces the identity service rejected
+    "project_expire": 600,  # projects, served fresh
+    "project_stale_expire": 1200,  # then served stale, at most 2x project_expire
+    "jitter": 0.1,  # +-ratio of randomness added to fresh expirations
+}
+
+# Chunked Storage Settings, data too large for a single document goes to GridFS
+CHUNKED_STORAGE = {
+    "enabled": True,
+    "threshold": 8388608,  # bytes of encoded (and compressed) data
+    "cleanup_interval": 3600,  # seconds between orphan data file cleanups
+}
+
+# Number of configs per message in streaming list responses
+LIST_STREAM_BATCH_SIZE = 100
+
+# Config Watch Settings
+CONFIG_WATCH = {
+    "poll_interval": 5,  # seconds, used when change streams are unavailable
+    "reconcile_interval": 60,  # seconds between delete checks while polling
+    "heartbeat_interval": 30,  # seconds between client liveness checks
+    "max_queue_size": 1000,  # pending events before a slow watcher is closed
+    "max_watchers": None,  # open streams, each holds a thread, None: MAX_WORKERS / 2
+}
+
+# Config Sync (list_changes) Settings
+CONFIG_SYNC = {
+    "tombstone_ttl": 604800,  # seconds, deletes are reported for this long
+    "clock_skew": 5,  # seconds, changes are returned again for this long
+}
+
+# Public Config In-Memory Store Settings
+PUBLIC_CONFIG_STORE = {
+    "enabled": False,
+    "poll_interval": 5,  # seconds, used when change streams are unavailable
+}
+
 # Handler Settings
 HANDLERS = {
     # "authentication": [{
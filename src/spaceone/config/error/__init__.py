@@ -0,0 +1 @@
+from spaceone.config.error.config import *
@@ -0,0 +1,17 @@
+from spaceone.core.error import *
+
+
+class ERROR_VERSION_CONFLICT(ERROR_INVALID_ARGUMENT):
+    _status_code = "ABORTED"
+    _message = (
+        "Config was modified by another request, read it again and retry. "
+        "(name = {name}, expected_version = {expected_version}, version = {version})"
+    )
+
+
+class ERROR_TOO_MANY_WATCHERS(ERROR_BASE):
+    _status_code = "RESOURCE_EXHAUSTED"
+    _message = (
+        "Too many watch streams are open, retry later or poll list_changes. "
+        "(max_watchers = {max_watchers})"
+    )
@@ -3,6 +3,11 @@ from spaceone.config.interface.grpc.user_config import UserConfig
 from spaceone.config.interface.grpc.domain_config import DomainConfig
 from spaceone.config.interface.grpc.shared_config import SharedConfig
 from spaceone.config.interface.grpc.public_config import PublicConfig
+from spaceone.config.lib.migration import (
+    start_data_file_cleanup,
+    start_index_migration,
+)
+from spaceone.config.lib.public_config_store import start_public_config_store
 
 _all_ = ["app"]
 
@@ -11,3 +16,7 @@ app.add_service(UserConfig)
 app.add_service(DomainConfig)
 app.add_service(SharedConfig)
 app.add_service(PublicConfig)
+
+start_index_migration()
+start_public_config_store()
+start_data_file_cleanup()
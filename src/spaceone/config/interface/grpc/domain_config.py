@@ -1,6 +1,7 @@
 from spaceone.api.config.v1 import domain_config_pb2, domain_config_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
 
+from spaceone.config.lib.serializer import to_message
 from spaceone.config.service.domain_config_service import DomainConfigService
 
 
@@ -20,12 +21,24 @@ class DomainConfig(BaseAPI, domain_config_pb2_grpc.DomainConfigServicer):
         response: dict = domain_config_svc.update(params)
         return self.dict_to_message(response)
 
+    def patch(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        domain_config_svc = DomainConfigService(metadata)
+        response: dict = domain_config_svc.patch(params)
+        return self.dict_to_message(response)
+
     def set(self, request, context):
         params, metadata = self.parse_request(request, context)
         domain_config_svc = DomainConfigService(metadata)
         response: dict = domain_config_svc.set(params)
         return self.dict_to_message(response)
 
+    def bulk_write(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        domain_config_svc = DomainConfigService(metadata)
+        response: dict = domain_config_svc.bulk_write(params)
+        return self.dict_to_message(response)
+
     def delete(self, request, context):
         params, metadata = self.parse_request(request, context)
         domain_config_svc = DomainConfigService(metadata)
@@ -38,8 +51,42 @@ class DomainConfig(BaseAPI, domain_config_pb2_grpc.DomainConfigServicer):
         response: dict = domain_config_svc.get(params)
         return self.dict_to_message(response)
 
+    def get_many(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        domain_config_svc = DomainConfigService(metadata)
+        response: dict = domain_config_svc.get_many(params)
+        return self.dict_to_message(response)
+
     def list(self, request, context):
         params, metadata = self.parse_request(request, context)
         domain_config_svc = DomainConfigService(metadata)
         response: dict = domain_config_svc.list(params)
-        return self.dict_to_message(response)
+        return to_message(self.pb2.DomainConfigsInfo, response)
+
+    def list_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        domain_config_svc = DomainConfigService(metadata)
+        for response in domain_config_svc.list_stream(params):
+            yield to_message(self.pb2.DomainConfigsInfo, response)
+
+    def list_changes(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        domain_config_svc = DomainConfigService(metadata)
+        response: dict = domain_config_svc.list_changes(params)
+        return to_message(self.pb2.DomainConfigChangesInfo, response)
+
+    def watch(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        domain_config_svc = DomainConfigService(metadata)
+        events = domain_config_svc.watch(params)
+        try:
+            for event in events:
+                # None is a heartbeat, it only checks whether the client is gone
+                if event is None:
+                    if not context.is_active():
+                        return
+                    continue
+
+                yield to_message(self.pb2.DomainConfigEventInfo, event)
+        finally:
+            events.close()
@@ -1,6 +1,7 @@
 from spaceone.api.config.v1 import public_config_pb2, public_config_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
 
+from spaceone.config.lib.serializer import to_message
 from spaceone.config.service.public_config_service import PublicConfigService
 
 
@@ -42,4 +43,10 @@ class PublicConfig(BaseAPI, public_config_pb2_grpc.PublicConfigServicer):
         params, metadata = self.parse_request(request, context)
         public_config_svc = PublicConfigService(metadata)
         response: dict = public_config_svc.list(params)
-        return self.dict_to_message(response)
+        return to_message(self.pb2.PublicConfigsInfo, response)
+
+    def list_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        public_config_svc = PublicConfigService(metadata)
+        for response in public_config_svc.list_stream(params):
+            yield to_message(self.pb2.PublicConfigsInfo, response)
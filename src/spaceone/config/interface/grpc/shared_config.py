@@ -1,6 +1,7 @@
 from spaceone.api.config.v1 import shared_config_pb2, shared_config_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
 
+from spaceone.config.lib.serializer import to_message
 from spaceone.config.service.shared_config_service import SharedConfigService
 
 
@@ -20,6 +21,12 @@ class SharedConfig(BaseAPI, shared_config_pb2_grpc.SharedConfigServicer):
         response: dict = shared_config_svc.update(params)
         return self.dict_to_message(response)
 
+    def patch(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        shared_config_svc = SharedConfigService(metadata)
+        response: dict = shared_config_svc.patch(params)
+        return self.dict_to_message(response)
+
     def delete(self, request, context):
         params, metadata = self.parse_request(request, context)
         shared_config_svc = SharedConfigService(metadata)
@@ -32,8 +39,42 @@ class SharedConfig(BaseAPI, shared_config_pb2_grpc.SharedConfigServicer):
         response: dict = shared_config_svc.get(params)
         return self.dict_to_message(response)
 
+    def resolve(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        shared_config_svc = SharedConfigService(metadata)
+        response: dict = shared_config_svc.resolve(params)
+        return self.dict_to_message(response)
+
     def list(self, request, context):
         params, metadata = self.parse_request(request, context)
         shared_config_svc = SharedConfigService(metadata)
         response: dict = shared_config_svc.list(params)
-        return self.dict_to_message(response)
+        return to_message(self.pb2.SharedConfigsInfo, response)
+
+    def list_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        shared_config_svc = SharedConfigService(metadata)
+        for response in shared_config_svc.list_stream(params):
+            yield to_message(self.pb2.SharedConfigsInfo, response)
+
+    def list_changes(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        shared_config_svc = SharedConfigService(metadata)
+        response: dict = shared_config_svc.list_changes(params)
+        return to_message(self.pb2.SharedConfigChangesInfo, response)
+
+    def watch(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        shared_config_svc = SharedConfigService(metadata)
+        events = shared_config_svc.watch(params)
+        try:
+            for event in events:
+                # None is a heartbeat, it only checks whether the client is gone
+                if event is None:
+                    if not context.is_active():
+                        return
+                    continue
+
+                yield to_message(self.pb2.SharedConfigEventInfo, event)
+        finally:
+            events.close()
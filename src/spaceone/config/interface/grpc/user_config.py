@@ -1,6 +1,7 @@
 from spaceone.api.config.v1 import user_config_pb2, user_config_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
 
+from spaceone.config.lib.serializer import to_message
 from spaceone.config.service.user_config_service import UserConfigService
 
 
@@ -20,12 +21,24 @@ class UserConfig(BaseAPI, user_config_pb2_grpc.UserConfigServicer):
         response: dict = user_config_svc.update(params)
         return self.dict_to_message(response)
 
+    def patch(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        user_config_svc = UserConfigService(metadata)
+        response: dict = user_config_svc.patch(params)
+        return self.dict_to_message(response)
+
     def set(self, request, context):
         params, metadata = self.parse_request(request, context)
         user_config_svc = UserConfigService(metadata)
         response: dict = user_config_svc.set(params)
         return self.dict_to_message(response)
 
+    def bulk_write(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        user_config_svc = UserConfigService(metadata)
+        response: dict = user_config_svc.bulk_write(params)
+        return self.dict_to_message(response)
+
     def delete(self, request, context):
         params, metadata = self.parse_request(request, context)
         user_config_svc = UserConfigService(metadata)
@@ -38,8 +51,42 @@ class UserConfig(BaseAPI, user_config_pb2_grpc.UserConfigServicer):
         response: dict = user_config_svc.get(params)
         return self.dict_to_message(response)
 
+    def get_many(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        user_config_svc = UserConfigService(metadata)
+        response: dict = user_config_svc.get_many(params)
+        return self.dict_to_message(response)
+
     def list(self, request, context):
         params, metadata = self.parse_request(request, context)
         user_config_svc = UserConfigService(metadata)
         response: dict = user_config_svc.list(params)
-        return self.dict_to_message(response)
+        return to_message(self.pb2.UserConfigsInfo, response)
+
+    def list_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        user_config_svc = UserConfigService(metadata)
+        for response in user_config_svc.list_stream(params):
+            yield to_message(self.pb2.UserConfigsInfo, response)
+
+    def list_changes(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        user_config_svc = UserConfigService(metadata)
+        response: dict = user_config_svc.list_changes(params)
+        return to_message(self.pb2.UserConfigChangesInfo, response)
+
+    def watch(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        user_config_svc = UserConfigService(metadata)
+        events = user_config_svc.watch(params)
+        try:
+            for event in events:
+                # None is a heartbeat, it only checks whether the client is gone
+                if event is None:
+                    if not context.is_active():
+                        return
+                    continue
+
+                yield to_message(self.pb2.UserConfigEventInfo, event)
+        finally:
+            events.close()
@@ -0,0 +1,306 @@
+import json
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Union
+
+from bson import json_util
+from cachetools import TLRUCache
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_BASE
+
+from spaceone.config.lib.single_flight import single_flight
+
+__all__ = ["get", "set", "delete", "get_or_load"]
+
+_LOGGER = logging.getLogger(__name__)
+
+LOCAL_CACHE_ALIAS = "local"
+REMOTE_CACHE_ALIAS = "default"
+INVALIDATION_CHANNEL = "config:cache:invalidation"
+
+# A value is never served stale for longer than this many fresh windows.
+MAX_STALE_RATIO = 2
+
+# Cached documents hold datetimes, which plain JSON can not round-trip.
+_JSON_OPTIONS = json_util.JSONOptions(
+    json_mode=json_util.JSONMode.RELAXED, tz_aware=False
+)
+
+_LOCAL_CACHE = None
+_LOCAL_CACHE_LOCK = threading.Lock()
+_SUBSCRIBER_LOCK = threading.Lock()
+_SUBSCRIBER = None
+_REDIS_CLIENT = None
+
+_REFRESHING = {}
+_REFRESHING_LOCK = threading.Lock()
+
+
+class _LocalCache:
+    """Thread-safe LRU of the CACHES 'local' alias with a per-key expiry.
+
+    An expiry is capped by the alias ttl, so that a replica which missed an
+    invalidation message does not keep a stale copy for longer than that.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: int = 300):
+        self.ttl = ttl
+        self._cache = TLRUCache(maxsize=max_size, ttu=self._get_expire_time)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_expire_time(key: str, entry: tuple, now: float) -> float:
+        return now + entry[1]
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._cache.get(key)
+
+        return None if entry is None else entry[0]
+
+    def set(self, key: str, value: Any, expire: int = None) -> None:
+        expire = min(expire, self.ttl) if expire else self.ttl
+        with self._lock:
+            self._cache[key] = (value, expire)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._cache.pop(key, None)
+
+
+def get(key: str):
+    """Read through the process-local cache, then the shared (Redis) cache."""
+
+    _start_subscriber()
+
+    local_cache = _get_local_cache()
+    if local_cache is not None:
+        value = local_cache.get(key)
+        if value is not None:
+            return value
+
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            cached_value = client.get(key)
+        except Exception as e:
+            _LOGGER.error(f"[get] Failed to read cache {key} : {e}")
+            return None
+
+        if cached_value is not None:
+            value = json_util.loads(cached_value, json_options=_JSON_OPTIONS)
+            if local_cache is not None:
+                local_cache.set(key, value)
+            return value
+
+    return None
+
+
+def set(key: str, value, expire: int = None) -> None:
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            client.set(
+                key, json_util.dumps(value, json_options=_JSON_OPTIONS), ex=expire
+            )
+        except Exception as e:
+            _LOGGER.error(f"[set] Failed to write cache {key} : {e}")
+
+    local_cache = _get_local_cache()
+    if local_cache is not None:
+        local_cache.set(key, value, expire)
+
+
+def delete(key: str) -> None:
+    """Drop a key from both tiers and tell every other replica to drop it."""
+
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            client.delete(key)
+        except Exception as e:
+            _LOGGER.error(f"[delete] Failed to delete cache {key} : {e}")
+
+    local_cache = _get_local_cache()
+    if local_cache is not None:
+        local_cache.delete(key)
+
+    _publish({"key": key})
+
+
+def get_or_load(
+    key: str,
+    load: Callable[[], Any],
+    expire: int,
+    stale_expire: int = 0,
+    jitter: float = 0.1,
+) -> Any:
+    """Read through both tiers and call load on a miss (stale-while-revalidate).
+
+    A loaded value is fresh for expire seconds, randomized by +-jitter so that
+    keys written together do not expire together. For stale_expire seconds
+    after that, capped at MAX_STALE_RATIO times expire, it is still returned
+    while one background call refreshes it. A refresh that fails with NOT_FOUND
+    drops the value. Only a value older than both blocks, and concurrent loads
+    of the same key in this process share one call.
+    """
+
+    stale_expire = min(stale_expire, expire * MAX_STALE_RATIO)
+
+    def _load():
+        value = load()
+        fresh_for = expire * random.uniform(1 - jitter, 1 + jitter)
+        now = time.time()
+        entry = {
+            "value": value,
+            "stale_at": now + fresh_for,
+            "expires_at": now + fresh_for + stale_expire,
+        }
+        set(key, entry, expire=int(fresh_for + stale_expire) + 1)
+        return value
+
+    entry = get(key)
+    now = time.time()
+
+    if entry is None or entry["expires_at"] < now:
+        return single_flight(key, _load)
+
+    if entry["stale_at"] < now:
+        _refresh_in_background(key, _load)
+
+    return entry["value"]
+
+
+def _refresh_in_background(key: str, load: Callable[[], Any]) -> None:
+    with _REFRESHING_LOCK:
+        if key in _REFRESHING:
+            return
+
+        _REFRESHING[key] = True
+
+    def _run():
+        try:
+            single_flight(key, load)
+        except Exception as e:
+            if isinstance(e, ERROR_BASE) and e.status_code == "NOT_FOUND":
+                # Gone at the source, so it must not be served stale any longer
+                delete(key)
+            else:
+                _LOGGER.error(
+                    f"[_refresh_in_background] Failed to refresh {key} : {e}"
+                )
+        finally:
+            with _REFRESHING_LOCK:
+                _REFRESHING.pop(key, None)
+
+    threading.Thread(target=_run, name="cache-refresh", daemon=True).start()
+
+
+def _get_local_cache() -> Union[_LocalCache, None]:
+    global _LOCAL_CACHE
+
+    cache_conf = config.get_global("CACHES", {}).get(LOCAL_CACHE_ALIAS, {})
+    if not cache_conf:
+        return None
+
+    if _LOCAL_CACHE is None:
+        with _LOCAL_CACHE_LOCK:
+            if _LOCAL_CACHE is None:
+                _LOCAL_CACHE = _LocalCache(
+                    cache_conf.get("max_size", 128), cache_conf.get("ttl", 300)
+                )
+
+    return _LOCAL_CACHE
+
+
+def _get_redis_options() -> Union[dict, None]:
+    cache_conf = config.get_global("CACHES", {}).get(REMOTE_CACHE_ALIAS, {})
+
+    # spaceone-core reads the cache class from engine since 2.0.10 and from
+    # backend before that, deployments set either of them.
+    engine = cache_conf.get("engine") or cache_conf.get("backend") or ""
+    if not engine.endswith("RedisCache"):
+        return None
+
+    return {
+        key: value
+        for key, value in cache_conf.items()
+        if key not in ["engine", "backend"]
+    }
+
+
+def _create_redis_client(**kwargs):
+    options = _get_redis_options()
+    if options is None:
+        return None
+
+    import redis
+
+    options.update(kwargs)
+    if options.pop("ssl", False):
+        options["connection_class"] = redis.SSLConnection
+
+    return redis.Redis(connection_pool=redis.ConnectionPool(**options))
+
+
+def _get_redis_client():
+    global _REDIS_CLIENT
+
+    if _REDIS_CLIENT is None:
+        _REDIS_CLIENT = _create_redis_client()
+
+    return _REDIS_CLIENT
+
+
+def _publish(message: dict) -> None:
+    if _get_local_cache() is None:
+        return
+
+    try:
+        client = _get_redis_client()
+        if client:
+            client.publish(INVALIDATION_CHANNEL, json.dumps(message))
+    except Exception as e:
+        _LOGGER.error(f"[_publish] Failed to publish cache invalidation : {e}")
+
+
+def _start_subscriber() -> None:
+    global _SUBSCRIBER
+
+    if _SUBSCRIBER is not None or _get_local_cache() is None:
+        return
+
+    with _SUBSCRIBER_LOCK:
+        if _SUBSCRIBER is not None:
+            return
+
+        _SUBSCRIBER = threading.Thread(
+            target=_listen_invalidations, name="cache-invalidation", daemon=True
+        )
+        _SUBSCRIBER.start()
+
+
+def _listen_invalidations() -> None:
+    global _SUBSCRIBER
+
+    try:
+        # The listener blocks until a message arrives, so it gets its own
+        # connection without the read timeout used for regular commands.
+        client = _create_redis_client(socket_timeout=None)
+        if client is None:
+            return
+
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(INVALIDATION_CHANNEL)
+
+        for message in pubsub.listen():
+            invalidation = json.loads(message["data"])
+            if "key" in invalidation:
+                _get_local_cache().delete(invalidation["key"])
+    except Exception as e:
+        # The next cache read starts a new subscriber.
+        _LOGGER.error(f"[_listen_invalidations] Invalidation listener stopped : {e}")
+        _SUBSCRIBER = None
@@ -0,0 +1,200 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Type
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+
+__all__ = ["ChangeFeed", "get_change_feed"]
+
+_LOGGER = logging.getLogger(__name__)
+
+# "The $changeStream stage is only supported on replica sets"
+_CHANGE_STREAM_NOT_SUPPORTED = 40573
+
+_CHANGE_FEEDS = {}
+_CHANGE_FEEDS_LOCK = threading.Lock()
+
+
+class ChangeFeed:
+    """Fan-out of collection changes from a single change stream per process.
+
+    Events are dicts of the form:
+        {
+            'operation': 'insert' | 'update' | 'delete',
+            'document_key': ObjectId,
+            'document': dict or None      # raw document, None for deletes
+        }
+
+    Without a replica set the feed falls back to polling on updated_at. In that
+    mode only inserts and updates are observed.
+    """
+
+    def __init__(self, model: Type[MongoModel], poll_interval: float = 5):
+        self.model = model
+        self.poll_interval = poll_interval
+        self.clock_skew = config.get_global("CONFIG_SYNC", {}).get("clock_skew", 5)
+        self.mode = None
+        self._resume_token = None
+        self._high_water = None
+        self._polled = set()
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def subscribe(self, callback: Callable[[dict], None]) -> Callable[[], None]:
+        with self._lock:
+            self._subscribers.append(callback)
+
+        self._start()
+
+        def _unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"change-feed-{self.model.__name__}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _dispatch(self, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                _LOGGER.error(f"[ChangeFeed._dispatch] Subscriber error : {e}")
+
+    def _run(self) -> None:
+        while True:
+            try:
+                # Connects lazily, a failure is retried like any other error.
+                collection = self.model._get_collection()
+                self._watch(collection)
+            except OperationFailure as e:
+                if e.code == _CHANGE_STREAM_NOT_SUPPORTED:
+                    _LOGGER.info(
+                        f"[ChangeFeed._run] Change streams are not supported, "
+                        f"poll {collection.name} on updated_at instead"
+                    )
+                    self._poll(collection)
+
+                # e.g. the resume point fell out of the oplog
+                _LOGGER.error(f"[ChangeFeed._run] Change stream failed : {e}")
+                self._resume_token = None
+                time.sleep(self.poll_interval)
+            except Exception as e:
+                _LOGGER.error(f"[ChangeFeed._run] Change stream error : {e}")
+                time.sleep(self.poll_interval)
+
+    def _watch(self, collection) -> None:
+        with collection.watch(
+            full_document="updateLookup", resume_after=self._resume_token
+        ) as stream:
+            self.mode = "change_stream"
+            for change in stream:
+                self._resume_token = stream.resume_token
+
+                operation = change["operationType"]
+                if operation == "replace":
+                    operation = "update"
+                elif operation not in ["insert", "update", "delete"]:
+                    continue
+
+                self._dispatch(
+                    {
+                        "operation": operation,
+                        "document_key": change["documentKey"]["_id"],
+                        "document": change.get("fullDocument"),
+                    }
+                )
+
+    def _poll(self, collection) -> None:
+        self.mode = "polling"
+        self._start_polling(collection)
+
+        while True:
+            try:
+                self._poll_changes(collection)
+            except PyMongoError as e:
+                _LOGGER.error(f"[ChangeFeed._poll] Polling error : {e}")
+
+            time.sleep(self.poll_interval)
+
+    def _start_polling(self, collection) -> None:
+        # Start from the current high-water mark, only later changes are events.
+        # Both queries are served by the CHANGE_FEED_INDEX of the model.
+        latest = collection.find_one(
+            {}, projection=["updated_at"], sort=[("updated_at", -1)]
+        )
+        self._high_water = latest.get("updated_at") if latest else None
+        self._polled = {
+            (document["_id"], document.get("updated_at"))
+            for document in self._find_polling_window(
+                collection, projection=["updated_at"]
+            )
+        }
+
+    def _poll_changes(self, collection) -> None:
+        """Dispatch the documents updated since the last poll.
+
+        updated_at is stamped before a write commits, so a write can become
+        visible after a later one was already polled. The window starts
+        clock_skew before the high-water mark, and the (_id, updated_at) pairs
+        that were dispatched in it are skipped.
+        """
+
+        for document in self._find_polling_window(collection):
+            updated_at = document.get("updated_at")
+            if (document["_id"], updated_at) in self._polled:
+                continue
+
+            self._polled.add((document["_id"], updated_at))
+            if updated_at and (not self._high_water or updated_at > self._high_water):
+                self._high_water = updated_at
+
+            self._dispatch(
+                {
+                    "operation": "update",
+                    "document_key": document["_id"],
+                    "document": document,
+                }
+            )
+
+        if self._high_water:
+            window_start = self._high_water - timedelta(seconds=self.clock_skew)
+            self._polled = {
+                key for key in self._polled if key[1] and key[1] >= window_start
+            }
+
+    def _find_polling_window(self, collection, **kwargs):
+        conditions = {}
+        if self._high_water:
+            window_start = self._high_water - timedelta(seconds=self.clock_skew)
+            conditions["updated_at"] = {"$gte": window_start}
+
+        return collection.find(conditions, **kwargs).sort("updated_at", 1)
+
+
+def get_change_feed(model: Type[MongoModel], poll_interval: float = 5) -> ChangeFeed:
+    with _CHANGE_FEEDS_LOCK:
+        if model not in _CHANGE_FEEDS:
+            _CHANGE_FEEDS[model] = ChangeFeed(model, poll_interval)
+
+        return _CHANGE_FEEDS[model]
@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple, Type
+
+import gridfs
+from bson import ObjectId
+
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+
+__all__ = [
+    "is_chunked_storage_enabled",
+    "get_chunk_threshold",
+    "save_data_file",
+    "load_data_file",
+    "delete_orphan_data_files",
+    "start_data_file_cleanup",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+_BUCKET_NAME = "config_data"
+_BUCKETS = {}
+_CLEANUP_THREAD = None
+
+
+def is_chunked_storage_enabled() -> bool:
+    return config.get_global("CHUNKED_STORAGE", {}).get("enabled", False)
+
+
+def get_chunk_threshold() -> int:
+    return config.get_global("CHUNKED_STORAGE", {}).get("threshold", 8388608)
+
+
+def save_data_file(
+    model: Type[MongoModel], content: bytes, compressed: bool
+) -> ObjectId:
+    """Store encoded data in GridFS and return the file id to reference it by"""
+
+    return _get_bucket(model).upload_from_stream(
+        model.__name__, content, metadata={"compressed": compressed}
+    )
+
+
+def load_data_file(model: Type[MongoModel], file_id: ObjectId) -> Tuple[bytes, bool]:
+    """Read a data file back chunk by chunk, returns (content, compressed)"""
+
+    with _get_bucket(model).open_download_stream(file_id) as grid_out:
+        compressed = (grid_out.metadata or {}).get("compressed", False)
+        return grid_out.read(), compressed
+
+
+def delete_orphan_data_files(
+    models: List[Type[MongoModel]], min_age: int = 3600
+) -> int:
+    """Delete data files that no config document references anymore.
+
+    Writes never delete the file they replace, so that rollbacks can restore
+    the previous reference. Files younger than min_age seconds are kept, they
+    may belong to a write that is still in progress.
+    """
+
+    deleted_count = 0
+    upload_date = datetime.utcnow() - timedelta(seconds=min_age)
+
+    for model in models:
+        collection = model._get_collection()
+        bucket = _get_bucket(model)
+
+        grid_outs = bucket.find(
+            {"filename": model.__name__, "uploadDate": {"$lt": upload_date}}
+        )
+        for grid_out in grid_outs:
+            if collection.count_documents({"data_file_id": grid_out._id}, limit=1):
+                continue
+
+            try:
+                bucket.delete(grid_out._id)
+                deleted_count += 1
+            except gridfs.errors.NoFile:
+                pass
+
+    return deleted_count
+
+
+def start_data_file_cleanup(models: List[Type[MongoModel]]) -> None:
+    global _CLEANUP_THREAD
+
+    storage_conf = config.get_global("CHUNKED_STORAGE", {})
+    if not storage_conf.get("enabled", False) or _CLEANUP_THREAD is not None:
+        return
+
+    def _run():
+        while True:
+            time.sleep(storage_conf.get("cleanup_interval", 3600))
+            try:
+                deleted_count = delete_orphan_data_files(models)
+                if deleted_count:
+                    _LOGGER.info(
+                        f"[start_data_file_cleanup] "
+                        f"Deleted {deleted_count} orphan data files"
+                    )
+            except Exception as e:
+                _LOGGER.error(f"[start_data_file_cleanup] Cleanup failed : {e}")
+
+    _CLEANUP_THREAD = threading.Thread(
+        target=_run, name="data-file-cleanup", daemon=True
+    )
+    _CLEANUP_THREAD.start()
+
+
+def _get_bucket(model: Type[MongoModel]) -> gridfs.GridFSBucket:
+    db = model._get_db()
+    key = (id(db.client), db.name)
+
+    if key not in _BUCKETS:
+        _BUCKETS[key] = gridfs.GridFSBucket(db, bucket_name=_BUCKET_NAME)
+
+    return _BUCKETS[key]
@@ -0,0 +1,171 @@
+import logging
+import threading
+import time
+from typing import Type, Union
+
+import bson
+from bson.binary import Binary
+
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+
+from spaceone.config.lib.chunked_storage import (
+    get_chunk_threshold,
+    is_chunked_storage_enabled,
+    load_data_file,
+    save_data_file,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+__all__ = [
+    "pack_data",
+    "unpack_document",
+    "get_vo_data",
+    "is_compression_enabled",
+    "get_compression_stats",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+_STATS_LOCK = threading.Lock()
+_STATS = {
+    "compress_count": 0,
+    "raw_bytes": 0,
+    "compressed_bytes": 0,
+    "compress_seconds": 0.0,
+    "decompress_count": 0,
+    "decompress_seconds": 0.0,
+}
+
+
+def is_compression_enabled() -> bool:
+    compression_conf = config.get_global("DATA_COMPRESSION", {})
+    if not compression_conf.get("enabled", False):
+        return False
+
+    if zstandard is None:
+        _LOGGER.warning(
+            "[is_compression_enabled] DATA_COMPRESSION is enabled, "
+            "but zstandard is not installed"
+        )
+        return False
+
+    return True
+
+
+def pack_data(data: Union[dict, None], model: Type[MongoModel]) -> dict:
+    """Return the stored form of data for model.
+
+    The result has the keys data, compressed_data and data_file_id, and only
+    one of them is set:
+        - data whose BSON encoding exceeds DATA_COMPRESSION.threshold is
+          compressed with zstd into compressed_data
+        - the encoded (and possibly compressed) data is moved to GridFS when it
+          still exceeds CHUNKED_STORAGE.threshold, data_file_id references it
+        - anything else stays in data as is
+    """
+
+    packed_data = {"data": data, "compressed_data": None, "data_file_id": None}
+
+    compression_enabled = is_compression_enabled()
+    chunked_storage_enabled = is_chunked_storage_enabled()
+    if data is None or not (compression_enabled or chunked_storage_enabled):
+        return packed_data
+
+    content = bson.encode(data)
+    compressed = False
+
+    compression_conf = config.get_global("DATA_COMPRESSION", {})
+    if compression_enabled and len(content) > compression_conf.get("threshold", 16384):
+        content = _compress(content, compression_conf.get("level", 3))
+        compressed = True
+
+    if chunked_storage_enabled and len(content) > get_chunk_threshold():
+        packed_data["data"] = None
+        packed_data["data_file_id"] = save_data_file(model, content, compressed)
+    elif compressed:
+        packed_data["data"] = None
+        packed_data["compressed_data"] = Binary(content)
+
+    return packed_data
+
+
+def unpack_document(document: dict, model: Type[MongoModel]) -> dict:
+    """Restore data of a raw document or to_dict() result in place.
+
+    Documents read without data in the projection have neither compressed_data
+    nor data_file_id, so decompression and GridFS reads only happen when data
+    is actually returned.
+    """
+
+    compressed_data = document.pop("compressed_data", None)
+    data_file_id = document.pop("data_file_id", None)
+
+    if data_file_id is not None:
+        content, compressed = load_data_file(model, data_file_id)
+        document["data"] = _decode(content, compressed)
+    elif compressed_data is not None:
+        document["data"] = _decode(compressed_data, True)
+
+    return document
+
+
+def get_vo_data(vo: MongoModel) -> Union[dict, None]:
+    data_file_id = getattr(vo, "data_file_id", None)
+    compressed_data = getattr(vo, "compressed_data", None)
+
+    if data_file_id is not None:
+        content, compressed = load_data_file(type(vo), data_file_id)
+        return _decode(content, compressed)
+    elif compressed_data is not None:
+        return _decode(compressed_data, True)
+
+    return vo.data
+
+
+def get_compression_stats() -> dict:
+    with _STATS_LOCK:
+        stats = dict(_STATS)
+
+    stats["ratio"] = (
+        stats["raw_bytes"] / stats["compressed_bytes"]
+        if stats["compressed_bytes"]
+        else None
+    )
+    return stats
+
+
+def _compress(content: bytes, level: int) -> bytes:
+    start = time.perf_counter()
+    compressed = zstandard.ZstdCompressor(level=level).compress(content)
+    elapsed = time.perf_counter() - start
+
+    with _STATS_LOCK:
+        _STATS["compress_count"] += 1
+        _STATS["raw_bytes"] += len(content)
+        _STATS["compressed_bytes"] += len(compressed)
+        _STATS["compress_seconds"] += elapsed
+
+    return compressed
+
+
+def _decode(content: bytes, compressed: bool) -> dict:
+    if not compressed:
+        return bson.decode(content)
+
+    if zstandard is None:
+        raise RuntimeError("zstandard is required to read compressed config data")
+
+    start = time.perf_counter()
+    data = bson.decode(zstandard.ZstdDecompressor().decompress(content))
+    elapsed = time.perf_counter() - start
+
+    with _STATS_LOCK:
+        _STATS["decompress_count"] += 1
+        _STATS["decompress_seconds"] += elapsed
+
+    return data
@@ -0,0 +1,33 @@
+import threading
+from typing import Type, Union
+
+from spaceone.core.connector import BaseConnector
+from spaceone.core.locator import Locator
+
+__all__ = ["get_connector"]
+
+_CONNECTORS = {}
+_CONNECTORS_LOCK = threading.Lock()
+
+
+def get_connector(
+    name_or_object: Union[str, Type[BaseConnector]], **kwargs
+) -> BaseConnector:
+    """Locator.get_connector() that builds each connector once per process.
+
+    Connectors keep no request state (SpaceConnector reads the token of the
+    current transaction on every call), so one instance per name and kwargs
+    is shared by all requests instead of being built and verified per call.
+    """
+
+    key = (name_or_object, tuple(sorted(kwargs.items())))
+
+    connector = _CONNECTORS.get(key)
+    if connector is None:
+        with _CONNECTORS_LOCK:
+            connector = _CONNECTORS.get(key)
+            if connector is None:
+                connector = Locator.get_connector(name_or_object, **kwargs)
+                _CONNECTORS[key] = connector
+
+    return connector
@@ -0,0 +1,38 @@
+import hashlib
+import json
+
+from spaceone.core.model.mongo_model import MongoModel
+
+__all__ = ["make_data_hash", "is_changed"]
+
+# Covered by data_hash, or always different
+_SKIP_FIELDS = ["data", "compressed_data", "updated_at"]
+
+
+def make_data_hash(data) -> str:
+    """SHA-256 of data that does not depend on key order"""
+
+    content = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def is_changed(params: dict, vo: MongoModel) -> bool:
+    """Whether applying params to vo would change any updatable field.
+
+    data is compared by data_hash. Documents written before data_hash existed
+    have it computed from the loaded data.
+    """
+
+    updatable_fields = vo._meta.get("updatable_fields", [])
+
+    for key, value in params.items():
+        if key not in updatable_fields or key in _SKIP_FIELDS:
+            continue
+
+        if key == "data_hash":
+            if value != (vo.data_hash or make_data_hash(vo.data)):
+                return True
+        elif value != getattr(vo, key):
+            return True
+
+    return False
@@ -0,0 +1,135 @@
+import base64
+import hashlib
+from typing import List, Tuple, Type, Union
+
+from bson import json_util
+from mongoengine import Q
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.core.model.mongo_model import MongoModel
+
+from spaceone.config.lib.query import to_documents
+
+__all__ = ["DEFAULT_PAGE_SIZE", "MAX_PAGE_SIZE", "list_by_cursor"]
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def get_filter_hash(query: dict) -> str:
+    """Hash the filter of a query, a page token is only valid for the same one."""
+
+    _filter = {
+        "filter": query.get("filter", []),
+        "filter_or": query.get("filter_or", []),
+    }
+    return hashlib.sha256(
+        json_util.dumps(_filter, sort_keys=True).encode()
+    ).hexdigest()[:16]
+
+
+def encode_page_token(values: dict, filter_hash: str) -> str:
+    token = {"values": values, "filter_hash": filter_hash}
+    return base64.urlsafe_b64encode(json_util.dumps(token).encode()).decode()
+
+
+def decode_page_token(page_token: str, keys: List[str], filter_hash: str) -> dict:
+    try:
+        token = json_util.loads(base64.urlsafe_b64decode(page_token.encode()))
+        values = token["values"]
+        token_filter_hash = token["filter_hash"]
+    except Exception:
+        raise ERROR_INVALID_PARAMETER(
+            key="page_token", reason="Malformed page token."
+        )
+
+    if not isinstance(values, dict) or set(values.keys()) != set(keys):
+        raise ERROR_INVALID_PARAMETER(
+            key="page_token", reason="Malformed page token."
+        )
+
+    if token_filter_hash != filter_hash:
+        raise ERROR_INVALID_PARAMETER(
+            key="page_token", reason="Page token was issued for another filter."
+        )
+
+    return values
+
+
+def list_by_cursor(
+    model: Type[MongoModel],
+    query: dict,
+    keys: List[str],
+    page_size: int = None,
+    page_token: str = None,
+    as_pymongo: bool = False,
+) -> Tuple[list, Union[str, None]]:
+    """Keyset pagination over a unique, ascending ordering.
+
+    keys must identify a document uniquely within the filtered result and
+    should follow a compound index, so each page is one bounded range scan no
+    matter how deep it is. The page token is an opaque encoding of the keys of
+    the last document returned along with a hash of the filter, and a token is
+    rejected for any other filter. None is returned once the end is reached.
+    Sort and page in the query are ignored, and no total count is computed.
+    With as_pymongo, raw documents are returned instead of VOs.
+    """
+
+    page_size = min(page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+    filter_hash = get_filter_hash(query)
+    _filter = model._make_filter(
+        query.get("filter", []),
+        query.get("filter_or", []),
+        query.get("reference_filter"),
+    )
+    if page_token:
+        last_values = decode_page_token(page_token, keys, filter_hash)
+        _filter = _and(_filter, _make_keyset_filter(last_values, keys))
+
+    vos = model.objects.filter(_filter) if _filter else model.objects.all()
+
+    # The keys are always loaded, the next page token is built from them.
+    if query.get("minimal"):
+        vos = vos.only(*set(model._meta.get("minimal_fields", []) + keys))
+    elif query.get("only"):
+        vos = vos.only(*set(query["only"] + keys))
+    elif query.get("exclude"):
+        vos = vos.exclude(*set(query["exclude"]) - set(keys))
+
+    vos = vos.order_by(*keys).limit(page_size + 1)
+    vos = to_documents(vos) if as_pymongo else list(vos)
+
+    next_page_token = None
+    if len(vos) > page_size:
+        vos = vos[:page_size]
+        next_page_token = encode_page_token(
+            {
+                key: vos[-1].get(key) if as_pymongo else getattr(vos[-1], key)
+                for key in keys
+            },
+            filter_hash,
+        )
+
+    return vos, next_page_token
+
+
+def _make_keyset_filter(last_values: dict, keys: List[str]) -> Q:
+    # (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...
+    keyset_filter = None
+    for index, key in enumerate(keys):
+        condition = Q(**{f"{key}__gt": last_values[key]})
+        for previous_key in keys[:index]:
+            condition &= Q(**{previous_key: last_values[previous_key]})
+
+        keyset_filter = _or(keyset_filter, condition)
+
+    return keyset_filter
+
+
+def _and(left: Union[Q, None], right: Q) -> Q:
+    return right if left is None else left & right
+
+
+def _or(left: Union[Q, None], right: Q) -> Q:
+    return right if left is None else left | right
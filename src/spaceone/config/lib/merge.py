@@ -0,0 +1,84 @@
+from typing import Tuple
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+
+__all__ = ["deep_merge", "apply_merge_patch", "make_merge_patch_update"]
+
+
+def deep_merge(base: dict, override: dict) -> dict:
+    """Return a new dict with override merged into base recursively.
+
+    Nested dicts are merged key by key, any other value in override replaces
+    the one in base. Neither argument is modified.
+    """
+
+    merged = dict(base or {})
+
+    for key, value in (override or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+
+    return merged
+
+
+def apply_merge_patch(target, patch):
+    """Return the result of applying an RFC 7386 JSON merge patch to target.
+
+    None in the patch removes the key. Only the dicts along patched paths are
+    copied, untouched subtrees are shared with target.
+    """
+
+    if not isinstance(patch, dict):
+        return patch
+
+    result = dict(target) if isinstance(target, dict) else {}
+
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+
+    return result
+
+
+def make_merge_patch_update(target, patch: dict, field: str) -> Tuple[dict, list]:
+    """Translate a merge patch on target into $set / $unset on field.<path>.
+
+    target is the current value of the field, so that nested dicts are patched
+    key by key and only the changed paths are written.
+    """
+
+    set_fields = {}
+    unset_fields = []
+
+    if not isinstance(target, dict):
+        set_fields[field] = apply_merge_patch(None, patch)
+        return set_fields, unset_fields
+
+    for key, value in patch.items():
+        _check_patch_key(key)
+        path = f"{field}.{key}"
+
+        if value is None:
+            if key in target:
+                unset_fields.append(path)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            nested_set_fields, nested_unset_fields = make_merge_patch_update(
+                target[key], value, path
+            )
+            set_fields.update(nested_set_fields)
+            unset_fields += nested_unset_fields
+        else:
+            set_fields[path] = apply_merge_patch(None, value)
+
+    return set_fields, unset_fields
+
+
+def _check_patch_key(key: str) -> None:
+    if not key or "." in key or key.startswith("$"):
+        raise ERROR_INVALID_PARAMETER(
+            key="data", reason=f"Invalid key in merge patch: {key!r}"
+        )
@@ -0,0 +1,189 @@
+import argparse
+import logging
+import threading
+
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+
+from spaceone.config.lib import chunked_storage
+from spaceone.config.lib.compression import (
+    get_compression_stats,
+    is_compression_enabled,
+    pack_data,
+    unpack_document,
+)
+from spaceone.config.lib.content_hash import make_data_hash
+from spaceone.config.model import (
+    ConfigTombstone,
+    DomainConfig,
+    PublicConfig,
+    SharedConfig,
+    UserConfig,
+)
+
+__all__ = [
+    "migrate_indexes",
+    "start_index_migration",
+    "migrate_data_compression",
+    "start_data_file_cleanup",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+# Models whose data may be stored compressed or in GridFS
+_LARGE_DATA_MODELS = [UserConfig, DomainConfig]
+
+# Single-field and unique_with indexes created by previous releases.
+# They are fully covered by the compound indexes declared in each model.
+_LEGACY_INDEXES = {
+    UserConfig: [
+        "name_1",
+        "domain_id_1",
+        "user_id_1",
+        "name_1_user_id_1_domain_id_1",
+    ],
+    DomainConfig: ["name_1", "domain_id_1", "name_1_domain_id_1"],
+    PublicConfig: ["name_1", "domain_id_1", "name_1_domain_id_1"],
+    SharedConfig: [
+        "name_1",
+        "domain_id_1",
+        "workspace_id_1",
+        "project_id_1",
+        "name_1_domain_id_1_workspace_id_1_project_id_1",
+    ],
+    ConfigTombstone: [],
+}
+
+
+def migrate_indexes() -> None:
+    """Build the declared compound indexes and drop the legacy ones.
+
+    New indexes are built in the background first, so lookups never run
+    without a usable index while the legacy ones are being dropped.
+    """
+
+    for model, legacy_indexes in _LEGACY_INDEXES.items():
+        collection = model._get_collection()
+
+        model.ensure_indexes()
+
+        existing_indexes = collection.index_information()
+        for index_name in legacy_indexes:
+            if index_name in existing_indexes:
+                _LOGGER.info(
+                    f"[migrate_indexes] Drop legacy index : "
+                    f"{collection.name}.{index_name}"
+                )
+                collection.drop_index(index_name)
+
+
+def start_index_migration() -> None:
+    if not config.get_global("DATABASE_AUTO_CREATE_INDEX", False):
+        return
+
+    def _run():
+        try:
+            migrate_indexes()
+        except Exception as e:
+            _LOGGER.error(f"[start_index_migration] Index migration failed : {e}")
+
+    threading.Thread(target=_run, name="index-migration", daemon=True).start()
+
+
+def migrate_data_compression(decompress: bool = False, batch_size: int = 100) -> dict:
+    """Compress stored data above DATA_COMPRESSION.threshold, or restore it.
+
+    Run after enabling DATA_COMPRESSION, or with decompress before disabling it.
+    A document is only rewritten if it was not updated since it was read, so
+    the migration is safe to run against a live service and to run again.
+    """
+
+    if not decompress and not is_compression_enabled():
+        _LOGGER.warning(
+            "[migrate_data_compression] DATA_COMPRESSION is disabled, nothing to do"
+        )
+        return {"migrated_count": 0}
+
+    migrated_count = 0
+    for model in _LARGE_DATA_MODELS:
+        collection = model._get_collection()
+
+        if decompress:
+            conditions = {"compressed_data": {"$ne": None}}
+        else:
+            conditions = {"data": {"$ne": None}, "compressed_data": None}
+
+        documents = collection.find(
+            conditions,
+            projection=["data", "compressed_data", "data_file_id", "updated_at"],
+            batch_size=batch_size,
+        )
+        for document in documents:
+            data = unpack_document(document, model).get("data")
+
+            if decompress:
+                packed_data = {"data": data, "compressed_data": None}
+            else:
+                packed_data = pack_data(data, model)
+                if packed_data["data"] is not None:
+                    continue
+
+            result = collection.update_one(
+                {"_id": document["_id"], "updated_at": document.get("updated_at")},
+                {"$set": {**packed_data, "data_hash": make_data_hash(data)}},
+            )
+            migrated_count += result.modified_count
+
+        _LOGGER.info(
+            f"[migrate_data_compression] {collection.name} : "
+            f"{migrated_count} documents migrated so far"
+        )
+
+    compression_stats = get_compression_stats()
+    _LOGGER.info(f"[migrate_data_compression] Compression stats : {compression_stats}")
+
+    return {"migrated_count": migrated_count, **compression_stats}
+
+
+def start_data_file_cleanup() -> None:
+    chunked_storage.start_data_file_cleanup(_LARGE_DATA_MODELS)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m spaceone.config.lib.migration",
+        description="Run config service data migrations.",
+    )
+    parser.add_argument(
+        "command",
+        choices=[
+            "migrate-indexes",
+            "compress-data",
+            "decompress-data",
+            "cleanup-data-files",
+        ],
+    )
+    parser.add_argument("-c", "--config", help="config file path (yaml)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config.init_conf(package="spaceone.config")
+    if args.config:
+        config.set_file_conf(args.config)
+
+    # The server connects the databases on start, this command has to do it itself.
+    # migrate-indexes builds the indexes, the other commands do not need them.
+    MongoModel.init(create_index=False)
+
+    if args.command == "migrate-indexes":
+        migrate_indexes()
+    elif args.command == "cleanup-data-files":
+        deleted_count = chunked_storage.delete_orphan_data_files(_LARGE_DATA_MODELS)
+        print({"deleted_count": deleted_count})
+    else:
+        result = migrate_data_compression(decompress=args.command == "decompress-data")
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
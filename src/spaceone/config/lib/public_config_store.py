@@ -0,0 +1,272 @@
+import logging
+import threading
+import time
+from typing import List, Tuple, Union
+
+from spaceone.core import config
+
+from spaceone.config.lib.change_feed import get_change_feed
+from spaceone.config.model.public_config.database import PublicConfig
+
+__all__ = [
+    "PublicConfigStore",
+    "get_public_config_store",
+    "start_public_config_store",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORE = None
+_SUPPORTED_QUERY_KEYS = {"filter", "filter_or", "sort", "page", "minimal", "only"}
+
+
+class PublicConfigStore:
+    """Full in-process replica of the public_config collection.
+
+    Public configs are tiny and read by unauthenticated pages, so every replica
+    keeps a copy per domain and serves get/list from memory. The copy is loaded
+    once and then kept current by the PublicConfig change feed.
+    """
+
+    def __init__(self, poll_interval: float = 5):
+        self.poll_interval = poll_interval
+        self._configs = {}  # {domain_id: {name: public_config_info}}
+        self._keys = {}  # {_id: (domain_id, name)}
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        # Subscribe before loading so that no change is lost in between.
+        change_feed = get_change_feed(PublicConfig, self.poll_interval)
+        change_feed.subscribe(self._on_change)
+
+        # Reads fall back to Mongo until the first load succeeds.
+        while True:
+            try:
+                for document in PublicConfig._get_collection().find({}):
+                    self._put(document)
+                break
+            except Exception as e:
+                _LOGGER.error(f"[PublicConfigStore.start] Failed to load : {e}")
+                time.sleep(self.poll_interval)
+
+        self._ready.set()
+
+        threading.Thread(
+            target=self._reconcile_deletes,
+            args=(change_feed,),
+            name="public-config-store",
+            daemon=True,
+        ).start()
+
+    def get(self, domain_id: str, name: str) -> Union[dict, None]:
+        return self._configs.get(domain_id, {}).get(name)
+
+    def list(self, query: dict) -> Union[Tuple[List[dict], int], None]:
+        """Answer a list query from memory.
+
+        Returns None when the query uses anything beyond simple filters, sort
+        and page, so the caller can fall back to Mongo.
+        """
+
+        if not set(query.keys()).issubset(_SUPPORTED_QUERY_KEYS):
+            return None
+
+        conditions = [
+            _parse_condition(condition) for condition in query.get("filter", [])
+        ]
+        or_conditions = [
+            _parse_condition(condition) for condition in query.get("filter_or", [])
+        ]
+
+        if None in conditions or None in or_conditions:
+            return None
+
+        domain_ids = [
+            value for key, value, op in conditions if key == "domain_id" and op == "eq"
+        ]
+        if len(domain_ids) != 1:
+            return None
+
+        results = []
+        for public_config_info in self._configs.get(domain_ids[0], {}).values():
+            if not all(_match(public_config_info, *c) for c in conditions):
+                continue
+
+            if or_conditions and not any(
+                _match(public_config_info, *c) for c in or_conditions
+            ):
+                continue
+
+            results.append(public_config_info)
+
+        results = _sort(results, query.get("sort") or [{"key": "name"}])
+        if results is None:
+            return None
+
+        total_count = len(results)
+
+        page = query.get("page") or {}
+        limit = page.get("limit")
+        if limit:
+            start = page.get("start", 1) - 1
+            results = results[start : start + limit]
+
+        fields = query.get("only") or (
+            PublicConfig._meta.get("minimal_fields") if query.get("minimal") else None
+        )
+        if fields:
+            results = [{key: info.get(key) for key in fields} for info in results]
+
+        return results, total_count
+
+    def _on_change(self, event: dict) -> None:
+        if event["operation"] == "delete":
+            self._remove(event["document_key"])
+        elif event["document"]:
+            self._put(event["document"])
+
+    def _put(self, document: dict) -> None:
+        public_config_info = dict(document)
+        _id = public_config_info.pop("_id")
+        domain_id = public_config_info["domain_id"]
+        name = public_config_info["name"]
+
+        with self._lock:
+            old_key = self._keys.get(_id)
+            if old_key:
+                current = self._configs.get(old_key[0], {}).get(old_key[1])
+                if _is_stale(public_config_info, current):
+                    return
+
+                self._delete_entry(*old_key)
+
+            # Copy-on-write so readers never iterate a dict being modified.
+            domain_configs = dict(self._configs.get(domain_id, {}))
+            domain_configs[name] = public_config_info
+            self._configs[domain_id] = domain_configs
+            self._keys[_id] = (domain_id, name)
+
+    def _remove(self, _id) -> None:
+        with self._lock:
+            key = self._keys.pop(_id, None)
+            if key:
+                self._delete_entry(*key)
+
+    def _delete_entry(self, domain_id: str, name: str) -> None:
+        domain_configs = dict(self._configs.get(domain_id, {}))
+        domain_configs.pop(name, None)
+        self._configs[domain_id] = domain_configs
+
+    def _reconcile_deletes(self, change_feed) -> None:
+        # Polling on updated_at cannot observe deletes, compare ids instead.
+        collection = PublicConfig._get_collection()
+
+        while True:
+            time.sleep(self.poll_interval)
+
+            if change_feed.mode != "polling":
+                continue
+
+            try:
+                with self._lock:
+                    known_ids = set(self._keys.keys())
+
+                existing_ids = {
+                    document["_id"]
+                    for document in collection.find({}, projection=["_id"])
+                }
+                deleted_ids = known_ids - existing_ids
+
+                for _id in deleted_ids:
+                    self._remove(_id)
+            except Exception as e:
+                _LOGGER.error(f"[PublicConfigStore._reconcile_deletes] {e}")
+
+
+def _is_stale(public_config_info: dict, current: Union[dict, None]) -> bool:
+    if not current or not current.get("updated_at"):
+        return False
+
+    updated_at = public_config_info.get("updated_at")
+    return updated_at is not None and updated_at < current["updated_at"]
+
+
+def _parse_condition(condition: dict) -> Union[tuple, None]:
+    key = condition.get("k", condition.get("key"))
+    value = condition.get("v", condition.get("value"))
+    op = condition.get("o", condition.get("operator", "eq"))
+
+    if op not in ["eq", "in", "contain", "not"] or key is None:
+        return None
+
+    return key, value, op
+
+
+def _match(public_config_info: dict, key: str, value, op: str) -> bool:
+    field_value = public_config_info.get(key)
+
+    if op == "eq":
+        return field_value == value
+    elif op == "not":
+        return field_value != value
+    elif op == "in":
+        return field_value in (value if isinstance(value, list) else [value])
+    else:
+        return (
+            isinstance(field_value, str)
+            and str(value).lower() in field_value.lower()
+        )
+
+
+def _sort(results: List[dict], sort: Union[list, dict]) -> Union[List[dict], None]:
+    if isinstance(sort, dict):
+        sort = [sort]
+
+    for sort_option in reversed(sort):
+        key = sort_option.get("key")
+        if key not in ["name", "created_at", "updated_at"]:
+            return None
+
+        results = sorted(
+            results,
+            key=lambda info: (info.get(key) is not None, info.get(key)),
+            reverse=sort_option.get("desc", False),
+        )
+
+    return results
+
+
+def get_public_config_store() -> Union[PublicConfigStore, None]:
+    """Return the store once it is fully loaded, otherwise None"""
+
+    if _STORE and _STORE.is_ready:
+        return _STORE
+
+    return None
+
+
+def start_public_config_store() -> None:
+    global _STORE
+
+    store_conf = config.get_global("PUBLIC_CONFIG_STORE", {})
+    if not store_conf.get("enabled", False) or _STORE is not None:
+        return
+
+    _STORE = PublicConfigStore(poll_interval=store_conf.get("poll_interval", 5))
+
+    def _run():
+        try:
+            _STORE.start()
+        except Exception as e:
+            _LOGGER.error(
+                f"[start_public_config_store] Failed to load public configs : {e}"
+            )
+
+    threading.Thread(
+        target=_run, name="public-config-store-loader", daemon=True
+    ).start()
@@ -0,0 +1,198 @@
+from typing import Iterator, List, Type, Union
+from mongoengine import QuerySet
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER, ERROR_NOT_FOUND
+from spaceone.core.model.mongo_model import MongoModel
+
+from spaceone.config.lib.compression import unpack_document
+
+__all__ = [
+    "get_document",
+    "query_without_count",
+    "iterate_by_batch",
+    "to_documents",
+    "get_scope_conditions",
+    "set_projection",
+]
+
+_SCOPE_QUERY_KEYS = {"filter", "sort", "page", "only", "minimal", "exclude"}
+_QUERYSET_QUERY_KEYS = _SCOPE_QUERY_KEYS | {"filter_or", "reference_filter"}
+
+
+def get_document(model: Type[MongoModel], **conditions) -> dict:
+    """Same as MongoModel.get, but returns the raw document without hydrating a VO"""
+
+    document = model.filter(**conditions).as_pymongo().first()
+    if document is None:
+        raise ERROR_NOT_FOUND(key="name", value=conditions.get("name"))
+
+    return unpack_document(document, model)
+
+
+def query_without_count(
+    model: Type[MongoModel], query: dict, as_pymongo: bool = False
+) -> list:
+    """Same result page as MongoModel.query, without the count_documents call"""
+
+    vos = _make_queryset(model, query)
+    return to_documents(vos) if as_pymongo else list(vos)
+
+
+def iterate_by_batch(
+    model: Type[MongoModel],
+    query: dict,
+    batch_size: int = 100,
+    as_pymongo: bool = False,
+) -> Iterator[list]:
+    """Yield the result of a list query in lists of at most batch_size VOs.
+
+    The cursor is read batch_size documents per round trip and nothing is kept
+    after a batch is yielded, so memory does not grow with the result size.
+    """
+
+    vos = _make_queryset(model, query)
+    if not isinstance(vos, QuerySet):
+        as_pymongo = False
+    else:
+        vos = vos.no_cache().batch_size(batch_size)
+        if as_pymongo:
+            vos = vos.as_pymongo()
+
+    batch = []
+    for vo in vos:
+        batch.append(unpack_document(vo, model) if as_pymongo else vo)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def to_documents(vos: Union[QuerySet, list]) -> List[dict]:
+    """Read a queryset as raw documents, restoring compressed or chunked data.
+
+    MongoModel.query returns a plain list for count_only and aggregations,
+    which has nothing to convert and is returned as it is.
+    """
+
+    if not isinstance(vos, QuerySet):
+        return list(vos)
+
+    model = vos._document
+    return [unpack_document(document, model) for document in vos.as_pymongo()]
+
+
+def _make_queryset(model: Type[MongoModel], query: dict) -> Union[QuerySet, list]:
+    sort = _get_sort_options(query.get("sort"))
+
+    # Anything else (target, exclude, count_only, lookup, ...) is left to
+    # MongoModel.query, only the count is skipped.
+    if any(value for key, value in query.items() if key not in _QUERYSET_QUERY_KEYS):
+        vos, _ = model.query(**{**query, "sort": sort}, include_count=False)
+        return vos
+
+    _filter = model._make_filter(
+        query.get("filter", []),
+        query.get("filter_or", []),
+        query.get("reference_filter"),
+    )
+    vos = model.objects.filter(_filter) if _filter else model.objects.all()
+
+    if sort:
+        # id breaks ties the same way as MongoModel.query
+        vos = vos.order_by(
+            *[
+                f"-{option['key']}" if option.get("desc") else option["key"]
+                for option in sort
+            ],
+            "id",
+        )
+
+    if query.get("minimal"):
+        vos = vos.only(*model._meta.get("minimal_fields", []))
+    elif query.get("only"):
+        vos = vos.only(*query["only"])
+    elif query.get("exclude"):
+        vos = vos.exclude(*query["exclude"])
+
+    page = query.get("page") or {}
+    if page.get("limit"):
+        start = max(page.get("start", 1), 1) - 1
+        vos = vos.skip(start).limit(page["limit"])
+
+    return vos
+
+
+def _get_sort_options(sort: Union[dict, list, None]) -> list:
+    # sort is either a list of {key, desc}, a single one or {'keys': [...]}
+    if not sort:
+        return []
+
+    if isinstance(sort, dict):
+        return list(sort["keys"]) if "keys" in sort else [sort]
+
+    return list(sort)
+
+
+def get_scope_conditions(query: dict, scope_keys: List[str]) -> Union[dict, None]:
+    """Return the scope of an unfiltered list query, otherwise None.
+
+    A query is unfiltered when its only conditions are equality on exactly the
+    scope keys, e.g. all user configs of (domain_id, user_id).
+    """
+
+    if not set(query.keys()).issubset(_SCOPE_QUERY_KEYS):
+        return None
+
+    scope_conditions = {}
+    for condition in query.get("filter", []):
+        key = condition.get("k", condition.get("key"))
+        value = condition.get("v", condition.get("value"))
+        operator = condition.get("o", condition.get("operator", "eq"))
+
+        if key not in scope_keys or operator != "eq" or key in scope_conditions:
+            return None
+
+        scope_conditions[key] = value
+
+    if set(scope_conditions.keys()) != set(scope_keys):
+        return None
+
+    return scope_conditions
+
+
+def set_projection(
+    model: Type[MongoModel],
+    query: dict,
+    minimal: bool = False,
+    only: Union[List[str], None] = None,
+) -> dict:
+    """Push minimal / only down into the query so Mongo returns fewer fields.
+
+    Data stored in GridFS is only read when data is explicitly in only, other
+    list results leave it out instead of reading every file of the page.
+    """
+
+    only = only or query.get("only")
+    if only:
+        unknown_fields = set(only) - set(model._fields.keys())
+        if unknown_fields:
+            unknown_fields = ", ".join(sorted(unknown_fields))
+            raise ERROR_INVALID_PARAMETER(
+                key="only", reason=f"Unknown fields: {unknown_fields}"
+            )
+
+        query["only"] = list(only)
+
+        # Large data is stored in compressed_data or data_file_id instead of data
+        if "data" in only:
+            for field in ["compressed_data", "data_file_id"]:
+                if field in model._fields:
+                    query["only"].append(field)
+    elif minimal:
+        query["minimal"] = True
+    elif "data_file_id" in model._fields:
+        query["exclude"] = ["data_file_id"]
+
+    return query
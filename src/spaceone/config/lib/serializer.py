@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Type
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import Message
+
+from spaceone.core import utils
+
+__all__ = ["to_message"]
+
+_STRUCT_TYPES = ["google.protobuf.Struct", "google.protobuf.ListValue"]
+
+
+def to_message(message_cls: Type[Message], info: dict) -> Message:
+    """Fill a protobuf message straight from a raw document dict.
+
+    This replaces the response model -> dict() -> BaseAPI.dict_to_message
+    chain for large responses. Keys without a matching field (e.g. _id) and
+    None values are skipped, datetimes become ISO 8601 strings, and dicts are
+    copied into Struct fields in place instead of being converted to JSON first.
+    """
+
+    message = message_cls()
+    _fill_message(message, info)
+    return message
+
+
+def _fill_message(message: Message, info: dict) -> None:
+    fields = message.DESCRIPTOR.fields_by_name
+
+    for key, value in info.items():
+        field = fields.get(key)
+        if field is None or value is None:
+            continue
+
+        if field.message_type is None:
+            if field.label == FieldDescriptor.LABEL_REPEATED:
+                getattr(message, key).extend(
+                    [_to_scalar(field, item) for item in value]
+                )
+            else:
+                setattr(message, key, _to_scalar(field, value))
+        elif field.message_type.GetOptions().map_entry:
+            getattr(message, key).update(value)
+        elif field.label == FieldDescriptor.LABEL_REPEATED:
+            container = getattr(message, key)
+            for item in value:
+                _fill_message(container.add(), item)
+        elif field.message_type.full_name in _STRUCT_TYPES:
+            if isinstance(value, dict):
+                getattr(message, key).update(value)
+            else:
+                getattr(message, key).extend(value)
+        else:
+            _fill_message(getattr(message, key), value)
+
+
+def _to_scalar(field: FieldDescriptor, value):
+    if isinstance(value, datetime):
+        return utils.datetime_to_iso8601(value)
+
+    if field.enum_type is not None and isinstance(value, str):
+        return field.enum_type.values_by_name[value].number
+
+    return value
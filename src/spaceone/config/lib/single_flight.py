@@ -0,0 +1,48 @@
+import threading
+from typing import Any, Callable
+
+__all__ = ["single_flight"]
+
+_CALLS = {}
+_CALLS_LOCK = threading.Lock()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def single_flight(key: str, func: Callable[[], Any]) -> Any:
+    """Run func once per key at a time within this process.
+
+    Callers that arrive while a call for the same key is in flight wait for it
+    and share its result, or its exception, instead of calling func again.
+    """
+
+    with _CALLS_LOCK:
+        call = _CALLS.get(key)
+        is_leader = call is None
+        if is_leader:
+            call = _Call()
+            _CALLS[key] = call
+
+    if not is_leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+
+        return call.result
+
+    try:
+        call.result = func()
+        return call.result
+    except Exception as e:
+        call.error = e
+        raise
+    finally:
+        with _CALLS_LOCK:
+            _CALLS.pop(key, None)
+
+        call.done.set()
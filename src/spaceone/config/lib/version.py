@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Type, Union
+
+from spaceone.core.error import ERROR_NOT_FOUND
+from spaceone.core.model.mongo_model import MongoModel
+
+from spaceone.config.error.config import ERROR_VERSION_CONFLICT
+
+__all__ = [
+    "update_with_version",
+    "raw_update_with_version",
+    "get_version",
+    "check_version",
+]
+
+
+def update_with_version(
+    vo: MongoModel, params: dict, expected_version: int = None
+) -> MongoModel:
+    """MongoModel.update() that also increments version, in one round trip.
+
+    With expected_version the update is conditional on it, and a document that
+    has moved on raises ERROR_VERSION_CONFLICT. Rollbacks use it too, so version
+    never goes back even when the previous data is restored.
+    """
+
+    updatable_fields = vo._meta.get("updatable_fields", [])
+    update = {
+        f"set__{key}": value
+        for key, value in params.items()
+        if key in updatable_fields and key != "version"
+    }
+    update["set__updated_at"] = datetime.utcnow()
+    update["inc__version"] = 1
+
+    conditions = {"id": vo.id}
+    if expected_version is not None:
+        conditions["version"] = expected_version
+
+    updated_vo = type(vo).objects(**conditions).modify(new=True, **update)
+    if updated_vo is None:
+        # Only a failed write reads again, to tell a conflict from a delete.
+        current_vo = type(vo).objects(id=vo.id).first()
+        if current_vo is None:
+            raise ERROR_NOT_FOUND(key="name", value=vo.name)
+
+        raise ERROR_VERSION_CONFLICT(
+            name=vo.name,
+            expected_version=expected_version,
+            version=current_vo.version,
+        )
+
+    return updated_vo
+
+
+def raw_update_with_version(vo: MongoModel, update: dict) -> int:
+    """Apply a raw update document to vo, increment version and return it.
+
+    The update is built from the loaded vo, so it only applies while the
+    document is still at that version. Otherwise ERROR_VERSION_CONFLICT is
+    raised, and the caller reads the document again.
+    """
+
+    update = {**update, "$inc": {"version": 1}}
+    collection = type(vo)._get_collection()
+    result = collection.update_one({"_id": vo.id, "version": vo.version}, update)
+    if result.matched_count == 0:
+        current_document = collection.find_one(
+            {"_id": vo.id}, projection={"_id": 0, "version": 1}
+        )
+        if current_document is None:
+            raise ERROR_NOT_FOUND(key="name", value=vo.name)
+
+        raise ERROR_VERSION_CONFLICT(
+            name=vo.name,
+            expected_version=vo.version,
+            version=current_document.get("version"),
+        )
+
+    return (vo.version or 0) + 1
+
+
+def get_version(model: Type[MongoModel], **conditions) -> Union[int, None]:
+    """Read only the version of a config.
+
+    The projection has no _id, so with COMPOUND_INDEX_FOR_VERSION the query is
+    answered from the index without fetching the document.
+    """
+
+    query = {
+        key: {"$in": value} if isinstance(value, list) else value
+        for key, value in conditions.items()
+    }
+    document = model._get_collection().find_one(
+        query, projection={"_id": 0, "version": 1}
+    )
+    if document is None:
+        raise ERROR_NOT_FOUND(key="name", value=conditions.get("name"))
+
+    return document.get("version")
+
+
+def check_version(vo: MongoModel, expected_version: Union[int, None]) -> None:
+    if expected_version is not None and vo.version != expected_version:
+        raise ERROR_VERSION_CONFLICT(
+            name=vo.name, expected_version=expected_version, version=vo.version
+        )
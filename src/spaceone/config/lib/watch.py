@@ -0,0 +1,303 @@
+import logging
+import queue
+import re
+import threading
+import time
+from typing import Iterator, List, Type, Union
+
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+
+from spaceone.config.error.config import ERROR_TOO_MANY_WATCHERS
+from spaceone.config.lib.change_feed import ChangeFeed, get_change_feed
+from spaceone.config.lib.compression import unpack_document
+
+__all__ = ["ConfigWatcher", "watch_configs"]
+
+_LOGGER = logging.getLogger(__name__)
+
+_WATCH_HUBS = {}
+_WATCH_HUBS_LOCK = threading.Lock()
+_WATCH_SLOTS = None
+
+# Share of the gRPC worker threads that watch streams may hold by default
+_MAX_WATCHER_RATIO = 0.5
+
+
+class ConfigWatcher:
+    """A single watch stream, fed from the shared change feed of its model.
+
+    Events are dicts of the form:
+        {
+            'event_type': 'CREATED' | 'UPDATED' | 'DELETED',
+            'name': 'str',
+            'config': dict or None      # raw document, None for deletes
+        }
+
+    The watcher keeps the names of the configs in its scope by id. Deletes only
+    carry the document id, and polling on updated_at cannot tell inserts from
+    updates, so both are recognized with it.
+    """
+
+    def __init__(
+        self,
+        model: Type[MongoModel],
+        conditions: dict,
+        name_prefixes: List[str] = None,
+        max_queue_size: int = 1000,
+    ):
+        self.model = model
+        self.conditions = {
+            key: value for key, value in conditions.items() if value is not None
+        }
+        self.name_prefixes = name_prefixes or []
+        self.domain_id = self.conditions["domain_id"]
+        self._names = {}  # {_id: name}
+        self._loaded = False
+        self._overflow = False
+        self._events = queue.Queue(maxsize=max_queue_size)
+
+    def accepts(self, event: dict) -> bool:
+        if event["operation"] == "delete":
+            return not self._loaded or event["document_key"] in self._names
+
+        return bool(event["document"]) and self._match(event["document"])
+
+    def put(self, event: dict) -> None:
+        """Called from the change feed thread, must not block"""
+
+        try:
+            self._events.put_nowait(event)
+        except queue.Full:
+            self._overflow = True
+
+    def watch(
+        self,
+        change_feed: ChangeFeed,
+        heartbeat_interval: float = 30,
+        reconcile_interval: float = 60,
+    ) -> Iterator[Union[dict, None]]:
+        """Yield events in this scope until the caller stops iterating.
+
+        None is yielded after heartbeat_interval seconds without events, so the
+        caller can check whether the client is still there. The stream ends if
+        the client falls behind by more than max_queue_size events, the client
+        is expected to read the current state again and watch anew.
+        """
+
+        self._load_names()
+        last_reconciled_at = time.monotonic()
+
+        while not self._overflow:
+            try:
+                event = self._events.get(timeout=heartbeat_interval)
+            except queue.Empty:
+                event = None
+
+            if event:
+                watch_event = self._make_event(event)
+                if watch_event:
+                    yield watch_event
+            else:
+                yield None
+
+            # Polling on updated_at cannot observe deletes, compare ids instead.
+            if (
+                change_feed.mode == "polling"
+                and time.monotonic() - last_reconciled_at > reconcile_interval
+            ):
+                yield from self._reconcile_deletes()
+                last_reconciled_at = time.monotonic()
+
+        _LOGGER.warning(
+            f"[ConfigWatcher.watch] {self.model.__name__} watcher of "
+            f"{self.domain_id} fell behind, close the stream"
+        )
+
+    def _make_event(self, event: dict) -> Union[dict, None]:
+        if event["operation"] == "delete":
+            name = self._names.pop(event["document_key"], None)
+            if name is None:
+                return None
+
+            return {"event_type": "DELETED", "name": name, "config": None}
+
+        document = dict(event["document"])
+        _id = document.pop("_id")
+
+        if event["operation"] == "insert" or _id not in self._names:
+            event_type = "CREATED"
+        else:
+            event_type = "UPDATED"
+
+        self._names[_id] = document["name"]
+        return {"event_type": event_type, "name": document["name"], "config": document}
+
+    def _load_names(self) -> None:
+        collection = self.model._get_collection()
+        for document in collection.find(self._make_query(), projection=["name"]):
+            self._names[document["_id"]] = document["name"]
+
+        self._loaded = True
+
+    def _reconcile_deletes(self) -> Iterator[dict]:
+        collection = self.model._get_collection()
+        existing_ids = {
+            document["_id"]
+            for document in collection.find(self._make_query(), projection=["_id"])
+        }
+
+        for _id in set(self._names.keys()) - existing_ids:
+            name = self._names.pop(_id)
+            yield {"event_type": "DELETED", "name": name, "config": None}
+
+    def _make_query(self) -> dict:
+        query = {
+            key: {"$in": value} if isinstance(value, list) else value
+            for key, value in self.conditions.items()
+        }
+
+        if self.name_prefixes:
+            prefixes = "|".join(re.escape(prefix) for prefix in self.name_prefixes)
+            query["name"] = {"$regex": f"^(?:{prefixes})"}
+
+        return query
+
+    def _match(self, document: dict) -> bool:
+        for key, value in self.conditions.items():
+            if isinstance(value, list):
+                if document.get(key) not in value:
+                    return False
+            elif document.get(key) != value:
+                return False
+
+        if self.name_prefixes:
+            name = document.get("name") or ""
+            return any(name.startswith(prefix) for prefix in self.name_prefixes)
+
+        return True
+
+
+class _WatchHub:
+    """Dispatches one change feed to the watchers of a model by domain.
+
+    Watchers only see changes of their own domain, so an idle watcher costs a
+    blocked thread and a dict of names, independent of the write rate of other
+    domains. Deletes carry no domain and go to every watcher, which drops them
+    by id. Compressed or chunked data is restored once per event, not once per
+    watcher.
+    """
+
+    def __init__(self, model: Type[MongoModel], poll_interval: float):
+        self.model = model
+        self.change_feed = get_change_feed(model, poll_interval)
+        self._watchers = {}  # {domain_id: [watcher]}
+        self._lock = threading.Lock()
+        self.change_feed.subscribe(self._on_change)
+
+    def add(self, watcher: ConfigWatcher) -> None:
+        with self._lock:
+            # Copy-on-write so the feed thread never iterates a list being modified.
+            watchers = list(self._watchers.get(watcher.domain_id, []))
+            watchers.append(watcher)
+            self._watchers[watcher.domain_id] = watchers
+
+    def remove(self, watcher: ConfigWatcher) -> None:
+        with self._lock:
+            watchers = [
+                w for w in self._watchers.get(watcher.domain_id, []) if w is not watcher
+            ]
+            if watchers:
+                self._watchers[watcher.domain_id] = watchers
+            else:
+                self._watchers.pop(watcher.domain_id, None)
+
+    def _on_change(self, event: dict) -> None:
+        if event["operation"] == "delete":
+            watchers = [w for ws in list(self._watchers.values()) for w in ws]
+        elif event["document"]:
+            watchers = self._watchers.get(event["document"].get("domain_id"), [])
+        else:
+            return
+
+        watchers = [watcher for watcher in watchers if watcher.accepts(event)]
+        if not watchers:
+            return
+
+        if event["document"]:
+            event = {
+                **event,
+                "document": unpack_document(dict(event["document"]), self.model),
+            }
+
+        for watcher in watchers:
+            watcher.put(event)
+
+
+def watch_configs(
+    model: Type[MongoModel], conditions: dict, name_prefixes: List[str] = None
+) -> Iterator[Union[dict, None]]:
+    """Watch creates, updates and deletes of configs matching conditions.
+
+    conditions must contain domain_id, a list value matches any of its items.
+    Only changes made after the watch started are returned, so clients should
+    start watching before they read the current state.
+
+    The gRPC server runs a stream on one of its MAX_WORKERS threads for as long
+    as it is open, so at most CONFIG_WATCH.max_watchers streams are open at a
+    time and further ones fail with ERROR_TOO_MANY_WATCHERS. Without it, half of
+    the threads are left for unary RPCs.
+    """
+
+    watch_conf = config.get_global("CONFIG_WATCH", {})
+    max_watchers = watch_conf.get("max_watchers")
+    if max_watchers is None:
+        max_workers = config.get_global("MAX_WORKERS", 100)
+        max_watchers = max(int(max_workers * _MAX_WATCHER_RATIO), 1)
+
+    watch_slots = _get_watch_slots(max_watchers)
+    if not watch_slots.acquire(blocking=False):
+        raise ERROR_TOO_MANY_WATCHERS(max_watchers=max_watchers)
+
+    try:
+        yield from _watch(model, conditions, name_prefixes, watch_conf)
+    finally:
+        watch_slots.release()
+
+
+def _watch(
+    model: Type[MongoModel],
+    conditions: dict,
+    name_prefixes: Union[List[str], None],
+    watch_conf: dict,
+) -> Iterator[Union[dict, None]]:
+    with _WATCH_HUBS_LOCK:
+        if model not in _WATCH_HUBS:
+            _WATCH_HUBS[model] = _WatchHub(model, watch_conf.get("poll_interval", 5))
+
+        watch_hub = _WATCH_HUBS[model]
+
+    watcher = ConfigWatcher(
+        model, conditions, name_prefixes, watch_conf.get("max_queue_size", 1000)
+    )
+
+    # Register before loading names so that no change is lost in between.
+    watch_hub.add(watcher)
+    try:
+        yield from watcher.watch(
+            watch_hub.change_feed,
+            watch_conf.get("heartbeat_interval", 30),
+            watch_conf.get("reconcile_interval", 60),
+        )
+    finally:
+        watch_hub.remove(watcher)
+
+
+def _get_watch_slots(max_watchers: int) -> threading.BoundedSemaphore:
+    global _WATCH_SLOTS
+
+    with _WATCH_HUBS_LOCK:
+        if _WATCH_SLOTS is None:
+            _WATCH_SLOTS = threading.BoundedSemaphore(max_watchers)
+
+    return _WATCH_SLOTS
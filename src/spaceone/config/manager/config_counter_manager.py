@@ -0,0 +1,93 @@
+import logging
+from typing import Callable
+
+from spaceone.core.manager import BaseManager
+
+from spaceone.config.model.config_counter.database import ConfigCounter
+
+_LOGGER = logging.getLogger(__name__)
+
+# An initial count that overlapped with writes is counted again.
+_COUNT_ATTEMPTS = 3
+
+
+class ConfigCounterManager(BaseManager):
+    """Per-scope document counters that make an unfiltered total_count O(1)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.config_counter_model = ConfigCounter
+
+    def increment(
+        self, resource_type: str, domain_id: str, scope_id: str = "*", value: int = 1
+    ) -> None:
+        def _rollback():
+            _LOGGER.info(
+                f"[increment._rollback] Revert {resource_type} count : "
+                f"{domain_id}/{scope_id} ({value})"
+            )
+            self._filter_counter(resource_type, domain_id, scope_id).update_one(
+                inc__count=-value, inc__changes=1
+            )
+
+        if value == 0:
+            return
+
+        # A counter that does not exist yet is created as initializing, and its
+        # first read replaces the count with a real one. changes tells that read
+        # whether a write was counted while it was counting.
+        self._filter_counter(resource_type, domain_id, scope_id).update_one(
+            upsert=True,
+            inc__count=value,
+            inc__changes=1,
+            set_on_insert__initializing=True,
+        )
+        self.transaction.add_rollback(_rollback)
+
+    def decrement(
+        self, resource_type: str, domain_id: str, scope_id: str = "*", value: int = 1
+    ) -> None:
+        self.increment(resource_type, domain_id, scope_id, -value)
+
+    def get_count(
+        self,
+        resource_type: str,
+        domain_id: str,
+        scope_id: str,
+        count_func: Callable[[], int],
+    ) -> int:
+        counter_vos = self._filter_counter(resource_type, domain_id, scope_id)
+        config_counter_vo = counter_vos.first()
+        if config_counter_vo and not config_counter_vo.initializing:
+            return config_counter_vo.count
+
+        if config_counter_vo is None:
+            counter_vos.update_one(
+                upsert=True,
+                set_on_insert__count=0,
+                set_on_insert__changes=0,
+                set_on_insert__initializing=True,
+            )
+            config_counter_vo = counter_vos.first()
+
+        for _ in range(_COUNT_ATTEMPTS):
+            # Writes that were counted before changes is read are in the real
+            # count. A later one may or may not be, so then the count is dropped.
+            changes = config_counter_vo.changes
+            count = count_func()
+            if counter_vos.filter(initializing=True, changes=changes).update_one(
+                set__count=count, set__initializing=False
+            ):
+                return count
+
+            config_counter_vo = counter_vos.first()
+            if not config_counter_vo.initializing:
+                return config_counter_vo.count
+
+        # Still busy, the next read counts again
+        return count
+
+    def _filter_counter(self, resource_type: str, domain_id: str, scope_id: str):
+        return self.config_counter_model.filter(
+            resource_type=resource_type, domain_id=domain_id, scope_id=scope_id
+        )
@@ -0,0 +1,263 @@
+import logging
+from datetime import datetime, timedelta
+from typing import List, Union
+
+from bson import ObjectId
+from mongoengine import Q, QuerySet
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.core.manager import BaseManager
+
+from spaceone.config.lib.cursor import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_page_token,
+    encode_page_token,
+    get_filter_hash,
+)
+from spaceone.config.lib.query import to_documents
+from spaceone.config.model.config_tombstone.database import ConfigTombstone
+
+_LOGGER = logging.getLogger(__name__)
+
+_CHANGES_TOKEN_KEYS = [
+    "synced_at",
+    "updated_at",
+    "config_id",
+    "deleted_at",
+    "tombstone_id",
+]
+
+
+class ConfigTombstoneManager(BaseManager):
+    """Records of deleted configs, kept for CONFIG_SYNC.tombstone_ttl seconds
+    so that list_changes can report deletes"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.config_tombstone_model = ConfigTombstone
+
+    def add_tombstones(
+        self, resource_type: str, domain_id: str, keys: List[dict]
+    ) -> None:
+        """keys are the names of the deleted configs with their scope fields,
+        e.g. {'name': 'str', 'user_id': 'str'}"""
+
+        def _rollback(tombstone_ids: list):
+            _LOGGER.info(
+                f"[add_tombstones._rollback] Delete {len(tombstone_ids)} "
+                f"{resource_type} tombstones"
+            )
+            collection.delete_many({"_id": {"$in": tombstone_ids}})
+
+        if not keys:
+            return
+
+        now = datetime.utcnow()
+        expire_at = now + timedelta(seconds=self._get_tombstone_ttl())
+        collection = self.config_tombstone_model._get_collection()
+
+        result = collection.insert_many(
+            [
+                {
+                    **key,
+                    "resource_type": resource_type,
+                    "domain_id": domain_id,
+                    "deleted_at": now,
+                    "expire_at": expire_at,
+                }
+                for key in keys
+            ]
+        )
+        self.transaction.add_rollback(_rollback, result.inserted_ids)
+
+    def list_changes(
+        self,
+        resource_type: str,
+        vos: QuerySet,
+        domain_id: str,
+        since: datetime,
+        key_fields: List[str],
+        page_size: int = None,
+        page_token: str = None,
+        **conditions,
+    ) -> dict:
+        """Return the configs of vos updated after since and the tombstones of
+        the ones deleted after since, at most page_size changes in the order
+        they were made.
+
+        next_page_token continues after the last config and the last tombstone
+        of the page, it is None on the last page. synced_at is the since of the
+        next call once every page is read. It is taken on the first page and
+        lags behind it by CONFIG_SYNC.clock_skew, so that writes of other
+        replicas which are still in flight are returned again rather than missed.
+        """
+
+        page_size = min(page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        filter_hash = get_filter_hash(
+            {
+                "filter": [
+                    {
+                        "resource_type": resource_type,
+                        "domain_id": domain_id,
+                        "since": since,
+                        **conditions,
+                    }
+                ]
+            }
+        )
+
+        if page_token:
+            last_values = decode_page_token(
+                page_token, _CHANGES_TOKEN_KEYS, filter_hash
+            )
+        else:
+            last_values = {
+                "synced_at": self.get_synced_at(),
+                "updated_at": since,
+                "config_id": None,
+                "deleted_at": since,
+                "tombstone_id": None,
+            }
+
+        documents = to_documents(
+            vos.filter(
+                _make_after_filter(
+                    "updated_at", last_values["updated_at"], last_values["config_id"]
+                )
+            )
+            .order_by("updated_at", "id")
+            .limit(page_size + 1)
+        )
+        tombstones = self.list_tombstones(
+            resource_type,
+            domain_id,
+            last_values["deleted_at"],
+            last_values["tombstone_id"],
+            page_size + 1,
+            **conditions,
+        )
+
+        # Configs and tombstones are each sorted by the time of the change, so
+        # a page of both merged holds a leading part of each of them.
+        changes = sorted(
+            [("updated_at", document) for document in documents]
+            + [("deleted_at", tombstone) for tombstone in tombstones],
+            key=lambda change: (change[1][change[0]], change[1]["_id"]),
+        )
+
+        next_page_token = None
+        if len(changes) > page_size:
+            documents = documents[: _count_changes(changes[:page_size], "updated_at")]
+            tombstones = tombstones[: _count_changes(changes[:page_size], "deleted_at")]
+
+            if documents:
+                last_values["updated_at"] = documents[-1]["updated_at"]
+                last_values["config_id"] = documents[-1]["_id"]
+
+            if tombstones:
+                last_values["deleted_at"] = tombstones[-1]["deleted_at"]
+                last_values["tombstone_id"] = tombstones[-1]["_id"]
+
+            next_page_token = encode_page_token(last_values, filter_hash)
+
+        for tombstone in tombstones:
+            del tombstone["_id"]
+
+        return {
+            "results": documents,
+            "deleted": self.exclude_recreated(tombstones, documents, key_fields),
+            "synced_at": last_values["synced_at"],
+            "next_page_token": next_page_token,
+        }
+
+    def list_tombstones(
+        self,
+        resource_type: str,
+        domain_id: str,
+        since: datetime,
+        last_id: Union[ObjectId, None] = None,
+        limit: int = 0,
+        **conditions,
+    ) -> List[dict]:
+        """Return tombstones deleted after since, or after the tombstone last_id
+        deleted at since. A list value in conditions matches any of its items."""
+
+        if since < datetime.utcnow() - timedelta(seconds=self._get_tombstone_ttl()):
+            raise ERROR_INVALID_PARAMETER(
+                key="since",
+                reason="Deletes are only kept for CONFIG_SYNC.tombstone_ttl, "
+                "list all configs again instead.",
+            )
+
+        query = {"domain_id": domain_id, "resource_type": resource_type}
+        if last_id is None:
+            query["deleted_at"] = {"$gt": since}
+        else:
+            query["$or"] = [
+                {"deleted_at": {"$gt": since}},
+                {"deleted_at": since, "_id": {"$gt": last_id}},
+            ]
+
+        for key, value in conditions.items():
+            if value is not None:
+                query[key] = {"$in": value} if isinstance(value, list) else value
+
+        collection = self.config_tombstone_model._get_collection()
+        return list(
+            collection.find(
+                query,
+                projection={"resource_type": 0, "expire_at": 0},
+                sort=[("deleted_at", 1), ("_id", 1)],
+                limit=limit,
+            )
+        )
+
+    @staticmethod
+    def exclude_recreated(
+        tombstones: List[dict], documents: List[dict], key_fields: List[str]
+    ) -> List[dict]:
+        """Drop tombstones of configs that were created again after the delete"""
+
+        updated_at = {
+            tuple(document.get(key) for key in key_fields): document.get("updated_at")
+            for document in documents
+        }
+
+        results = []
+        for tombstone in tombstones:
+            recreated_at = updated_at.get(
+                tuple(tombstone.get(key) for key in key_fields)
+            )
+            if recreated_at is None or recreated_at < tombstone["deleted_at"]:
+                results.append(tombstone)
+
+        return results
+
+    @staticmethod
+    def get_synced_at() -> datetime:
+        clock_skew = config.get_global("CONFIG_SYNC", {}).get("clock_skew", 5)
+        synced_at = datetime.utcnow() - timedelta(seconds=clock_skew)
+
+        # Mongo keeps milliseconds, the page token carries synced_at unchanged
+        return synced_at.replace(microsecond=synced_at.microsecond // 1000 * 1000)
+
+    @staticmethod
+    def _get_tombstone_ttl() -> int:
+        return config.get_global("CONFIG_SYNC", {}).get("tombstone_ttl", 604800)
+
+
+def _make_after_filter(
+    field: str, last_value: datetime, last_id: Union[ObjectId, None]
+) -> Q:
+    # (field > last_value) OR (field = last_value AND id > last_id)
+    after_filter = Q(**{f"{field}__gt": last_value})
+    if last_id is not None:
+        after_filter |= Q(**{field: last_value, "id__gt": last_id})
+
+    return after_filter
+
+
+def _count_changes(changes: List[tuple], field: str) -> int:
+    return len([change for change in changes if change[0] == field])
@@ -1,39 +1,112 @@
 import logging
+import time
 
-from spaceone.core import cache
 from spaceone.core import config
+from spaceone.core.error import ERROR_BASE, ERROR_INTERNAL_API
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.core.auth.jwt.jwt_util import JWTUtil
 
+from spaceone.config.lib import cache as config_cache
+from spaceone.config.lib.connector import get_connector
+from spaceone.config.lib.single_flight import single_flight
+
 _LOGGER = logging.getLogger(__name__)
 
+# Identity errors that mean the workspace does not exist (or is not usable),
+# as opposed to transient failures that must not be cached.
+_NEGATIVE_STATUS_CODES = ["NOT_FOUND", "INVALID_ARGUMENT"]
+
 
 class IdentityManager(BaseManager):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        token = self.transaction.get_meta("token")
-        self.token_type = JWTUtil.get_value_from_token(token, "typ")
-        self.identity_conn: SpaceConnector = self.locator.get_connector(
-            SpaceConnector, service="identity"
-        )
+    @property
+    def identity_conn(self) -> SpaceConnector:
+        return get_connector(SpaceConnector, service="identity")
 
     def check_workspace(self, workspace_id: str, domain_id: str) -> None:
+        """Check that a workspace exists, through a short lived cache.
+
+        Existing workspaces are cached for IDENTITY_CACHE.workspace_expire
+        seconds and identity errors for negative_expire seconds. The expiry is
+        kept in the cached value, since the local tier has one fixed TTL.
+        Concurrent checks of the same workspace share one identity call.
+        """
+
+        cache_key = f"config:workspace:{domain_id}:{workspace_id}"
+
+        workspace_check = config_cache.get(cache_key)
+        if workspace_check is None or workspace_check["expires_at"] < time.time():
+            workspace_check = single_flight(
+                cache_key,
+                lambda: self._check_workspace(workspace_id, domain_id, cache_key),
+            )
+
+        if workspace_check.get("error_code"):
+            e = ERROR_INTERNAL_API(message=workspace_check["message"])
+            e.error_code = workspace_check["error_code"]
+            e.status_code = workspace_check["status_code"]
+            raise e
+
+    def _check_workspace(
+        self, workspace_id: str, domain_id: str, cache_key: str
+    ) -> dict:
+        cache_conf = config.get_global("IDENTITY_CACHE", {})
         system_token = config.get_global("TOKEN")
 
-        self.identity_conn.dispatch(
-            "Workspace.check",
-            {"workspace_id": workspace_id, "domain_id": domain_id},
-            token=system_token,
+        try:
+            self.identity_conn.dispatch(
+                "Workspace.check",
+                {"workspace_id": workspace_id, "domain_id": domain_id},
+                token=system_token,
+            )
+            expire = cache_conf.get("workspace_expire", 300)
+            workspace_check = {}
+        except ERROR_BASE as e:
+            if e.status_code not in _NEGATIVE_STATUS_CODES:
+                raise
+
+            expire = cache_conf.get("negative_expire", 10)
+            workspace_check = {
+                "error_code": e.error_code,
+                "status_code": e.status_code,
+                "message": e.message,
+            }
+
+        workspace_check["expires_at"] = time.time() + expire
+        config_cache.set(cache_key, workspace_check, expire=expire)
+
+        return workspace_check
+
+    def get_project(self, project_id: str, domain_id: str) -> dict:
+        """Get a project through the local and Redis tiers of the config cache.
+
+        Expired projects are served stale while one background call refreshes
+        them, so only a project missing from both tiers waits for identity.
+        """
+
+        cache_conf = config.get_global("IDENTITY_CACHE", {})
+        # A background refresh runs outside of this transaction, so the token
+        # is passed explicitly instead of being read from the transaction.
+        token = self.transaction.get_meta("token")
+
+        return config_cache.get_or_load(
+            f"config:project:{domain_id}:{project_id}",
+            lambda: self._get_project(project_id, domain_id, token),
+            expire=cache_conf.get("project_expire", 600),
+            stale_expire=cache_conf.get("project_stale_expire", 3600),
+            jitter=cache_conf.get("jitter", 0.1),
         )
 
-    @cache.cacheable(key="inventory:project:{domain_id}:{project_id}", expire=600)
-    def get_project(self, project_id: str, domain_id: str):
-        if self.token_type == "SYSTEM_TOKEN":
+    def _get_project(self, project_id: str, domain_id: str, token: str) -> dict:
+        # Decoded only on a cache miss, most calls never look at the token.
+        if JWTUtil.get_value_from_token(token, "typ") == "SYSTEM_TOKEN":
             return self.identity_conn.dispatch(
-                "Project.get", {"project_id": project_id}, x_domain_id=domain_id
+                "Project.get",
+                {"project_id": project_id},
+                token=token,
+                x_domain_id=domain_id,
             )
         else:
             return self.identity_conn.dispatch(
-                "Project.get", {"project_id": project_id}
+                "Project.get", {"project_id": project_id}, token=token
             )
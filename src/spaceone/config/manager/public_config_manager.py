@@ -1,18 +1,40 @@
 import logging
-from typing import Tuple
-from mongoengine import QuerySet
-
+from datetime import datetime
+from typing import Iterator, List, Tuple, Union
+from mongoengine import NotUniqueError, Q, QuerySet
+from pymongo.errors import DuplicateKeyError
+
+from spaceone.core.error import (
+    ERROR_DB_QUERY,
+    ERROR_NOT_FOUND,
+    ERROR_SAVE_UNIQUE_VALUES,
+)
 from spaceone.core.manager import BaseManager
 
+from spaceone.config.lib.public_config_store import get_public_config_store
+from spaceone.config.lib.content_hash import is_changed, make_data_hash
+from spaceone.config.lib.cursor import list_by_cursor
+from spaceone.config.lib.query import (
+    get_document,
+    get_scope_conditions,
+    iterate_by_batch,
+    query_without_count,
+    to_documents,
+)
+from spaceone.config.manager.config_counter_manager import ConfigCounterManager
 from spaceone.config.model.public_config.database import PublicConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+# A set that collides with a concurrent insert of other data is tried again.
+_SET_ATTEMPTS = 3
+
 
 class PublicConfigManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.public_config_model = PublicConfig
+        self.config_counter_mgr = ConfigCounterManager()
 
     def create_public_config(self, params: dict) -> PublicConfig:
         def _rollback(vo: PublicConfig):
@@ -21,37 +43,213 @@ class PublicConfigManager(BaseManager):
             )
             vo.delete()
 
-        public_config_vo: PublicConfig = self.public_config_model.create(params)
+        params["data_hash"] = make_data_hash(params.get("data"))
+        try:
+            public_config_vo: PublicConfig = self.public_config_model.create(params)
+        except ERROR_DB_QUERY as e:
+            if isinstance(e.__context__, (NotUniqueError, DuplicateKeyError)):
+                raise ERROR_SAVE_UNIQUE_VALUES(keys=["name", "domain_id"])
+            raise
         self.transaction.add_rollback(_rollback, public_config_vo)
+        self.config_counter_mgr.increment("PublicConfig", public_config_vo.domain_id)
 
         return public_config_vo
 
     def update_public_config_by_vo(
         self, params: dict, public_config_vo: PublicConfig
-    ) -> PublicConfig:
+    ) -> Tuple[PublicConfig, bool]:
         def _rollback(old_data: dict):
             _LOGGER.info(
-                f'[update_public_config_by_vo._rollback] Revert Data : {old_data["name"]}'
+                f"[update_public_config_by_vo._rollback] Revert Data : {public_config_vo.name}"
             )
             public_config_vo.update(old_data)
 
-        self.transaction.add_rollback(_rollback, public_config_vo.to_dict())
+        if "data" in params:
+            params["data_hash"] = make_data_hash(params["data"])
+
+        # Identical re-saves are not written, they would only bump updated_at.
+        if not is_changed(params, public_config_vo):
+            return public_config_vo, False
+
+        # Snapshot only the fields being updated, they are already loaded on the VO.
+        updatable_fields = self.public_config_model._meta.get("updatable_fields", [])
+        old_data = {
+            key: getattr(public_config_vo, key)
+            for key in params
+            if key in updatable_fields
+        }
+        self.transaction.add_rollback(_rollback, old_data)
+
+        return public_config_vo.update(params), True
+
+    def set_public_config(self, params: dict) -> Tuple[PublicConfig, bool]:
+        def _rollback(old_data: Union[dict, None]):
+            if old_data is None:
+                _LOGGER.info(
+                    f"[set_public_config._rollback] Delete public config : {params['name']}"
+                )
+                self.filter_public_configs(**conditions).delete()
+            else:
+                _LOGGER.info(
+                    f'[set_public_config._rollback] Revert Data : {params["name"]}'
+                )
+                public_config_vo.update(old_data)
+
+        conditions = {
+            "name": params["name"],
+            "domain_id": params["domain_id"],
+        }
+        updatable_fields = self.public_config_model._meta.get("updatable_fields", [])
+        update_params = {
+            key: value
+            for key, value in params.items()
+            if key in updatable_fields and key not in conditions
+        }
+        update_params["data_hash"] = make_data_hash(update_params.get("data"))
+
+        now = datetime.utcnow()
+        update = {f"set__{key}": value for key, value in update_params.items()}
+        update["set__updated_at"] = now
+        update["set_on_insert__created_at"] = now
+
+        # Identical re-saves are not written. An unchanged document does not
+        # match the filter, so the upsert collides with it on the unique index.
+        changed_filter = Q(data_hash__ne=update_params["data_hash"])
+        if "tags" in update_params:
+            changed_filter |= Q(tags__ne=update_params["tags"])
+
+        # Single find-and-modify round trip. The pre-image tells us whether the
+        # document was inserted or updated, and the new state is derived from it.
+        for attempt in range(_SET_ATTEMPTS):
+            try:
+                public_config_vo = (
+                    self.filter_public_configs(**conditions)
+                    .filter(changed_filter)
+                    .modify(upsert=True, new=False, **update)
+                )
+                break
+            except (NotUniqueError, DuplicateKeyError):
+                # The config exists but did not match. It is unchanged, or it was
+                # inserted by a concurrent request with other data, and then the
+                # next attempt updates it.
+                public_config_vo = self.filter_public_configs(**conditions).first()
+                if public_config_vo is not None:
+                    tags = update_params.get("tags", public_config_vo.tags)
+                    unchanged = (
+                        public_config_vo.data_hash == update_params["data_hash"]
+                        and public_config_vo.tags == tags
+                    )
+
+                    if unchanged:
+                        return public_config_vo, False
+
+                if attempt == _SET_ATTEMPTS - 1:
+                    raise
+
+        if public_config_vo is None:
+            public_config_vo = self.public_config_model(
+                **conditions, **update_params, created_at=now, updated_at=now
+            )
+            self.transaction.add_rollback(_rollback, None)
+            self.config_counter_mgr.increment("PublicConfig", params["domain_id"])
+        else:
+            old_data = {key: getattr(public_config_vo, key) for key in update_params}
+            for key, value in update_params.items():
+                setattr(public_config_vo, key, value)
+            public_config_vo.updated_at = now
+            self.transaction.add_rollback(_rollback, old_data)
 
-        return public_config_vo.update(params)
+        return public_config_vo, True
 
     def delete_public_config_by_vo(self, public_config_vo: PublicConfig) -> None:
         public_config_vo.delete()
+        self.config_counter_mgr.decrement("PublicConfig", public_config_vo.domain_id)
 
     def get_public_config(self, name: str, domain_id: str) -> PublicConfig:
         return self.public_config_model.get(
             name=name, domain_id=domain_id
         )
 
+    def get_public_config_info(self, name: str, domain_id: str) -> dict:
+        public_config_store = get_public_config_store()
+
+        if public_config_store is None:
+            return get_document(
+                self.public_config_model, name=name, domain_id=domain_id
+            )
+
+        public_config_info = public_config_store.get(domain_id, name)
+        if public_config_info is None:
+            raise ERROR_NOT_FOUND(key="name", value=name)
+
+        return public_config_info
+
     def filter_public_configs(self, **conditions) -> QuerySet:
         return self.public_config_model.filter(**conditions)
 
-    def list_public_configs(self, query: dict) -> Tuple[QuerySet, int]:
-        return self.public_config_model.query(**query)
+    def list_public_configs(
+        self, query: dict, skip_total_count: bool = False, as_pymongo: bool = False
+    ) -> Tuple[Union[QuerySet, list], Union[int, None]]:
+        if skip_total_count:
+            public_config_vos = query_without_count(
+                self.public_config_model, query, as_pymongo
+            )
+            return public_config_vos, None
+
+        # Unfiltered listings of a whole scope read the maintained counter
+        scope = get_scope_conditions(query, ["domain_id"])
+        if scope:
+            public_config_vos = query_without_count(
+                self.public_config_model, query, as_pymongo
+            )
+            total_count = self.config_counter_mgr.get_count(
+                "PublicConfig",
+                scope["domain_id"],
+                "*",
+                lambda: self.filter_public_configs(**scope).count(),
+            )
+            return public_config_vos, total_count
+
+        public_config_vos, total_count = self.public_config_model.query(**query)
+        if as_pymongo:
+            public_config_vos = to_documents(public_config_vos)
+
+        return public_config_vos, total_count
+
+    def list_public_config_infos(
+        self, query: dict, skip_total_count: bool = False
+    ) -> Tuple[List[dict], Union[int, None]]:
+        public_config_store = get_public_config_store()
+
+        if public_config_store is not None:
+            result = public_config_store.list(query)
+            if result is not None:
+                return result
+
+        return self.list_public_configs(query, skip_total_count, as_pymongo=True)
+
+    def list_public_configs_by_cursor(
+        self,
+        query: dict,
+        page_size: int = None,
+        page_token: str = None,
+        as_pymongo: bool = False,
+    ) -> Tuple[list, Union[str, None]]:
+        return list_by_cursor(
+            self.public_config_model,
+            query,
+            ["name"],
+            page_size,
+            page_token,
+            as_pymongo,
+        )
+
+    def stream_public_configs(
+        self, query: dict, batch_size: int = 100, as_pymongo: bool = False
+    ) -> Iterator[list]:
+        return iterate_by_batch(
+            self.public_config_model, query, batch_size, as_pymongo
+        )
 
     def stat_public_configs(self, query: dict) -> dict:
         return self.public_config_model.stat(**query)
@@ -1,18 +1,56 @@
 import logging
-from typing import Tuple, List
-from mongoengine import QuerySet
+from datetime import datetime
+from typing import Iterator, List, Tuple, Union
+from mongoengine import NotUniqueError, QuerySet
+from pymongo.errors import DuplicateKeyError
 
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import (
+    ERROR_DB_QUERY,
+    ERROR_NOT_FOUND,
+    ERROR_SAVE_UNIQUE_VALUES,
+)
 from spaceone.core.manager import BaseManager
 
+from spaceone.config.error.config import ERROR_VERSION_CONFLICT
+from spaceone.config.lib import cache as config_cache
+from spaceone.config.lib.content_hash import is_changed, make_data_hash
+from spaceone.config.lib.merge import (
+    apply_merge_patch,
+    deep_merge,
+    make_merge_patch_update,
+)
+from spaceone.config.lib.cursor import list_by_cursor
+from spaceone.config.lib.query import (
+    get_document,
+    iterate_by_batch,
+    query_without_count,
+    to_documents,
+)
+from spaceone.config.lib.version import (
+    check_version,
+    get_version,
+    raw_update_with_version,
+    update_with_version,
+)
+from spaceone.config.lib.watch import watch_configs
+from spaceone.config.manager.config_tombstone_manager import ConfigTombstoneManager
 from spaceone.config.model.shared_config.database import SharedConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+_RESOURCE_GROUP_PRIORITY = {"DOMAIN": 0, "WORKSPACE": 1, "PROJECT": 2}
+
+# A patch of a config that changed after it was read is applied again.
+_PATCH_ATTEMPTS = 3
+
 
 class SharedConfigManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.shared_config_model = SharedConfig
+        self.config_tombstone_mgr = ConfigTombstoneManager()
 
     def create_shared_config(self, params: dict) -> SharedConfig:
         def _rollback(vo: SharedConfig):
@@ -20,27 +58,129 @@ class SharedConfigManager(BaseManager):
                 f"[create_shared_config._rollback] " f"Delete shared config : {vo.name}"
             )
             vo.delete()
+            self._delete_resolve_cache(vo.name, vo.domain_id)
 
-        shared_config_vo: SharedConfig = self.shared_config_model.create(params)
+        params["data_hash"] = make_data_hash(params.get("data"))
+        params["version"] = 1
+        try:
+            shared_config_vo: SharedConfig = self.shared_config_model.create(params)
+        except ERROR_DB_QUERY as e:
+            if isinstance(e.__context__, (NotUniqueError, DuplicateKeyError)):
+                raise ERROR_SAVE_UNIQUE_VALUES(keys=["name", "domain_id", "workspace_id", "project_id"])
+            raise
         self.transaction.add_rollback(_rollback, shared_config_vo)
+        self._delete_resolve_cache(shared_config_vo.name, shared_config_vo.domain_id)
 
         return shared_config_vo
 
     def update_shared_config_by_vo(
         self, params: dict, shared_config_vo: SharedConfig
-    ) -> SharedConfig:
+    ) -> Tuple[SharedConfig, bool]:
         def _rollback(old_data: dict):
             _LOGGER.info(
-                f'[update_shared_config_by_vo._rollback] Revert Data : {old_data["name"]}'
+                f"[update_shared_config_by_vo._rollback] Revert Data : {shared_config_vo.name}"
             )
-            shared_config_vo.update(old_data)
+            update_with_version(shared_config_vo, old_data)
+            self._delete_resolve_cache(
+                shared_config_vo.name, shared_config_vo.domain_id
+            )
+
+        # The VO is already loaded, so a stale expected_version fails without a
+        # write. The write itself is conditional on it as well.
+        expected_version = params.pop("expected_version", None)
+        check_version(shared_config_vo, expected_version)
+
+        if "data" in params:
+            params["data_hash"] = make_data_hash(params["data"])
 
-        self.transaction.add_rollback(_rollback, shared_config_vo.to_dict())
+        # Identical re-saves are not written, they would only bump updated_at.
+        if not is_changed(params, shared_config_vo):
+            return shared_config_vo, False
 
-        return shared_config_vo.update(params)
+        # Snapshot only the fields being updated, they are already loaded on the VO.
+        updatable_fields = self.shared_config_model._meta.get("updatable_fields", [])
+        old_data = {
+            key: getattr(shared_config_vo, key)
+            for key in params
+            if key in updatable_fields
+        }
+
+        shared_config_vo = update_with_version(
+            shared_config_vo, params, expected_version
+        )
+        self.transaction.add_rollback(_rollback, old_data)
+        self._delete_resolve_cache(shared_config_vo.name, shared_config_vo.domain_id)
+
+        return shared_config_vo, True
+
+    def patch_shared_config_by_vo(
+        self, data_patch: dict, shared_config_vo: SharedConfig
+    ) -> SharedConfig:
+        def _rollback(old_data: dict, old_data_hash: str):
+            _LOGGER.info(
+                f"[patch_shared_config_by_vo._rollback] "
+                f"Revert Data : {shared_config_vo.name}"
+            )
+            update_with_version(
+                shared_config_vo, {"data": old_data, "data_hash": old_data_hash}
+            )
+            self._delete_resolve_cache(
+                shared_config_vo.name, shared_config_vo.domain_id
+            )
+
+        # The patch is applied to the data that was read. If the config changed
+        # since, it is read again and the patch is applied to the new data.
+        for attempt in range(_PATCH_ATTEMPTS):
+            # Only the patched paths of data are written, not the whole field.
+            old_data = shared_config_vo.data
+            old_data_hash = shared_config_vo.data_hash
+            set_fields, unset_fields = make_merge_patch_update(
+                old_data, data_patch, "data"
+            )
+
+            new_data = apply_merge_patch(old_data, data_patch)
+            data_hash = make_data_hash(new_data)
+
+            now = datetime.utcnow()
+            update = {
+                "$set": {**set_fields, "data_hash": data_hash, "updated_at": now}
+            }
+            if unset_fields:
+                update["$unset"] = {path: "" for path in unset_fields}
+
+            try:
+                version = raw_update_with_version(shared_config_vo, update)
+                break
+            except ERROR_VERSION_CONFLICT:
+                if attempt == _PATCH_ATTEMPTS - 1:
+                    raise
+
+                shared_config_vo.reload()
+
+        self.transaction.add_rollback(_rollback, old_data, old_data_hash)
+        self._delete_resolve_cache(shared_config_vo.name, shared_config_vo.domain_id)
+
+        shared_config_vo.data = new_data
+        shared_config_vo.data_hash = data_hash
+        shared_config_vo.updated_at = now
+        shared_config_vo.version = version
+
+        return shared_config_vo
 
     def delete_shared_config_by_vo(self, shared_config_vo: SharedConfig) -> None:
         shared_config_vo.delete()
+        self.config_tombstone_mgr.add_tombstones(
+            "SharedConfig",
+            shared_config_vo.domain_id,
+            [
+                {
+                    "name": shared_config_vo.name,
+                    "workspace_id": shared_config_vo.workspace_id,
+                    "project_id": shared_config_vo.project_id,
+                }
+            ],
+        )
+        self._delete_resolve_cache(shared_config_vo.name, shared_config_vo.domain_id)
 
     def get_shared_config(
         self,
@@ -49,21 +189,223 @@ class SharedConfigManager(BaseManager):
         workspace_id: str = None,
         user_projects: List[str] = None
     ) -> SharedConfig:
-        conditions = {"name": name, "domain_id": domain_id}
+        conditions = self._make_get_conditions(
+            name, domain_id, workspace_id, user_projects
+        )
+        return self.shared_config_model.get(**conditions)
+
+    def get_shared_config_info(
+        self,
+        name: str,
+        domain_id: str,
+        workspace_id: str = None,
+        user_projects: List[str] = None
+    ) -> dict:
+        conditions = self._make_get_conditions(
+            name, domain_id, workspace_id, user_projects
+        )
+        return get_document(self.shared_config_model, **conditions)
+
+    def get_shared_config_version(
+        self,
+        name: str,
+        domain_id: str,
+        workspace_id: str = None,
+        user_projects: List[str] = None,
+    ) -> Union[int, None]:
+        conditions = self._make_get_conditions(
+            name, domain_id, workspace_id, user_projects
+        )
+        return get_version(self.shared_config_model, **conditions)
+
+    def resolve_shared_config(
+        self,
+        name: str,
+        domain_id: str,
+        workspace_id: str = None,
+        project_id: str = None,
+        merge: bool = False,
+    ) -> dict:
+        """Return the most specific shared config for a project or workspace.
+
+        All candidate scopes (PROJECT, WORKSPACE and DOMAIN) are fetched with one
+        query. With merge, data is deep merged from DOMAIN down to the most
+        specific level.
+        """
+
+        generation = self._get_resolve_generation(name, domain_id)
+        cache_key = (
+            f"config:shared-config:resolve:{domain_id}:{name}:{generation}:"
+            f"{workspace_id or '*'}:{project_id or '*'}:{merge}"
+        )
+        shared_config_info = config_cache.get(cache_key)
+        if shared_config_info is not None:
+            return shared_config_info
+
+        shared_config_vos = self.filter_shared_configs(
+            name=name,
+            domain_id=domain_id,
+            workspace_id=list({workspace_id or "*", "*"}),
+            project_id=list({project_id or "*", "*"}),
+        )
+        shared_configs_info = sorted(
+            [shared_config_vo.to_dict() for shared_config_vo in shared_config_vos],
+            key=lambda info: _RESOURCE_GROUP_PRIORITY.get(info["resource_group"], 0),
+        )
 
+        if len(shared_configs_info) == 0:
+            raise ERROR_NOT_FOUND(key="name", value=name)
+
+        shared_config_info = shared_configs_info[-1]
+        if merge:
+            data = {}
+            for info in shared_configs_info:
+                data = deep_merge(data, info.get("data"))
+
+            shared_config_info["data"] = data
+
+        config_cache.set(
+            cache_key,
+            shared_config_info,
+            expire=config.get_global("SHARED_CONFIG_RESOLVE_CACHE_EXPIRE", 600),
+        )
+
+        return shared_config_info
+
+    def filter_shared_configs(self, **conditions) -> QuerySet:
+        return self.shared_config_model.filter(**conditions)
+
+    def list_shared_configs(
+        self, query: dict, skip_total_count: bool = False, as_pymongo: bool = False
+    ) -> Tuple[Union[QuerySet, list], Union[int, None]]:
+        if skip_total_count:
+            shared_config_vos = query_without_count(
+                self.shared_config_model, query, as_pymongo
+            )
+            return shared_config_vos, None
+
+        shared_config_vos, total_count = self.shared_config_model.query(**query)
+        if as_pymongo:
+            shared_config_vos = to_documents(shared_config_vos)
+
+        return shared_config_vos, total_count
+
+    def list_shared_configs_by_cursor(
+        self,
+        query: dict,
+        page_size: int = None,
+        page_token: str = None,
+        as_pymongo: bool = False,
+    ) -> Tuple[list, Union[str, None]]:
+        return list_by_cursor(
+            self.shared_config_model,
+            query,
+            # Follows COMPOUND_INDEX_FOR_SEARCH after the domain_id equality.
+            ["workspace_id", "project_id", "name"],
+            page_size,
+            page_token,
+            as_pymongo,
+        )
+
+    def stream_shared_configs(
+        self, query: dict, batch_size: int = 100, as_pymongo: bool = False
+    ) -> Iterator[list]:
+        return iterate_by_batch(
+            self.shared_config_model, query, batch_size, as_pymongo
+        )
+
+    def list_shared_config_changes(
+        self,
+        since: datetime,
+        domain_id: str,
+        workspace_id: Union[str, List[str]] = None,
+        user_projects: List[str] = None,
+        page_size: int = None,
+        page_token: str = None,
+    ) -> dict:
+        """Return shared configs updated after since and tombstones of the ones
+        deleted after since.
+
+        See ConfigTombstoneManager.list_changes for paging and synced_at.
+        """
+
+        # filter_shared_configs matches list values with __in
+        conditions = {"domain_id": domain_id}
         if workspace_id:
             conditions["workspace_id"] = workspace_id
 
         if user_projects:
             conditions["project_id"] = user_projects
 
-        return self.shared_config_model.get(**conditions)
+        return self.config_tombstone_mgr.list_changes(
+            "SharedConfig",
+            self.filter_shared_configs(**conditions),
+            domain_id,
+            since,
+            ["name", "workspace_id", "project_id"],
+            page_size,
+            page_token,
+            workspace_id=workspace_id,
+            project_id=user_projects,
+        )
 
-    def filter_shared_configs(self, **conditions) -> QuerySet:
-        return self.shared_config_model.filter(**conditions)
+    def watch_shared_configs(
+        self,
+        domain_id: str,
+        workspace_id: Union[str, List[str]] = None,
+        user_projects: List[str] = None,
+        name_prefixes: List[str] = None,
+    ) -> Iterator[Union[dict, None]]:
+        conditions = {"domain_id": domain_id, "workspace_id": workspace_id}
+
+        if user_projects:
+            conditions["project_id"] = user_projects
 
-    def list_shared_configs(self, query: dict) -> Tuple[QuerySet, int]:
-        return self.shared_config_model.query(**query)
+        return watch_configs(self.shared_config_model, conditions, name_prefixes)
 
     def stat_shared_configs(self, query: dict) -> dict:
         return self.shared_config_model.stat(**query)
+
+    @staticmethod
+    def _get_resolve_generation(name: str, domain_id: str) -> str:
+        """Return the generation that resolve cache keys of a name are built on.
+
+        A write drops the generation instead of the cached results, which
+        would take a pattern delete. Results of an old generation are never
+        read again and expire on their own.
+        """
+
+        generation_key = f"config:shared-config:resolve-generation:{domain_id}:{name}"
+        generation = config_cache.get(generation_key)
+        if generation is None:
+            generation = utils.random_string()
+            config_cache.set(
+                generation_key,
+                generation,
+                expire=config.get_global("SHARED_CONFIG_RESOLVE_CACHE_EXPIRE", 600),
+            )
+
+        return generation
+
+    @staticmethod
+    def _delete_resolve_cache(name: str, domain_id: str) -> None:
+        config_cache.delete(
+            f"config:shared-config:resolve-generation:{domain_id}:{name}"
+        )
+
+    @staticmethod
+    def _make_get_conditions(
+        name: str,
+        domain_id: str,
+        workspace_id: str = None,
+        user_projects: List[str] = None,
+    ) -> dict:
+        conditions = {"name": name, "domain_id": domain_id}
+
+        if workspace_id:
+            conditions["workspace_id"] = workspace_id
+
+        if user_projects:
+            conditions["project_id"] = user_projects
+
+        return conditions
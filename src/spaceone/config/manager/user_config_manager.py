@@ -1,18 +1,57 @@
 import logging
-from typing import Tuple
-from mongoengine import QuerySet
+from datetime import datetime
+from typing import Iterator, List, Tuple, Union
+from mongoengine import NotUniqueError, Q, QuerySet, ValidationError
+from pymongo import DeleteOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
+from spaceone.core.error import (
+    ERROR_DB_QUERY,
+    ERROR_INVALID_PARAMETER,
+    ERROR_NOT_FOUND,
+    ERROR_REQUIRED_PARAMETER,
+    ERROR_SAVE_UNIQUE_VALUES,
+)
 from spaceone.core.manager import BaseManager
 
+from spaceone.config.error.config import ERROR_VERSION_CONFLICT
+from spaceone.config.lib.compression import get_vo_data, pack_data
+from spaceone.config.lib.content_hash import is_changed, make_data_hash
+from spaceone.config.lib.cursor import list_by_cursor
+from spaceone.config.lib.merge import apply_merge_patch, make_merge_patch_update
+from spaceone.config.lib.query import (
+    get_document,
+    get_scope_conditions,
+    iterate_by_batch,
+    query_without_count,
+    to_documents,
+)
+from spaceone.config.lib.version import (
+    check_version,
+    get_version,
+    raw_update_with_version,
+    update_with_version,
+)
+from spaceone.config.lib.watch import watch_configs
+from spaceone.config.manager.config_counter_manager import ConfigCounterManager
+from spaceone.config.manager.config_tombstone_manager import ConfigTombstoneManager
 from spaceone.config.model.user_config.database import UserConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+# A set that collides with a concurrent insert of other data is tried again.
+_SET_ATTEMPTS = 3
+
+# A patch of a config that changed after it was read is applied again.
+_PATCH_ATTEMPTS = 3
+
 
 class UserConfigManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.user_config_model = UserConfig
+        self.config_counter_mgr = ConfigCounterManager()
+        self.config_tombstone_mgr = ConfigTombstoneManager()
 
     def create_user_config(self, params: dict) -> UserConfig:
         def _rollback(vo: UserConfig):
@@ -21,37 +60,485 @@ class UserConfigManager(BaseManager):
             )
             vo.delete()
 
-        user_config_vo: UserConfig = self.user_config_model.create(params)
+        params["data_hash"] = make_data_hash(params.get("data"))
+        params["version"] = 1
+        params.update(pack_data(params.get("data"), self.user_config_model))
+        try:
+            user_config_vo: UserConfig = self.user_config_model.create(params)
+        except ERROR_DB_QUERY as e:
+            # MongoModel.create() reports every failed save as ERROR_DB_QUERY. The
+            # unique index is not a unique_with field, so it does not check first.
+            if isinstance(e.__context__, (NotUniqueError, DuplicateKeyError)):
+                raise ERROR_SAVE_UNIQUE_VALUES(keys=["name", "user_id", "domain_id"])
+            raise
         self.transaction.add_rollback(_rollback, user_config_vo)
+        self.config_counter_mgr.increment(
+            "UserConfig", user_config_vo.domain_id, user_config_vo.user_id
+        )
 
         return user_config_vo
 
     def update_user_config_by_vo(
         self, params: dict, user_config_vo: UserConfig
-    ) -> UserConfig:
+    ) -> Tuple[UserConfig, bool]:
         def _rollback(old_data: dict):
             _LOGGER.info(
-                f'[update_user_config_by_vo._rollback] Revert Data : {old_data["name"]}'
+                f"[update_user_config_by_vo._rollback] Revert Data : {user_config_vo.name}"
             )
-            user_config_vo.update(old_data)
+            update_with_version(user_config_vo, old_data)
+
+        # The VO is already loaded, so a stale expected_version fails without a
+        # write. The write itself is conditional on it as well.
+        expected_version = params.pop("expected_version", None)
+        check_version(user_config_vo, expected_version)
+
+        if "data" in params:
+            params["data_hash"] = make_data_hash(params["data"])
+
+        # Identical re-saves are not written, they would only bump updated_at.
+        if not is_changed(params, user_config_vo):
+            return user_config_vo, False
+
+        if "data" in params:
+            params.update(pack_data(params["data"], self.user_config_model))
+
+        # Snapshot only the fields being updated, they are already loaded on the VO.
+        updatable_fields = self.user_config_model._meta.get("updatable_fields", [])
+        old_data = {
+            key: getattr(user_config_vo, key)
+            for key in params
+            if key in updatable_fields
+        }
+
+        user_config_vo = update_with_version(user_config_vo, params, expected_version)
+        self.transaction.add_rollback(_rollback, old_data)
+
+        return user_config_vo, True
+
+    def patch_user_config_by_vo(
+        self, data_patch: dict, user_config_vo: UserConfig
+    ) -> UserConfig:
+        def _rollback(old_fields: dict):
+            _LOGGER.info(
+                f"[patch_user_config_by_vo._rollback] "
+                f"Revert Data : {user_config_vo.name}"
+            )
+            update_with_version(user_config_vo, old_fields)
+
+        # The patch is applied to the data that was read. If the config changed
+        # since, it is read again and the patch is applied to the new data.
+        for attempt in range(_PATCH_ATTEMPTS):
+            # Only the patched paths of data are written, not the whole field.
+            old_fields = {
+                "data": user_config_vo.data,
+                "data_hash": user_config_vo.data_hash,
+                "compressed_data": user_config_vo.compressed_data,
+                "data_file_id": user_config_vo.data_file_id,
+            }
+            old_data = get_vo_data(user_config_vo)
+            set_fields, unset_fields = make_merge_patch_update(
+                old_data, data_patch, "data"
+            )
+
+            new_data = apply_merge_patch(old_data, data_patch)
+            data_hash = make_data_hash(new_data)
+
+            # Compressed or chunked data cannot be patched in place, it is rewritten.
+            packed_data = pack_data(new_data, self.user_config_model)
+            if user_config_vo.data is None or packed_data["data"] is None:
+                set_fields, unset_fields = packed_data, []
+
+            now = datetime.utcnow()
+            update = {
+                "$set": {**set_fields, "data_hash": data_hash, "updated_at": now}
+            }
+            if unset_fields:
+                update["$unset"] = {path: "" for path in unset_fields}
+
+            try:
+                version = raw_update_with_version(user_config_vo, update)
+                break
+            except ERROR_VERSION_CONFLICT:
+                if attempt == _PATCH_ATTEMPTS - 1:
+                    raise
 
-        self.transaction.add_rollback(_rollback, user_config_vo.to_dict())
+                user_config_vo.reload()
 
-        return user_config_vo.update(params)
+        self.transaction.add_rollback(_rollback, old_fields)
+
+        user_config_vo.data = new_data
+        user_config_vo.data_hash = data_hash
+        user_config_vo.compressed_data = None
+        user_config_vo.data_file_id = None
+        user_config_vo.updated_at = now
+        user_config_vo.version = version
+
+        return user_config_vo
+
+    def set_user_config(self, params: dict) -> Tuple[UserConfig, bool]:
+        def _rollback(old_data: Union[dict, None]):
+            if old_data is None:
+                _LOGGER.info(
+                    f"[set_user_config._rollback] Delete user config : {params['name']}"
+                )
+                self.filter_user_configs(**conditions).delete()
+            else:
+                _LOGGER.info(
+                    f'[set_user_config._rollback] Revert Data : {params["name"]}'
+                )
+                update_with_version(user_config_vo, old_data)
+
+        conditions = {
+            "name": params["name"],
+            "domain_id": params["domain_id"],
+            "user_id": params["user_id"],
+        }
+        updatable_fields = self.user_config_model._meta.get("updatable_fields", [])
+        update_params = {
+            key: value
+            for key, value in params.items()
+            if key in updatable_fields and key not in conditions
+        }
+        update_params["data_hash"] = make_data_hash(update_params.get("data"))
+        packed_data = pack_data(update_params.get("data"), self.user_config_model)
+        update_params.update(packed_data)
+
+        now = datetime.utcnow()
+        update = {f"set__{key}": value for key, value in update_params.items()}
+        update["set__updated_at"] = now
+        update["set_on_insert__created_at"] = now
+        update["inc__version"] = 1
+
+        # Identical re-saves are not written. An unchanged document does not
+        # match the filter, so the upsert collides with it on the unique index.
+        changed_filter = Q(data_hash__ne=update_params["data_hash"])
+        if "tags" in update_params:
+            changed_filter |= Q(tags__ne=update_params["tags"])
+
+        # With expected_version the write only applies to that version. 0 means
+        # the config must not exist yet, it is matched with a range condition
+        # because equality conditions would be copied into an inserted document.
+        expected_version = params.get("expected_version")
+        version_filter = Q()
+        upsert = True
+        if expected_version == 0:
+            version_filter = Q(version__lt=0)
+        elif expected_version is not None:
+            version_filter = Q(version=expected_version)
+            upsert = False
+
+        # Single find-and-modify round trip. The pre-image tells us whether the
+        # document was inserted or updated, and the new state is derived from it.
+        for attempt in range(_SET_ATTEMPTS):
+            try:
+                user_config_vo = (
+                    self.filter_user_configs(**conditions)
+                    .filter(changed_filter & version_filter)
+                    .modify(upsert=upsert, new=False, **update)
+                )
+                break
+            except (NotUniqueError, DuplicateKeyError):
+                # The config exists but did not match. It is unchanged, or it was
+                # inserted by a concurrent request with other data, and then the
+                # next attempt updates it.
+                user_config_vo = self.filter_user_configs(**conditions).first()
+                if user_config_vo is not None:
+                    check_version(user_config_vo, expected_version)
+                    tags = update_params.get("tags", user_config_vo.tags)
+                    unchanged = (
+                        user_config_vo.data_hash == update_params["data_hash"]
+                        and user_config_vo.tags == tags
+                    )
+
+                    if unchanged:
+                        return user_config_vo, False
+
+                if attempt == _SET_ATTEMPTS - 1:
+                    raise
+
+        if user_config_vo is None and not upsert:
+            # Only a failed write reads again: the config is missing, was
+            # modified by someone else, or is unchanged.
+            user_config_vo = self.filter_user_configs(**conditions).first()
+            if user_config_vo is None:
+                raise ERROR_NOT_FOUND(key="name", value=params["name"])
+
+            check_version(user_config_vo, expected_version)
+            return user_config_vo, False
+
+        if user_config_vo is None:
+            user_config_vo = self.user_config_model(
+                **conditions,
+                **update_params,
+                created_at=now,
+                updated_at=now,
+                version=1,
+            )
+            self.transaction.add_rollback(_rollback, None)
+            self.config_counter_mgr.increment(
+                "UserConfig", params["domain_id"], params["user_id"]
+            )
+        else:
+            old_data = {key: getattr(user_config_vo, key) for key in update_params}
+            for key, value in update_params.items():
+                setattr(user_config_vo, key, value)
+            user_config_vo.updated_at = now
+            user_config_vo.version = (user_config_vo.version or 0) + 1
+            self.transaction.add_rollback(_rollback, old_data)
+
+        return user_config_vo, True
+
+    def bulk_write_user_configs(
+        self, operations: List[dict], domain_id: str, user_id: str
+    ) -> List[dict]:
+        def _rollback(journal: dict, created_names: List[str]):
+            _LOGGER.info(
+                f"[bulk_write_user_configs._rollback] "
+                f"Revert {len(journal)} user configs"
+            )
+            requests = [
+                DeleteOne({**conditions, "name": name}) for name in created_names
+            ]
+            # Restored documents still get a new version, versions never go back.
+            requests += [
+                ReplaceOne(
+                    {"_id": document["_id"]},
+                    {**document, "version": document.get("version", 0) + 2},
+                    upsert=True,
+                )
+                for document in journal.values()
+            ]
+            if requests:
+                collection.bulk_write(requests, ordered=False)
+
+        conditions = {
+            "domain_id": domain_id,
+            "user_id": user_id,
+        }
+        if not operations:
+            return []
+
+        names = [operation["name"] for operation in operations]
+        if len(set(names)) != len(names):
+            raise ERROR_INVALID_PARAMETER(
+                key="operations", reason="Each name may appear only once."
+            )
+
+        for operation in operations:
+            if operation["operation"] == "SET" and operation.get("data") is None:
+                raise ERROR_REQUIRED_PARAMETER(key="operations.data")
+
+            # The raw bulk write skips mongoengine, validate like create() does.
+            try:
+                self.user_config_model(
+                    **conditions,
+                    name=operation["name"],
+                    data=operation.get("data"),
+                    tags=operation.get("tags"),
+                ).validate()
+            except ValidationError as e:
+                raise ERROR_INVALID_PARAMETER(key="operations", reason=str(e))
+
+        collection = self.user_config_model._get_collection()
+
+        # Rollback journal: pre-images of every touched document, read in one query.
+        journal = {
+            document["name"]: document
+            for document in collection.find({**conditions, "name": {"$in": names}})
+        }
+
+        now = datetime.utcnow()
+        requests = []
+        for operation in operations:
+            key = {**conditions, "name": operation["name"]}
+            if operation["operation"] == "SET":
+                update_fields = {
+                    **pack_data(operation["data"], self.user_config_model),
+                    "data_hash": make_data_hash(operation["data"]),
+                    "updated_at": now,
+                }
+                if operation.get("tags") is not None:
+                    update_fields["tags"] = operation["tags"]
+
+                requests.append(
+                    UpdateOne(
+                        key,
+                        {
+                            "$set": update_fields,
+                            "$setOnInsert": {"created_at": now},
+                            "$inc": {"version": 1},
+                        },
+                        upsert=True,
+                    )
+                )
+            else:
+                requests.append(DeleteOne(key))
+
+        write_errors = {}
+        upserted_ids = {}
+        try:
+            bulk_result = collection.bulk_write(requests, ordered=False)
+            upserted_ids = bulk_result.upserted_ids
+        except BulkWriteError as e:
+            write_errors = {
+                error["index"]: error["errmsg"] for error in e.details["writeErrors"]
+            }
+            upserted_ids = {
+                upserted["index"]: upserted["_id"] for upserted in e.details["upserted"]
+            }
+
+        results = []
+        created_names = []
+        for index, operation in enumerate(operations):
+            name = operation["name"]
+            result = {"name": name, "operation": operation["operation"]}
+
+            if index in write_errors:
+                result["status"] = "FAILED"
+                result["error"] = write_errors[index]
+            elif operation["operation"] == "SET":
+                if index in upserted_ids:
+                    result["status"] = "CREATED"
+                    created_names.append(name)
+                else:
+                    result["status"] = "UPDATED"
+            else:
+                result["status"] = "DELETED" if name in journal else "NOT_FOUND"
+
+            results.append(result)
+
+        self.transaction.add_rollback(_rollback, journal, created_names)
+
+        deleted_names = [
+            result["name"] for result in results if result["status"] == "DELETED"
+        ]
+        self.config_counter_mgr.increment(
+            "UserConfig", domain_id, user_id, len(created_names) - len(deleted_names)
+        )
+        self.config_tombstone_mgr.add_tombstones(
+            "UserConfig",
+            domain_id,
+            [{"name": name, "user_id": user_id} for name in deleted_names],
+        )
+
+        return results
 
     def delete_user_config_by_vo(self, user_config_vo: UserConfig) -> None:
         user_config_vo.delete()
+        self.config_counter_mgr.decrement(
+            "UserConfig", user_config_vo.domain_id, user_config_vo.user_id
+        )
+        self.config_tombstone_mgr.add_tombstones(
+            "UserConfig",
+            user_config_vo.domain_id,
+            [{"name": user_config_vo.name, "user_id": user_config_vo.user_id}],
+        )
 
     def get_user_config(self, name: str, domain_id: str, user_id: str) -> UserConfig:
         return self.user_config_model.get(
             name=name, domain_id=domain_id, user_id=user_id
         )
 
+    def get_user_config_info(self, name: str, domain_id: str, user_id: str) -> dict:
+        return get_document(
+            self.user_config_model, name=name, domain_id=domain_id, user_id=user_id
+        )
+
+    def get_user_config_version(
+        self, name: str, domain_id: str, user_id: str
+    ) -> Union[int, None]:
+        return get_version(
+            self.user_config_model, name=name, domain_id=domain_id, user_id=user_id
+        )
+
     def filter_user_configs(self, **conditions) -> QuerySet:
         return self.user_config_model.filter(**conditions)
 
-    def list_user_configs(self, query: dict) -> Tuple[QuerySet, int]:
-        return self.user_config_model.query(**query)
+    def list_user_configs(
+        self, query: dict, skip_total_count: bool = False, as_pymongo: bool = False
+    ) -> Tuple[Union[QuerySet, list], Union[int, None]]:
+        if skip_total_count:
+            user_config_vos = query_without_count(
+                self.user_config_model, query, as_pymongo
+            )
+            return user_config_vos, None
+
+        # Unfiltered listings of a whole scope read the maintained counter
+        scope = get_scope_conditions(query, ["domain_id", "user_id"])
+        if scope:
+            user_config_vos = query_without_count(
+                self.user_config_model, query, as_pymongo
+            )
+            total_count = self.config_counter_mgr.get_count(
+                "UserConfig",
+                scope["domain_id"],
+                scope["user_id"],
+                lambda: self.filter_user_configs(**scope).count(),
+            )
+            return user_config_vos, total_count
+
+        user_config_vos, total_count = self.user_config_model.query(**query)
+        if as_pymongo:
+            user_config_vos = to_documents(user_config_vos)
+
+        return user_config_vos, total_count
+
+    def list_user_configs_by_cursor(
+        self,
+        query: dict,
+        page_size: int = None,
+        page_token: str = None,
+        as_pymongo: bool = False,
+    ) -> Tuple[list, Union[str, None]]:
+        return list_by_cursor(
+            self.user_config_model,
+            query,
+            ["name"],
+            page_size,
+            page_token,
+            as_pymongo,
+        )
+
+    def stream_user_configs(
+        self, query: dict, batch_size: int = 100, as_pymongo: bool = False
+    ) -> Iterator[list]:
+        return iterate_by_batch(
+            self.user_config_model, query, batch_size, as_pymongo
+        )
+
+    def list_user_config_changes(
+        self,
+        since: datetime,
+        domain_id: str,
+        user_id: str,
+        page_size: int = None,
+        page_token: str = None,
+    ) -> dict:
+        """Return user configs updated after since and tombstones of the ones
+        deleted after since.
+
+        See ConfigTombstoneManager.list_changes for paging and synced_at.
+        """
+
+        return self.config_tombstone_mgr.list_changes(
+            "UserConfig",
+            self.filter_user_configs(domain_id=domain_id, user_id=user_id),
+            domain_id,
+            since,
+            ["name"],
+            page_size,
+            page_token,
+            user_id=user_id,
+        )
+
+    def watch_user_configs(
+        self, domain_id: str, user_id: str, name_prefixes: List[str] = None
+    ) -> Iterator[Union[dict, None]]:
+        return watch_configs(
+            self.user_config_model,
+            {"domain_id": domain_id, "user_id": user_id},
+            name_prefixes,
+        )
 
     def stat_user_configs(self, query: dict) -> dict:
         return self.user_config_model.stat(**query)
@@ -2,3 +2,5 @@ from spaceone.config.model.domain_config.database import DomainConfig
 from spaceone.config.model.public_config.database import PublicConfig
 from spaceone.config.model.shared_config.database import SharedConfig
 from spaceone.config.model.user_config.database import UserConfig
+from spaceone.config.model.config_counter.database import ConfigCounter
+from spaceone.config.model.config_tombstone.database import ConfigTombstone
@@ -0,0 +1,26 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class ConfigCounter(MongoModel):
+    resource_type = StringField(
+        max_length=40, choices=("UserConfig", "DomainConfig", "PublicConfig")
+    )
+    scope_id = StringField(max_length=40, default="*")
+    count = IntField(default=0)
+    changes = IntField(default=0)
+    initializing = BooleanField(default=False)
+    domain_id = StringField(max_length=40)
+
+    meta = {
+        "updatable_fields": ["count"],
+        "index_background": True,
+        "indexes": [
+            {
+                "fields": ["domain_id", "resource_type", "scope_id"],
+                "name": "COMPOUND_INDEX_FOR_SEARCH",
+                "unique": True,
+            },
+        ],
+    }
@@ -0,0 +1,33 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class ConfigTombstone(MongoModel):
+    resource_type = StringField(
+        max_length=40, choices=("UserConfig", "DomainConfig", "SharedConfig")
+    )
+    name = StringField(max_length=255)
+    user_id = StringField(max_length=40, default=None)
+    workspace_id = StringField(max_length=40, default=None)
+    project_id = StringField(max_length=40, default=None)
+    domain_id = StringField(max_length=40)
+    deleted_at = DateTimeField()
+    expire_at = DateTimeField()
+
+    meta = {
+        "updatable_fields": [],
+        "ordering": ["deleted_at"],
+        "index_background": True,
+        "indexes": [
+            {
+                "fields": ["domain_id", "resource_type", "deleted_at"],
+                "name": "COMPOUND_INDEX_FOR_SYNC",
+            },
+            {
+                "fields": ["expire_at"],
+                "name": "TTL_INDEX",
+                "expireAfterSeconds": 0,
+            },
+        ],
+    }
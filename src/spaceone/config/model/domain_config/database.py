@@ -2,21 +2,59 @@ from mongoengine import *
 
 from spaceone.core.model.mongo_model import MongoModel
 
+from spaceone.config.lib.compression import unpack_document
+
 
 class DomainConfig(MongoModel):
-    name = StringField(max_length=255, unique_with="domain_id")
+    name = StringField(max_length=255)
     data = DictField(default=None)
+    data_hash = StringField(max_length=64, default=None)
+    compressed_data = BinaryField(default=None)
+    data_file_id = ObjectIdField(default=None)
     tags = DictField(default=None)
+    version = IntField(default=None)
     domain_id = StringField(max_length=40)
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
 
     meta = {
-        "updatable_fields": ["name", "data", "tags", "updated_at"],
+        "updatable_fields": [
+            "name",
+            "data",
+            "data_hash",
+            "compressed_data",
+            "data_file_id",
+            "tags",
+            "updated_at",
+        ],
         "minimal_fields": ["name"],
         "ordering": ["name"],
+        "index_background": True,
         "indexes": [
-            "name",
-            "domain_id",
+            {
+                "fields": ["domain_id", "name"],
+                "name": "COMPOUND_INDEX_FOR_SEARCH",
+                "unique": True,
+            },
+            {
+                "fields": ["domain_id", "updated_at"],
+                "name": "COMPOUND_INDEX_FOR_SYNC",
+            },
+            {
+                "fields": ["domain_id", "name", "version"],
+                "name": "COMPOUND_INDEX_FOR_VERSION",
+            },
+            {
+                "fields": ["data_file_id"],
+                "name": "DATA_FILE_INDEX",
+                "partialFilterExpression": {"data_file_id": {"$type": "objectId"}},
+            },
+            {
+                "fields": ["updated_at"],
+                "name": "CHANGE_FEED_INDEX",
+            },
         ],
     }
+
+    def to_dict(self):
+        return unpack_document(super().to_dict(), type(self))
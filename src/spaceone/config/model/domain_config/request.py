@@ -1,13 +1,20 @@
-from typing import Union
-from pydantic import BaseModel
+from datetime import datetime, timezone
+from typing import List, Literal, Union
+from pydantic import BaseModel, Field, validator
 
 __all__ = [
     "DomainConfigCreateRequest",
     "DomainConfigUpdateRequest",
+    "DomainConfigPatchRequest",
     "DomainConfigSetRequest",
     "DomainConfigDeleteRequest",
     "DomainConfigGetRequest",
+    "DomainConfigGetManyRequest",
+    "DomainConfigBulkWriteRequest",
+    "DomainConfigBulkOperation",
     "DomainConfigSearchQueryRequest",
+    "DomainConfigWatchRequest",
+    "DomainConfigListChangesRequest",
 ]
 
 
@@ -22,6 +29,13 @@ class DomainConfigUpdateRequest(BaseModel):
     name: str
     data: Union[dict, None] = None
     tags: Union[dict, None] = None
+    expected_version: Union[int, None] = None
+    domain_id: str
+
+
+class DomainConfigPatchRequest(BaseModel):
+    name: str
+    data: dict
     domain_id: str
 
 
@@ -29,6 +43,19 @@ class DomainConfigSetRequest(BaseModel):
     name: str
     data: dict
     tags: Union[dict, None] = None
+    expected_version: Union[int, None] = None
+    domain_id: str
+
+
+class DomainConfigBulkOperation(BaseModel):
+    operation: Literal["SET", "DELETE"]
+    name: str
+    data: Union[dict, None] = None
+    tags: Union[dict, None] = None
+
+
+class DomainConfigBulkWriteRequest(BaseModel):
+    operations: List[DomainConfigBulkOperation]
     domain_id: str
 
 
@@ -40,9 +67,40 @@ class DomainConfigDeleteRequest(BaseModel):
 class DomainConfigGetRequest(BaseModel):
     name: str
     domain_id: str
+    if_none_match: Union[int, None] = None
+
+
+class DomainConfigGetManyRequest(BaseModel):
+    names: List[str] = Field(..., max_items=100)
+    domain_id: str
 
 
 class DomainConfigSearchQueryRequest(BaseModel):
     query: Union[dict, None] = None
     name: Union[str, None] = None
     domain_id: str
+    page_size: Union[int, None] = None
+    page_token: Union[str, None] = None
+    skip_total_count: bool = False
+    minimal: bool = False
+    only: Union[List[str], None] = None
+
+
+class DomainConfigWatchRequest(BaseModel):
+    name_prefixes: Union[List[str], None] = None
+    domain_id: str
+
+
+class DomainConfigListChangesRequest(BaseModel):
+    since: datetime
+    domain_id: str
+    page_size: Union[int, None] = None
+    page_token: Union[str, None] = None
+
+    @validator("since")
+    def _to_naive_utc(cls, since: datetime) -> datetime:
+        # Configs store naive UTC, an offset-aware since can not be compared with it
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return since
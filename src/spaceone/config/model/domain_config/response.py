@@ -1,10 +1,15 @@
 from datetime import datetime
-from typing import Union, List
-from pydantic import BaseModel
+from typing import Union, List, Literal
+from pydantic import BaseModel, Field
 
 from spaceone.core import utils
 
-__all__ = ["DomainConfigResponse", "DomainConfigsResponse"]
+__all__ = [
+    "DomainConfigResponse",
+    "DomainConfigsResponse",
+    "DomainConfigGetManyResponse",
+    "DomainConfigBulkWriteResponse",
+]
 
 
 class DomainConfigResponse(BaseModel):
@@ -14,6 +19,10 @@ class DomainConfigResponse(BaseModel):
     domain_id: Union[str, None] = None
     created_at: Union[datetime, None] = None
     updated_at: Union[datetime, None] = None
+    # Not in the spaceone-api protos yet, dict_to_message would reject them.
+    version: Union[int, None] = Field(None, exclude=True)
+    written: Union[bool, None] = Field(None, exclude=True)
+    not_modified: Union[bool, None] = Field(None, exclude=True)
 
     def dict(self, *args, **kwargs):
         data = super().dict(*args, **kwargs)
@@ -24,4 +33,22 @@ class DomainConfigResponse(BaseModel):
 
 class DomainConfigsResponse(BaseModel):
     results: List[DomainConfigResponse]
-    total_count: int
+    total_count: Union[int, None] = None
+    # Not in the spaceone-api protos yet, dict_to_message would reject it.
+    next_page_token: Union[str, None] = Field(None, exclude=True)
+
+
+class DomainConfigGetManyResponse(BaseModel):
+    results: List[DomainConfigResponse]
+    missing: List[str]
+
+
+class DomainConfigBulkWriteResult(BaseModel):
+    name: str
+    operation: Literal["SET", "DELETE"]
+    status: Literal["CREATED", "UPDATED", "DELETED", "NOT_FOUND", "FAILED"]
+    error: Union[str, None] = None
+
+
+class DomainConfigBulkWriteResponse(BaseModel):
+    results: List[DomainConfigBulkWriteResult]
@@ -4,19 +4,28 @@ from spaceone.core.model.mongo_model import MongoModel
 
 
 class PublicConfig(MongoModel):
-    name = StringField(max_length=255, unique_with="domain_id")
+    name = StringField(max_length=255)
     data = DictField(default=None)
+    data_hash = StringField(max_length=64, default=None)
     tags = DictField(default=None)
     domain_id = StringField(max_length=40)
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
 
     meta = {
-        "updatable_fields": ["name", "data", "tags", "updated_at"],
+        "updatable_fields": ["name", "data", "data_hash", "tags", "updated_at"],
         "minimal_fields": ["name"],
         "ordering": ["name"],
+        "index_background": True,
         "indexes": [
-            "name",
-            "domain_id",
+            {
+                "fields": ["domain_id", "name"],
+                "name": "COMPOUND_INDEX_FOR_SEARCH",
+                "unique": True,
+            },
+            {
+                "fields": ["updated_at"],
+                "name": "CHANGE_FEED_INDEX",
+            },
         ],
     }
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import List, Union
 from pydantic import BaseModel
 
 __all__ = [
@@ -46,3 +46,8 @@ class PublicConfigSearchQueryRequest(BaseModel):
     query: Union[dict, None] = None
     name: Union[str, None] = None
     domain_id: str
+    page_size: Union[int, None] = None
+    page_token: Union[str, None] = None
+    skip_total_count: bool = False
+    minimal: bool = False
+    only: Union[List[str], None] = None
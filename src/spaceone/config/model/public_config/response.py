@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Union, List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from spaceone.core import utils
 
@@ -14,6 +14,8 @@ class PublicConfigResponse(BaseModel):
     domain_id: Union[str, None] = None
     created_at: Union[datetime, None] = None
     updated_at: Union[datetime, None] = None
+    # Not in the spaceone-api protos yet, dict_to_message would reject it.
+    written: Union[bool, None] = Field(None, exclude=True)
 
     def dict(self, *args, **kwargs):
         data = super().dict(*args, **kwargs)
@@ -24,4 +26,6 @@ class PublicConfigResponse(BaseModel):
 
 class PublicConfigsResponse(BaseModel):
     results: List[PublicConfigResponse]
-    total_count: int
+    total_count: Union[int, None] = None
+    # Not in the spaceone-api protos yet, dict_to_message would reject it.
+    next_page_token: Union[str, None] = Field(None, exclude=True)
@@ -4,11 +4,11 @@ from spaceone.core.model.mongo_model import MongoModel
 
 
 class SharedConfig(MongoModel):
-    name = StringField(
-        max_length=255, unique_with=["domain_id", "workspace_id", "project_id"]
-    )
+    name = StringField(max_length=255)
     data = DictField(default=None)
+    data_hash = StringField(max_length=64, default=None)
     tags = DictField(default=None)
+    version = IntField(default=None)
     resource_group = StringField(
         max_length=40, choices=("DOMAIN", "WORKSPACE", "PROJECT")
     )
@@ -19,7 +19,7 @@ class SharedConfig(MongoModel):
     updated_at = DateTimeField(auto_now=True)
 
     meta = {
-        "updatable_fields": ["name", "data", "tags", "updated_at"],
+        "updatable_fields": ["name", "data", "data_hash", "tags", "updated_at"],
         "minimal_fields": [
             "name",
             "resource_group",
@@ -29,5 +29,30 @@ class SharedConfig(MongoModel):
         ],
         "change_query_keys": {"user_projects": "project_id"},
         "ordering": ["name"],
-        "indexes": ["name", "domain_id", "workspace_id", "project_id"],
+        "index_background": True,
+        "indexes": [
+            {
+                "fields": ["domain_id", "workspace_id", "project_id", "name"],
+                "name": "COMPOUND_INDEX_FOR_SEARCH",
+                "unique": True,
+            },
+            {
+                "fields": ["domain_id", "updated_at"],
+                "name": "COMPOUND_INDEX_FOR_SYNC",
+            },
+            {
+                "fields": [
+                    "domain_id",
+                    "workspace_id",
+                    "project_id",
+                    "name",
+                    "version",
+                ],
+                "name": "COMPOUND_INDEX_FOR_VERSION",
+            },
+            {
+                "fields": ["updated_at"],
+                "name": "CHANGE_FEED_INDEX",
+            },
+        ],
     }
@@ -1,12 +1,17 @@
-from typing import Union, Literal
-from pydantic import BaseModel
+from datetime import datetime, timezone
+from typing import List, Literal, Union
+from pydantic import BaseModel, validator
 
 __all__ = [
     "SharedConfigCreateRequest",
     "SharedConfigUpdateRequest",
+    "SharedConfigPatchRequest",
     "SharedConfigDeleteRequest",
     "SharedConfigGetRequest",
+    "SharedConfigResolveRequest",
     "SharedConfigSearchQueryRequest",
+    "SharedConfigWatchRequest",
+    "SharedConfigListChangesRequest",
     "ResourceGroup",
 ]
 
@@ -27,6 +32,15 @@ class SharedConfigUpdateRequest(BaseModel):
     name: str
     data: Union[dict, None] = None
     tags: Union[dict, None] = None
+    expected_version: Union[int, None] = None
+    domain_id: str
+    workspace_id: Union[str, None] = None
+    user_projects: Union[list, None] = None
+
+
+class SharedConfigPatchRequest(BaseModel):
+    name: str
+    data: dict
     domain_id: str
     workspace_id: Union[str, None] = None
     user_projects: Union[list, None] = None
@@ -44,6 +58,16 @@ class SharedConfigGetRequest(BaseModel):
     domain_id: str
     workspace_id: Union[list, str, None] = None
     user_projects: Union[list, None] = None
+    if_none_match: Union[int, None] = None
+
+
+class SharedConfigResolveRequest(BaseModel):
+    name: str
+    domain_id: str
+    workspace_id: Union[str, None] = None
+    project_id: Union[str, None] = None
+    user_projects: Union[list, None] = None
+    merge: bool = False
 
 
 class SharedConfigSearchQueryRequest(BaseModel):
@@ -53,3 +77,32 @@ class SharedConfigSearchQueryRequest(BaseModel):
     workspace_id: Union[list, str, None] = None
     user_project: Union[list, None] = None
     project_id: Union[str, None] = None
+    page_size: Union[int, None] = None
+    page_token: Union[str, None] = None
+    skip_total_count: bool = False
+    minimal: bool = False
+    only: Union[List[str], None] = None
+
+
+class SharedConfigWatchRequest(BaseModel):
+    name_prefixes: Union[List[str], None] = None
+    domain_id: str
+    workspace_id: Union[list, str, None] = None
+    user_projects: Union[list, None] = None
+
+
+class SharedConfigListChangesRequest(BaseModel):
+    since: datetime
+    domain_id: str
+    workspace_id: Union[list, str, None] = None
+    user_projects: Union[list, None] = None
+    page_size: Union[int, None] = None
+    page_token: Union[str, None] = None
+
+    @validator("since")
+    def _to_naive_utc(cls, since: datetime) -> datetime:
+        # Configs store naive UTC, an offset-aware since can not be compared with it
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return since
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Union, List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from spaceone.core import utils
 
@@ -19,6 +19,10 @@ class SharedConfigResponse(BaseModel):
     project_id: Union[str, None] = None
     created_at: Union[datetime, None] = None
     updated_at: Union[datetime, None] = None
+    # Not in the spaceone-api protos yet, dict_to_message would reject them.
+    version: Union[int, None] = Field(None, exclude=True)
+    written: Union[bool, None] = Field(None, exclude=True)
+    not_modified: Union[bool, None] = Field(None, exclude=True)
 
     def dict(self, *args, **kwargs):
         data = super().dict(*args, **kwargs)
@@ -29,4 +33,6 @@ class SharedConfigResponse(BaseModel):
 
 class SharedConfigsResponse(BaseModel):
     results: List[SharedConfigResponse]
-    total_count: int
+    total_count: Union[int, None] = None
+    # Not in the spaceone-api protos yet, dict_to_message would reject it.
+    next_page_token: Union[str, None] = Field(None, exclude=True)
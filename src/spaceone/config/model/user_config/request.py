@@ -1,13 +1,20 @@
-from typing import Union
-from pydantic import BaseModel
+from datetime import datetime, timezone
+from typing import List, Literal, Union
+from pydantic import BaseModel, Field, validator
 
 __all__ = [
     "UserConfigCreateRequest",
     "UserConfigUpdateRequest",
+    "UserConfigPatchRequest",
     "UserConfigSetRequest",
     "UserConfigDeleteRequest",
     "UserConfigGetRequest",
+    "UserConfigGetManyRequest",
+    "UserConfigBulkWriteRequest",
+    "UserConfigBulkOperation",
     "UserConfigSearchQueryRequest",
+    "UserConfigWatchRequest",
+    "UserConfigListChangesRequest",
 ]
 
 
@@ -23,6 +30,14 @@ class UserConfigUpdateRequest(BaseModel):
     name: str
     data: Union[dict, None] = None
     tags: Union[dict, None] = None
+    expected_version: Union[int, None] = None
+    domain_id: str
+    user_id: str
+
+
+class UserConfigPatchRequest(BaseModel):
+    name: str
+    data: dict
     domain_id: str
     user_id: str
 
@@ -31,6 +46,20 @@ class UserConfigSetRequest(BaseModel):
     name: str
     data: dict
     tags: Union[dict, None] = None
+    expected_version: Union[int, None] = None
+    domain_id: str
+    user_id: str
+
+
+class UserConfigBulkOperation(BaseModel):
+    operation: Literal["SET", "DELETE"]
+    name: str
+    data: Union[dict, None] = None
+    tags: Union[dict, None] = None
+
+
+class UserConfigBulkWriteRequest(BaseModel):
+    operations: List[UserConfigBulkOperation]
     domain_id: str
     user_id: str
 
@@ -45,6 +74,13 @@ class UserConfigGetRequest(BaseModel):
     name: str
     domain_id: str
     user_id: str
+    if_none_match: Union[int, None] = None
+
+
+class UserConfigGetManyRequest(BaseModel):
+    names: List[str] = Field(..., max_items=100)
+    domain_id: str
+    user_id: str
 
 
 class UserConfigSearchQueryRequest(BaseModel):
@@ -52,3 +88,30 @@ class UserConfigSearchQueryRequest(BaseModel):
     name: Union[str, None] = None
     domain_id: str
     user_id: str
+    page_size: Union[int, None] = None
+    page_token: Union[str, None] = None
+    skip_total_count: bool = False
+    minimal: bool = False
+    only: Union[List[str], None] = None
+
+
+class UserConfigWatchRequest(BaseModel):
+    name_prefixes: Union[List[str], None] = None
+    domain_id: str
+    user_id: str
+
+
+class UserConfigListChangesRequest(BaseModel):
+    since: datetime
+    domain_id: str
+    user_id: str
+    page_size: Union[int, None] = None
+    page_token: Union[str, None] = None
+
+    @validator("since")
+    def _to_naive_utc(cls, since: datetime) -> datetime:
+        # Configs store naive UTC, an offset-aware since can not be compared with it
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return since
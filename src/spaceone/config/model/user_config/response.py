@@ -1,10 +1,15 @@
 from datetime import datetime
-from typing import Union, List
-from pydantic import BaseModel
+from typing import Union, List, Literal
+from pydantic import BaseModel, Field
 
 from spaceone.core import utils
 
-__all__ = ["UserConfigResponse", "UserConfigsResponse"]
+__all__ = [
+    "UserConfigResponse",
+    "UserConfigsResponse",
+    "UserConfigGetManyResponse",
+    "UserConfigBulkWriteResponse",
+]
 
 
 class UserConfigResponse(BaseModel):
@@ -15,6 +20,10 @@ class UserConfigResponse(BaseModel):
     user_id: Union[str, None] = None
     created_at: Union[datetime, None] = None
     updated_at: Union[datetime, None] = None
+    # Not in the spaceone-api protos yet, dict_to_message would reject them.
+    version: Union[int, None] = Field(None, exclude=True)
+    written: Union[bool, None] = Field(None, exclude=True)
+    not_modified: Union[bool, None] = Field(None, exclude=True)
 
     def dict(self, *args, **kwargs):
         data = super().dict(*args, **kwargs)
@@ -25,4 +34,22 @@ class UserConfigResponse(BaseModel):
 
 class UserConfigsResponse(BaseModel):
     results: List[UserConfigResponse]
-    total_count: int
+    total_count: Union[int, None] = None
+    # Not in the spaceone-api protos yet, dict_to_message would reject it.
+    next_page_token: Union[str, None] = Field(None, exclude=True)
+
+
+class UserConfigGetManyResponse(BaseModel):
+    results: List[UserConfigResponse]
+    missing: List[str]
+
+
+class UserConfigBulkWriteResult(BaseModel):
+    name: str
+    operation: Literal["SET", "DELETE"]
+    status: Literal["CREATED", "UPDATED", "DELETED", "NOT_FOUND", "FAILED"]
+    error: Union[str, None] = None
+
+
+class UserConfigBulkWriteResponse(BaseModel):
+    results: List[UserConfigBulkWriteResult]
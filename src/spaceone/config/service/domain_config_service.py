@@ -1,8 +1,10 @@
 import logging
-from typing import Union
+from typing import Iterator, Union
 
+from spaceone.core import config
 from spaceone.core.service import *
 
+from spaceone.config.lib.query import set_projection
 from spaceone.config.manager.domain_config_manager import DomainConfigManager
 from spaceone.config.model.domain_config.request import *
 from spaceone.config.model.domain_config.response import *
@@ -10,6 +12,15 @@ from spaceone.config.model.domain_config.database import DomainConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+_GET_MANY_FIELDS = [
+    "name",
+    "data",
+    "tags",
+    "domain_id",
+    "created_at",
+    "updated_at",
+]
+
 
 @authentication_handler
 @authorization_handler
@@ -50,6 +61,7 @@ class DomainConfigService(BaseService):
                 'name': 'str',          # required
                 'data': 'dict',
                 'tags': 'dict',
+                'expected_version': 'int',
                 'domain_id': 'str',     # injected from auth (required)
             }
 
@@ -61,10 +73,36 @@ class DomainConfigService(BaseService):
             params.name, params.domain_id
         )
 
-        domain_config_vo = self.domain_config_mgr.update_domain_config_by_vo(
+        domain_config_vo, written = self.domain_config_mgr.update_domain_config_by_vo(
             params.dict(exclude_unset=True), domain_config_vo
         )
 
+        return DomainConfigResponse(**domain_config_vo.to_dict(), written=written)
+
+    @transaction(permission="config:DomainConfig.write", role_types=["DOMAIN_ADMIN"])
+    @convert_model
+    def patch(self, params: DomainConfigPatchRequest) -> Union[DomainConfigResponse, dict]:
+        """Patch data of domain config with a JSON merge patch (RFC 7386)
+
+        Args:
+            params (DomainConfigPatchRequest): {
+                'name': 'str',          # required
+                'data': 'dict',             # merge patch (required)
+                'domain_id': 'str',     # injected from auth (required)
+            }
+
+        Returns:
+            DomainConfigResponse:
+        """
+
+        domain_config_vo: DomainConfig = self.domain_config_mgr.get_domain_config(
+            params.name, params.domain_id
+        )
+
+        domain_config_vo = self.domain_config_mgr.patch_domain_config_by_vo(
+            params.data, domain_config_vo
+        )
+
         return DomainConfigResponse(**domain_config_vo.to_dict())
 
     @transaction(permission="config:DomainConfig.write", role_types=["DOMAIN_ADMIN"])
@@ -77,6 +115,7 @@ class DomainConfigService(BaseService):
                 'name': 'str',          # required
                 'data': 'dict',         # required
                 'tags': 'dict',
+                'expected_version': 'int',
                 'domain_id': 'str',     # injected from auth (required)
             }
 
@@ -84,18 +123,35 @@ class DomainConfigService(BaseService):
             DomainConfigResponse:
         """
 
-        domain_config_vos = self.domain_config_mgr.filter_domain_configs(
-            name=params.name, domain_id=params.domain_id
+        domain_config_vo, written = self.domain_config_mgr.set_domain_config(
+            params.dict(exclude_unset=True)
         )
 
-        if domain_config_vos.count() == 0:
-            domain_config_vo = self.domain_config_mgr.create_domain_config(params.dict())
-        else:
-            domain_config_vo = self.domain_config_mgr.update_domain_config_by_vo(
-                params.dict(exclude_unset=True), domain_config_vos[0]
-            )
+        return DomainConfigResponse(**domain_config_vo.to_dict(), written=written)
 
-        return DomainConfigResponse(**domain_config_vo.to_dict())
+    @transaction(permission="config:DomainConfig.write", role_types=["DOMAIN_ADMIN"])
+    @convert_model
+    def bulk_write(
+        self, params: DomainConfigBulkWriteRequest
+    ) -> Union[DomainConfigBulkWriteResponse, dict]:
+        """Set or delete many domain configs in a single unordered bulk write
+
+        Args:
+            params (dict): {
+                'operations': 'list',   # required, [{'operation': 'SET' | 'DELETE', 'name', 'data', 'tags'}]
+                'domain_id': 'str',     # injected from auth (required)
+            }
+
+        Returns:
+            DomainConfigBulkWriteResponse:
+        """
+
+        operations = [operation.dict() for operation in params.operations]
+        results = self.domain_config_mgr.bulk_write_domain_configs(
+            operations, params.domain_id
+        )
+
+        return DomainConfigBulkWriteResponse(results=results)
 
     @transaction(permission="config:DomainConfig.write", role_types=["DOMAIN_ADMIN"])
     @convert_model
@@ -127,17 +183,68 @@ class DomainConfigService(BaseService):
             params (dict): {
                 'name': 'str',                # required
                 'domain_id': 'str',           # injected from auth (required)
+                'if_none_match': 'int',       # version the client already has
             }
 
         Returns:
             DomainConfigResponse:
         """
 
-        domain_config_vo: DomainConfig = self.domain_config_mgr.get_domain_config(
+        if params.if_none_match is not None:
+            version = self.domain_config_mgr.get_domain_config_version(
+                params.name, params.domain_id
+            )
+            if version == params.if_none_match:
+                return DomainConfigResponse(
+                    name=params.name, version=version, not_modified=True
+                )
+
+        domain_config_info = self.domain_config_mgr.get_domain_config_info(
             params.name, params.domain_id
         )
 
-        return DomainConfigResponse(**domain_config_vo.to_dict())
+        return DomainConfigResponse(**domain_config_info)
+
+    @transaction(permission="config:DomainConfig.read", role_types=["DOMAIN_ADMIN"])
+    @convert_model
+    def get_many(
+        self, params: DomainConfigGetManyRequest
+    ) -> Union[DomainConfigGetManyResponse, dict]:
+        """Get multiple domain configs by name in a single query
+
+        Args:
+            params (dict): {
+                'names': 'list',              # required, at most 100
+                'domain_id': 'str',           # injected from auth (required)
+            }
+
+        Returns:
+            DomainConfigGetManyResponse:
+        """
+
+        names = list(dict.fromkeys(params.names))
+        query = set_projection(
+            DomainConfig,
+            {
+                "filter": [
+                    {"k": "name", "v": names, "o": "in"},
+                    {"k": "domain_id", "v": params.domain_id, "o": "eq"},
+                ]
+            },
+            only=_GET_MANY_FIELDS,
+        )
+        domain_configs_info, _ = self.domain_config_mgr.list_domain_configs(
+            query, skip_total_count=True, as_pymongo=True
+        )
+        domain_configs_info = {
+            domain_config_info["name"]: domain_config_info
+            for domain_config_info in domain_configs_info
+        }
+
+        results = [domain_configs_info[name] for name in names if name in domain_configs_info]
+        missing = [name for name in names if name not in domain_configs_info]
+
+        return DomainConfigGetManyResponse(results=results, missing=missing)
 
     @transaction(permission="config:DomainConfig.read", role_types=["DOMAIN_ADMIN"])
     @append_query_filter(["name", "domain_id"])
@@ -149,17 +256,108 @@ class DomainConfigService(BaseService):
         Args:
             params (dict): {
                 'query': 'dict (spaceone.api.core.v1.Query)',
+                'page_size': 'int',
+                'page_token': 'str',
+                'skip_total_count': 'bool',
+                'minimal': 'bool',
+                'only': 'list',                     # fields to return
+                'name': 'str',
+                'domain_id': 'str'                  # injected from auth (required)
+            }
+
+        Returns:
+            dict: DomainConfigsResponse fields with raw documents in results
+        """
+
+        query = set_projection(
+            DomainConfig, params.query or {}, params.minimal, params.only
+        )
+
+        if params.page_size or params.page_token:
+            domain_configs_info, next_page_token = self.domain_config_mgr.list_domain_configs_by_cursor(
+                query, params.page_size, params.page_token, as_pymongo=True
+            )
+            return {"results": domain_configs_info, "next_page_token": next_page_token}
+
+        domain_configs_info, total_count = self.domain_config_mgr.list_domain_configs(
+            query, params.skip_total_count, as_pymongo=True
+        )
+        return {"results": domain_configs_info, "total_count": total_count}
+
+    @transaction(permission="config:DomainConfig.read", role_types=["DOMAIN_ADMIN"])
+    @append_query_filter(["name", "domain_id"])
+    @append_keyword_filter(["name"])
+    @convert_model
+    def list_stream(
+        self, params: DomainConfigSearchQueryRequest
+    ) -> Iterator[dict]:
+        """Stream domain configs in batches
+
+        Args:
+            params (dict): {
+                'query': 'dict (spaceone.api.core.v1.Query)',
+                'page_size': 'int',
+                'minimal': 'bool',
+                'only': 'list',                     # fields to return
                 'name': 'str',
                 'domain_id': 'str'                  # injected from auth (required)
             }
 
         Returns:
-            DomainConfigsResponse:
+            Iterator[dict]: DomainConfigsResponse fields, one per batch of page_size domain configs
         """
 
-        query = params.query or {}
-        domain_configs_vos, total_count = self.domain_config_mgr.list_domain_configs(query)
-        domain_configs_info = [
-            domain_config_vo.to_dict() for domain_config_vo in domain_configs_vos
-        ]
-        return DomainConfigsResponse(results=domain_configs_info, total_count=total_count)
+        query = set_projection(
+            DomainConfig, params.query or {}, params.minimal, params.only
+        )
+        batch_size = params.page_size or config.get_global("LIST_STREAM_BATCH_SIZE", 100)
+
+        for domain_configs_info in self.domain_config_mgr.stream_domain_configs(
+            query, batch_size, as_pymongo=True
+        ):
+            yield {"results": domain_configs_info}
+
+    @transaction(permission="config:DomainConfig.read", role_types=["DOMAIN_ADMIN"])
+    @convert_model
+    def list_changes(self, params: DomainConfigListChangesRequest) -> dict:
+        """List domain configs changed since a point in time, including deletes
+
+        Args:
+            params (DomainConfigListChangesRequest): {
+                'since': 'datetime',    # required
+                'page_size': 'int',     # changes per page
+                'page_token': 'str',    # next_page_token of the previous page
+                'domain_id': 'str',     # injected from auth (required)
+            }
+
+        Returns:
+            dict: {
+                'results': 'list',          # raw documents updated after since
+                'deleted': 'list',          # tombstones of configs deleted after since
+                'synced_at': 'datetime',    # since of the next call after the last page
+                'next_page_token': 'str'    # None on the last page
+            }
+        """
+
+        return self.domain_config_mgr.list_domain_config_changes(
+            params.since, params.domain_id, params.page_size, params.page_token
+        )
+
+    @transaction(permission="config:DomainConfig.read", role_types=["DOMAIN_ADMIN"])
+    @convert_model
+    def watch(self, params: DomainConfigWatchRequest) -> Iterator[Union[dict, None]]:
+        """Watch changes of domain configs
+
+        Args:
+            params (DomainConfigWatchRequest): {
+                'name_prefixes': 'list',
+                'domain_id': 'str',     # injected from auth (required)
+            }
+
+        Returns:
+            Iterator[dict]: watch events, None while idle
+        """
+
+        return self.domain_config_mgr.watch_domain_configs(
+            params.domain_id, params.name_prefixes
+        )
@@ -1,8 +1,10 @@
 import logging
-from typing import Union
+from typing import Iterator, Union
 
+from spaceone.core import config
 from spaceone.core.service import *
 
+from spaceone.config.lib.query import set_projection
 from spaceone.config.manager.public_config_manager import PublicConfigManager
 from spaceone.config.model.public_config.request import *
 from spaceone.config.model.public_config.response import *
@@ -61,11 +63,11 @@ class PublicConfigService(BaseService):
             params.name, params.domain_id
         )
 
-        public_config_vo = self.public_config_mgr.update_public_config_by_vo(
+        public_config_vo, written = self.public_config_mgr.update_public_config_by_vo(
             params.dict(exclude_unset=True), public_config_vo
         )
 
-        return PublicConfigResponse(**public_config_vo.to_dict())
+        return PublicConfigResponse(**public_config_vo.to_dict(), written=written)
 
     @transaction(permission="config:PublicConfig.write", role_types=["DOMAIN_ADMIN"])
     @convert_model
@@ -84,18 +86,11 @@ class PublicConfigService(BaseService):
             PublicConfigResponse:
         """
 
-        public_config_vos = self.public_config_mgr.filter_public_configs(
-            name=params.name, domain_id=params.domain_id
+        public_config_vo, written = self.public_config_mgr.set_public_config(
+            params.dict(exclude_unset=True)
         )
 
-        if public_config_vos.count() == 0:
-            public_config_vo = self.public_config_mgr.create_public_config(params.dict())
-        else:
-            public_config_vo = self.public_config_mgr.update_public_config_by_vo(
-                params.dict(exclude_unset=True), public_config_vos[0]
-            )
-
-        return PublicConfigResponse(**public_config_vo.to_dict())
+        return PublicConfigResponse(**public_config_vo.to_dict(), written=written)
 
     @transaction(permission="config:PublicConfig.write", role_types=["DOMAIN_ADMIN"])
     @convert_model
@@ -133,11 +128,11 @@ class PublicConfigService(BaseService):
             PublicConfigResponse:
         """
 
-        public_config_vo: PublicConfig = self.public_config_mgr.get_public_config(
+        public_config_info = self.public_config_mgr.get_public_config_info(
             params.name, params.domain_id
         )
 
-        return PublicConfigResponse(**public_config_vo.to_dict())
+        return PublicConfigResponse(**public_config_info)
 
     @transaction(exclude=["authentication", "authorization", "mutation"])
     @append_query_filter(["name", "domain_id"])
@@ -149,17 +144,63 @@ class PublicConfigService(BaseService):
         Args:
             params (dict): {
                 'query': 'dict (spaceone.api.core.v1.Query)',
+                'page_size': 'int',
+                'page_token': 'str',
+                'skip_total_count': 'bool',
+                'minimal': 'bool',
+                'only': 'list',                     # fields to return
                 'name': 'str',
                 'domain_id': 'str'                  # injected from auth (required)
             }
 
         Returns:
-            PublicConfigsResponse:
+            dict: PublicConfigsResponse fields with raw documents in results
         """
 
-        query = params.query or {}
-        public_configs_vos, total_count = self.public_config_mgr.list_public_configs(query)
-        public_configs_info = [
-            public_config_vo.to_dict() for public_config_vo in public_configs_vos
-        ]
-        return PublicConfigsResponse(results=public_configs_info, total_count=total_count)
+        query = set_projection(
+            PublicConfig, params.query or {}, params.minimal, params.only
+        )
+
+        if params.page_size or params.page_token:
+            public_configs_info, next_page_token = self.public_config_mgr.list_public_configs_by_cursor(
+                query, params.page_size, params.page_token, as_pymongo=True
+            )
+            return {"results": public_configs_info, "next_page_token": next_page_token}
+
+        public_configs_info, total_count = self.public_config_mgr.list_public_config_infos(
+            query, params.skip_total_count
+        )
+        return {"results": public_configs_info, "total_count": total_count}
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    @append_query_filter(["name", "domain_id"])
+    @append_keyword_filter(["name"])
+    @convert_model
+    def list_stream(
+        self, params: PublicConfigSearchQueryRequest
+    ) -> Iterator[dict]:
+        """Stream public configs in batches
+
+        Args:
+            params (dict): {
+                'query': 'dict (spaceone.api.core.v1.Query)',
+                'page_size': 'int',
+                'minimal': 'bool',
+                'only': 'list',                     # fields to return
+                'name': 'str',
+                'domain_id': 'str'                  # injected from auth (required)
+            }
+
+        Returns:
+            Iterator[dict]: PublicConfigsResponse fields, one per batch of page_size public configs
+        """
+
+        query = set_projection(
+            PublicConfig, params.query or {}, params.minimal, params.only
+        )
+        batch_size = params.page_size or config.get_global("LIST_STREAM_BATCH_SIZE", 100)
+
+        for public_configs_info in self.public_config_mgr.stream_public_configs(
+            query, batch_size, as_pymongo=True
+        ):
+            yield {"results": public_configs_info}
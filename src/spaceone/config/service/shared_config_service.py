@@ -1,12 +1,15 @@
 import logging
-from typing import Union
+from typing import Iterator, Union
 
-from spaceone.core.error import ERROR_REQUIRED_PARAMETER
+from spaceone.core import config
+from spaceone.core.error import ERROR_PERMISSION_DENIED, ERROR_REQUIRED_PARAMETER
 from spaceone.core.service import *
 
+from spaceone.config.lib.query import set_projection
 from spaceone.config.manager.identity_manager import IdentityManager
 from spaceone.config.manager.shared_config_manager import SharedConfigManager
 from spaceone.config.model.shared_config.response import *
+from spaceone.config.model.shared_config.database import SharedConfig
 from spaceone.config.model.shared_config.request import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,7 +24,15 @@ class SharedConfigService(BaseService):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.shared_config_mgr = SharedConfigManager()
-        self.identity_mgr = IdentityManager()
+        self._identity_mgr = None
+
+    @property
+    def identity_mgr(self) -> IdentityManager:
+        # Only create and resolve of PROJECT and WORKSPACE configs use identity.
+        if self._identity_mgr is None:
+            self._identity_mgr = IdentityManager()
+
+        return self._identity_mgr
 
     @transaction(permission="config:SharedConfig.write",
                  role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"])
@@ -76,6 +87,7 @@ class SharedConfigService(BaseService):
                 'name': 'str',              # required
                 'data': 'dict',
                 'tags': 'dict',
+                'expected_version': 'int',
                 'domain_id': 'str',         # injected from auth (required)
                 'workspace_id': 'str'       # injected from auth
                 "user_projects": 'list',    # injected from auth
@@ -93,10 +105,43 @@ class SharedConfigService(BaseService):
             params.name, domain_id, workspace_id, user_projects
         )
 
-        shared_config_vo = self.shared_config_mgr.update_shared_config_by_vo(
+        shared_config_vo, written = self.shared_config_mgr.update_shared_config_by_vo(
             params.dict(exclude_unset=True), shared_config_vo
         )
 
+        return SharedConfigResponse(**shared_config_vo.to_dict(), written=written)
+
+    @transaction(permission="config:SharedConfig.write",
+                 role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"])
+    @convert_model
+    def patch(self, params: SharedConfigPatchRequest) -> Union[SharedConfigResponse, dict]:
+        """Patch data of shared config with a JSON merge patch (RFC 7386)
+
+        Args:
+            params (SharedConfigPatchRequest): {
+                'name': 'str',              # required
+                'data': 'dict',             # merge patch (required)
+                'domain_id': 'str',         # injected from auth (required)
+                'workspace_id': 'str'       # injected from auth
+                "user_projects": 'list',    # injected from auth
+            }
+
+        Returns:
+            SharedConfigResponse:
+        """
+
+        domain_id = params.domain_id
+        workspace_id = params.workspace_id
+        user_projects = params.user_projects
+
+        shared_config_vo = self.shared_config_mgr.get_shared_config(
+            params.name, domain_id, workspace_id, user_projects
+        )
+
+        shared_config_vo = self.shared_config_mgr.patch_shared_config_by_vo(
+            params.data, shared_config_vo
+        )
+
         return SharedConfigResponse(**shared_config_vo.to_dict())
 
     @transaction(permission="config:SharedConfig.write",
@@ -140,6 +185,7 @@ class SharedConfigService(BaseService):
                 'domain_id': 'str',         # injected from auth (required)
                 'workspace_id': 'str',      # injected from auth
                 'user_projects': 'list',    # injected from auth
+                'if_none_match': 'int',     # version the client already has
             }
 
         Returns:
@@ -150,11 +196,54 @@ class SharedConfigService(BaseService):
         workspace_id = params.workspace_id
         user_projects = params.user_projects
 
-        shared_config_vo = self.shared_config_mgr.get_shared_config(
+        if params.if_none_match is not None:
+            version = self.shared_config_mgr.get_shared_config_version(
+                params.name, domain_id, workspace_id, user_projects
+            )
+            if version == params.if_none_match:
+                return SharedConfigResponse(
+                    name=params.name, version=version, not_modified=True
+                )
+
+        shared_config_info = self.shared_config_mgr.get_shared_config_info(
             params.name, domain_id, workspace_id, user_projects
         )
 
-        return SharedConfigResponse(**shared_config_vo.to_dict())
+        return SharedConfigResponse(**shared_config_info)
+
+    @transaction(permission="config:SharedConfig.read",
+                 role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"])
+    @convert_model
+    def resolve(self, params: SharedConfigResolveRequest) -> Union[SharedConfigResponse, dict]:
+        """Resolve the effective shared config across PROJECT, WORKSPACE and DOMAIN
+
+        Args:
+            params (dict): {
+                'name': 'str',              # required
+                'domain_id': 'str',         # injected from auth (required)
+                'workspace_id': 'str',      # injected from auth
+                'user_projects': 'list',    # injected from auth
+                'project_id': 'str',
+                'merge': 'bool',            # deep merge data from DOMAIN down to the match
+            }
+
+        Returns:
+            SharedConfigResponse:
+        """
+
+        if params.project_id:
+            if params.user_projects is not None and params.project_id not in params.user_projects:
+                raise ERROR_PERMISSION_DENIED()
+
+            if params.workspace_id is None:
+                project_info = self.identity_mgr.get_project(params.project_id, params.domain_id)
+                params.workspace_id = project_info["workspace_id"]
+
+        shared_config_info = self.shared_config_mgr.resolve_shared_config(
+            params.name, params.domain_id, params.workspace_id, params.project_id, params.merge
+        )
+
+        return SharedConfigResponse(**shared_config_info)
 
     @transaction(permission="config:SharedConfig.read",
                  role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"])
@@ -169,6 +258,11 @@ class SharedConfigService(BaseService):
         Args:
             params (dict): {
                 'query': 'dict (spaceone.api.core.v2.Query)'
+                'page_size': 'int',
+                'page_token': 'str',
+                'skip_total_count': 'bool',
+                'minimal': 'bool',
+                'only': 'list',                     # fields to return
                 'name': 'str',
                 'domain_id': 'str',                             # injected from auth (required)
                 'workspace_id': 'str',                          # injected from auth
@@ -177,10 +271,122 @@ class SharedConfigService(BaseService):
             }
 
         Returns:
-            SharedConfigsResponse:
+            dict: SharedConfigsResponse fields with raw documents in results
         """
 
-        query = params.query or {}
-        shared_config_vos, total_count = self.shared_config_mgr.list_shared_configs(query)
-        shared_configs_info = [shared_config_vo.to_dict() for shared_config_vo in shared_config_vos]
-        return SharedConfigsResponse(results=shared_configs_info, total_count=total_count)
+        query = set_projection(
+            SharedConfig, params.query or {}, params.minimal, params.only
+        )
+
+        if params.page_size or params.page_token:
+            shared_configs_info, next_page_token = self.shared_config_mgr.list_shared_configs_by_cursor(
+                query, params.page_size, params.page_token, as_pymongo=True
+            )
+            return {"results": shared_configs_info, "next_page_token": next_page_token}
+
+        shared_configs_info, total_count = self.shared_config_mgr.list_shared_configs(
+            query, params.skip_total_count, as_pymongo=True
+        )
+        return {"results": shared_configs_info, "total_count": total_count}
+
+    @transaction(permission="config:SharedConfig.read",
+                 role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"])
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "user_projects", "*")
+    @append_query_filter(["name", "domain_id", "workspace_id", "users_project", "project_id"])
+    @append_keyword_filter(["name"])
+    @convert_model
+    def list_stream(
+        self, params: SharedConfigSearchQueryRequest
+    ) -> Iterator[dict]:
+        """Stream shared configs in batches
+
+        Args:
+            params (dict): {
+                'query': 'dict (spaceone.api.core.v2.Query)'
+                'page_size': 'int',
+                'minimal': 'bool',
+                'only': 'list',                     # fields to return
+                'name': 'str',
+                'domain_id': 'str',                             # injected from auth (required)
+                'workspace_id': 'str',                          # injected from auth
+                'user_projects': 'list',                        # injected from auth
+                'project_id': 'str',
+            }
+
+        Returns:
+            Iterator[dict]: SharedConfigsResponse fields, one per batch of page_size shared configs
+        """
+
+        query = set_projection(
+            SharedConfig, params.query or {}, params.minimal, params.only
+        )
+        batch_size = params.page_size or config.get_global("LIST_STREAM_BATCH_SIZE", 100)
+
+        for shared_configs_info in self.shared_config_mgr.stream_shared_configs(
+            query, batch_size, as_pymongo=True
+        ):
+            yield {"results": shared_configs_info}
+
+    @transaction(permission="config:SharedConfig.read",
+                 role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"])
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "user_projects", "*")
+    @convert_model
+    def list_changes(self, params: SharedConfigListChangesRequest) -> dict:
+        """List shared configs changed since a point in time, including deletes
+
+        Args:
+            params (SharedConfigListChangesRequest): {
+                'since': 'datetime',        # required
+                'page_size': 'int',         # changes per page
+                'page_token': 'str',        # next_page_token of the previous page
+                'domain_id': 'str',         # injected from auth (required)
+                'workspace_id': 'str',      # injected from auth
+                'user_projects': 'list',    # injected from auth
+            }
+
+        Returns:
+            dict: {
+                'results': 'list',          # raw documents updated after since
+                'deleted': 'list',          # tombstones of configs deleted after since
+                'synced_at': 'datetime',    # since of the next call after the last page
+                'next_page_token': 'str'    # None on the last page
+            }
+        """
+
+        return self.shared_config_mgr.list_shared_config_changes(
+            params.since,
+            params.domain_id,
+            params.workspace_id,
+            params.user_projects,
+            params.page_size,
+            params.page_token,
+        )
+
+    @transaction(permission="config:SharedConfig.read",
+                 role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"])
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "user_projects", "*")
+    @convert_model
+    def watch(self, params: SharedConfigWatchRequest) -> Iterator[Union[dict, None]]:
+        """Watch changes of shared configs
+
+        Args:
+            params (SharedConfigWatchRequest): {
+                'name_prefixes': 'list',
+                'domain_id': 'str',         # injected from auth (required)
+                'workspace_id': 'str',      # injected from auth
+                'user_projects': 'list',    # injected from auth
+            }
+
+        Returns:
+            Iterator[dict]: watch events, None while idle
+        """
+
+        return self.shared_config_mgr.watch_shared_configs(
+            params.domain_id,
+            params.workspace_id,
+            params.user_projects,
+            params.name_prefixes,
+        )
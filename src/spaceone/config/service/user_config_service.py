@@ -1,8 +1,10 @@
 import logging
-from typing import Union
+from typing import Iterator, Union
 
+from spaceone.core import config
 from spaceone.core.service import *
 
+from spaceone.config.lib.query import set_projection
 from spaceone.config.manager.user_config_manager import UserConfigManager
 from spaceone.config.model.user_config.request import *
 from spaceone.config.model.user_config.response import *
@@ -10,6 +12,16 @@ from spaceone.config.model.user_config.database import UserConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+_GET_MANY_FIELDS = [
+    "name",
+    "data",
+    "tags",
+    "domain_id",
+    "user_id",
+    "created_at",
+    "updated_at",
+]
+
 
 @authentication_handler
 @authorization_handler
@@ -51,6 +63,7 @@ class UserConfigService(BaseService):
                 'name': 'str',          # required
                 'data': 'dict',
                 'tags': 'dict',
+                'expected_version': 'int',
                 'domain_id': 'str',     # injected from auth (required)
                 'user_id': 'str',       # injected from auth (required)
             }
@@ -63,10 +76,37 @@ class UserConfigService(BaseService):
             params.name, params.domain_id, params.user_id
         )
 
-        user_config_vo = self.user_config_mgr.update_user_config_by_vo(
+        user_config_vo, written = self.user_config_mgr.update_user_config_by_vo(
             params.dict(exclude_unset=True), user_config_vo
         )
 
+        return UserConfigResponse(**user_config_vo.to_dict(), written=written)
+
+    @transaction(permission="config:UserConfig.write", role_types=["USER"])
+    @convert_model
+    def patch(self, params: UserConfigPatchRequest) -> Union[UserConfigResponse, dict]:
+        """Patch data of user config with a JSON merge patch (RFC 7386)
+
+        Args:
+            params (UserConfigPatchRequest): {
+                'name': 'str',          # required
+                'data': 'dict',             # merge patch (required)
+                'domain_id': 'str',     # injected from auth (required)
+                'user_id': 'str',       # injected from auth (required)
+            }
+
+        Returns:
+            UserConfigResponse:
+        """
+
+        user_config_vo: UserConfig = self.user_config_mgr.get_user_config(
+            params.name, params.domain_id, params.user_id
+        )
+
+        user_config_vo = self.user_config_mgr.patch_user_config_by_vo(
+            params.data, user_config_vo
+        )
+
         return UserConfigResponse(**user_config_vo.to_dict())
 
     @transaction(permission="config:UserConfig.write", role_types=["USER"])
@@ -79,6 +119,7 @@ class UserConfigService(BaseService):
                 'name': 'str',          # required
                 'data': 'dict',         # required
                 'tags': 'dict',
+                'expected_version': 'int',
                 'domain_id': 'str',     # injected from auth (required)
                 'user_id': 'str',       # injected from auth (required)
             }
@@ -87,18 +128,36 @@ class UserConfigService(BaseService):
             UserConfigResponse:
         """
 
-        user_config_vos = self.user_config_mgr.filter_user_configs(
-            name=params.name, domain_id=params.domain_id, user_id=params.user_id
+        user_config_vo, written = self.user_config_mgr.set_user_config(
+            params.dict(exclude_unset=True)
         )
 
-        if user_config_vos.count() == 0:
-            user_config_vo = self.user_config_mgr.create_user_config(params.dict())
-        else:
-            user_config_vo = self.user_config_mgr.update_user_config_by_vo(
-                params.dict(exclude_unset=True), user_config_vos[0]
-            )
+        return UserConfigResponse(**user_config_vo.to_dict(), written=written)
 
-        return UserConfigResponse(**user_config_vo.to_dict())
+    @transaction(permission="config:UserConfig.write", role_types=["USER"])
+    @convert_model
+    def bulk_write(
+        self, params: UserConfigBulkWriteRequest
+    ) -> Union[UserConfigBulkWriteResponse, dict]:
+        """Set or delete many user configs in a single unordered bulk write
+
+        Args:
+            params (dict): {
+                'operations': 'list',   # required, [{'operation': 'SET' | 'DELETE', 'name', 'data', 'tags'}]
+                'domain_id': 'str',     # injected from auth (required)
+                'user_id': 'str',       # injected from auth (required)
+            }
+
+        Returns:
+            UserConfigBulkWriteResponse:
+        """
+
+        operations = [operation.dict() for operation in params.operations]
+        results = self.user_config_mgr.bulk_write_user_configs(
+            operations, params.domain_id, params.user_id
+        )
+
+        return UserConfigBulkWriteResponse(results=results)
 
     @transaction(permission="config:UserConfig.write", role_types=["USER"])
     @convert_model
@@ -132,17 +191,70 @@ class UserConfigService(BaseService):
                 'name': 'str',                # required
                 'domain_id': 'str',           # injected from auth (required)
                 'user_id': 'str',             # injected from auth (required)
+                'if_none_match': 'int',       # version the client already has
             }
 
         Returns:
             UserConfigResponse:
         """
 
-        user_config_vo: UserConfig = self.user_config_mgr.get_user_config(
+        if params.if_none_match is not None:
+            version = self.user_config_mgr.get_user_config_version(
+                params.name, params.domain_id, params.user_id
+            )
+            if version == params.if_none_match:
+                return UserConfigResponse(
+                    name=params.name, version=version, not_modified=True
+                )
+
+        user_config_info = self.user_config_mgr.get_user_config_info(
             params.name, params.domain_id, params.user_id
         )
 
-        return UserConfigResponse(**user_config_vo.to_dict())
+        return UserConfigResponse(**user_config_info)
+
+    @transaction(permission="config:UserConfig.read", role_types=["USER"])
+    @convert_model
+    def get_many(
+        self, params: UserConfigGetManyRequest
+    ) -> Union[UserConfigGetManyResponse, dict]:
+        """Get multiple user configs by name in a single query
+
+        Args:
+            params (dict): {
+                'names': 'list',              # required, at most 100
+                'domain_id': 'str',           # injected from auth (required)
+                'user_id': 'str',             # injected from auth (required)
+            }
+
+        Returns:
+            UserConfigGetManyResponse:
+        """
+
+        names = list(dict.fromkeys(params.names))
+        query = set_projection(
+            UserConfig,
+            {
+                "filter": [
+                    {"k": "name", "v": names, "o": "in"},
+                    {"k": "domain_id", "v": params.domain_id, "o": "eq"},
+                    {"k": "user_id", "v": params.user_id, "o": "eq"},
+                ]
+            },
+            only=_GET_MANY_FIELDS,
+        )
+        user_configs_info, _ = self.user_config_mgr.list_user_configs(
+            query, skip_total_count=True, as_pymongo=True
+        )
+        user_configs_info = {
+            user_config_info["name"]: user_config_info
+            for user_config_info in user_configs_info
+        }
+
+        results = [user_configs_info[name] for name in names if name in user_configs_info]
+        missing = [name for name in names if name not in user_configs_info]
+
+        return UserConfigGetManyResponse(results=results, missing=missing)
 
     @transaction(permission="config:UserConfig.read", role_types=["USER"])
     @append_query_filter(["name", "domain_id", "user_id"])
@@ -154,18 +266,116 @@ class UserConfigService(BaseService):
         Args:
             params (dict): {
                 'query': 'dict (spaceone.api.core.v1.Query)',
+                'page_size': 'int',
+                'page_token': 'str',
+                'skip_total_count': 'bool',
+                'minimal': 'bool',
+                'only': 'list',                     # fields to return
                 'name': 'str',
                 'domain_id': 'str'                  # injected from auth (required)
                 'user_id': 'str',                   # injected from auth (required)
             }
 
         Returns:
-            UserConfigsResponse:
+            dict: UserConfigsResponse fields with raw documents in results
+        """
+
+        query = set_projection(
+            UserConfig, params.query or {}, params.minimal, params.only
+        )
+
+        if params.page_size or params.page_token:
+            user_configs_info, next_page_token = self.user_config_mgr.list_user_configs_by_cursor(
+                query, params.page_size, params.page_token, as_pymongo=True
+            )
+            return {"results": user_configs_info, "next_page_token": next_page_token}
+
+        user_configs_info, total_count = self.user_config_mgr.list_user_configs(
+            query, params.skip_total_count, as_pymongo=True
+        )
+        return {"results": user_configs_info, "total_count": total_count}
+
+    @transaction(permission="config:UserConfig.read", role_types=["USER"])
+    @append_query_filter(["name", "domain_id", "user_id"])
+    @append_keyword_filter(["name"])
+    @convert_model
+    def list_stream(
+        self, params: UserConfigSearchQueryRequest
+    ) -> Iterator[dict]:
+        """Stream user configs in batches
+
+        Args:
+            params (dict): {
+                'query': 'dict (spaceone.api.core.v1.Query)',
+                'page_size': 'int',
+                'minimal': 'bool',
+                'only': 'list',                     # fields to return
+                'name': 'str',
+                'domain_id': 'str'                  # injected from auth (required)
+                'user_id': 'str',                   # injected from auth (required)
+            }
+
+        Returns:
+            Iterator[dict]: UserConfigsResponse fields, one per batch of page_size user configs
+        """
+
+        query = set_projection(
+            UserConfig, params.query or {}, params.minimal, params.only
+        )
+        batch_size = params.page_size or config.get_global("LIST_STREAM_BATCH_SIZE", 100)
+
+        for user_configs_info in self.user_config_mgr.stream_user_configs(
+            query, batch_size, as_pymongo=True
+        ):
+            yield {"results": user_configs_info}
+
+    @transaction(permission="config:UserConfig.read", role_types=["USER"])
+    @convert_model
+    def list_changes(self, params: UserConfigListChangesRequest) -> dict:
+        """List user configs changed since a point in time, including deletes
+
+        Args:
+            params (UserConfigListChangesRequest): {
+                'since': 'datetime',                # required
+                'page_size': 'int',                 # changes per page
+                'page_token': 'str',                # next_page_token of the previous page
+                'domain_id': 'str'                  # injected from auth (required)
+                'user_id': 'str',                   # injected from auth (required)
+            }
+
+        Returns:
+            dict: {
+                'results': 'list',          # raw documents updated after since
+                'deleted': 'list',          # tombstones of configs deleted after since
+                'synced_at': 'datetime',    # since of the next call after the last page
+                'next_page_token': 'str'    # None on the last page
+            }
         """
 
-        query = params.query or {}
-        user_configs_vos, total_count = self.user_config_mgr.list_user_configs(query)
-        user_configs_info = [
-            user_config_vo.to_dict() for user_config_vo in user_configs_vos
-        ]
-        return UserConfigsResponse(results=user_configs_info, total_count=total_count)
+        return self.user_config_mgr.list_user_config_changes(
+            params.since,
+            params.domain_id,
+            params.user_id,
+            params.page_size,
+            params.page_token,
+        )
+
+    @transaction(permission="config:UserConfig.read", role_types=["USER"])
+    @convert_model
+    def watch(self, params: UserConfigWatchRequest) -> Iterator[Union[dict, None]]:
+        """Watch changes of user configs
+
+        Args:
+            params (UserConfigWatchRequest): {
+                'name_prefixes': 'list',
+                'domain_id': 'str'                  # injected from auth (required)
+                'user_id': 'str',                   # injected from auth (required)
+            }
+
+        Returns:
+            Iterator[dict]: watch events, None while idle
+        """
+
+        return self.user_config_mgr.watch_user_configs(
+            params.domain_id, params.user_id, params.name_prefixes
+        )
@@ -0,0 +1,85 @@
+"""Compare VO hydration with raw pymongo reads.
+
+    python -m test.benchmark.benchmark_hydration
+
+Set TEST_MONGO_HOST to measure against a real mongod, mongomock is used
+otherwise. Each row is the cost per document of reading one list page as
+VOs plus to_dict() and as raw documents with as_pymongo().
+"""
+
+import os
+import timeit
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core import utils
+from spaceone.config.model import UserConfig
+
+MONGO_HOST = os.environ.get("TEST_MONGO_HOST")
+NUMBER = 10
+COUNT = 1000
+
+
+def _insert_documents(domain_id: str, data_keys: int) -> None:
+    data = {
+        f"key-{key}": {"value": utils.random_string(), "enabled": True}
+        for key in range(data_keys)
+    }
+    UserConfig.objects.insert(
+        [
+            UserConfig(
+                name=f"config-{index}",
+                data=data,
+                tags={"env": "prod"},
+                domain_id=domain_id,
+                user_id="user@example.com",
+            )
+            for index in range(COUNT)
+        ],
+        load_bulk=False,
+    )
+
+
+def _read_vos(domain_id: str) -> list:
+    return [vo.to_dict() for vo in UserConfig.objects.filter(domain_id=domain_id)]
+
+
+def _read_raw(domain_id: str) -> list:
+    return list(UserConfig.objects.filter(domain_id=domain_id).as_pymongo())
+
+
+def main():
+    if MONGO_HOST:
+        connect("benchmark", host=MONGO_HOST)
+    else:
+        connect(
+            "benchmark",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    print(f"{'data keys':>10} {'vo (us/doc)':>12} {'raw (us/doc)':>13} {'ratio':>6}")
+
+    try:
+        for data_keys in [1, 10, 100, 1000]:
+            domain_id = utils.generate_id("domain")
+            _insert_documents(domain_id, data_keys)
+
+            vo_time = timeit.timeit(lambda: _read_vos(domain_id), number=NUMBER)
+            raw_time = timeit.timeit(lambda: _read_raw(domain_id), number=NUMBER)
+
+            print(
+                f"{data_keys:>10} "
+                f"{vo_time / NUMBER / COUNT * 1e6:>12.1f} "
+                f"{raw_time / NUMBER / COUNT * 1e6:>13.1f} "
+                f"{vo_time / raw_time:>6.1f}"
+            )
+
+            UserConfig.objects.filter(domain_id=domain_id).delete()
+    finally:
+        disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measure what pack_data adds to a write.
+
+    python -m test.benchmark.benchmark_pack_data
+
+With CHUNKED_STORAGE enabled every write BSON-encodes data once just to
+compare its size with the thresholds. Each row is the cost of that pack_data
+call next to the cost of saving the same document, for data well below the
+thresholds. Set TEST_MONGO_HOST to measure against a real mongod, mongomock is
+used otherwise.
+"""
+
+import os
+import timeit
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.config.lib.compression import pack_data
+from spaceone.config.model import UserConfig
+
+MONGO_HOST = os.environ.get("TEST_MONGO_HOST")
+NUMBER = 1000
+
+
+def _make_data(data_keys: int) -> dict:
+    return {
+        f"key-{key}": {"value": utils.random_string(), "enabled": True}
+        for key in range(data_keys)
+    }
+
+
+def _save(data: dict, domain_id: str) -> None:
+    UserConfig(
+        name=utils.random_string(),
+        data=data,
+        tags={},
+        domain_id=domain_id,
+        user_id="user@example.com",
+    ).save()
+
+
+def main():
+    config.init_conf(package="spaceone.config")
+    config.set_global_force(
+        CHUNKED_STORAGE={"enabled": True, "threshold": 8388608},
+        DATA_COMPRESSION={"enabled": False},
+    )
+    if MONGO_HOST:
+        connect("benchmark", host=MONGO_HOST)
+    else:
+        connect(
+            "benchmark",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    print(f"{'data keys':>10} {'pack (us)':>10} {'save (us)':>10} {'share':>6}")
+
+    try:
+        for data_keys in [1, 10, 100, 1000]:
+            domain_id = utils.generate_id("domain")
+            data = _make_data(data_keys)
+
+            pack_time = timeit.timeit(
+                lambda: pack_data(data, UserConfig), number=NUMBER
+            )
+            save_time = timeit.timeit(lambda: _save(data, domain_id), number=NUMBER)
+
+            print(
+                f"{data_keys:>10} "
+                f"{pack_time / NUMBER * 1e6:>10.1f} "
+                f"{save_time / NUMBER * 1e6:>10.1f} "
+                f"{pack_time / (pack_time + save_time):>6.1%}"
+            )
+
+            UserConfig.objects.filter(domain_id=domain_id).delete()
+    finally:
+        disconnect()
+
+
+if __name__ == "__main__":
+    main()
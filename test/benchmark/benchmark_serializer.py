@@ -0,0 +1,84 @@
+"""Compare the response model path with lib.serializer.to_message.
+
+    python -m test.benchmark.benchmark_serializer
+
+The model path is what list did before: UserConfigsResponse(...).dict(),
+then json_format.ParseDict into UserConfigsInfo as BaseAPI.dict_to_message
+does. Each row is the time to serialize one list response.
+"""
+
+import timeit
+from datetime import datetime
+
+from google.protobuf import json_format
+from spaceone.api.config.v1 import user_config_pb2
+
+from spaceone.core import utils
+from spaceone.config.lib.serializer import to_message
+from spaceone.config.model.user_config.response import UserConfigsResponse
+
+NUMBER = 20
+
+
+def _make_documents(count: int, data_keys: int) -> list:
+    now = datetime.utcnow()
+    return [
+        {
+            "name": f"config-{index}",
+            "data": {
+                f"key-{key}": {"value": utils.random_string(), "enabled": True}
+                for key in range(data_keys)
+            },
+            "tags": {"env": "prod"},
+            "domain_id": "domain-1234",
+            "user_id": "user@example.com",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(count)
+    ]
+
+
+def _model_path(documents: list) -> None:
+    response = UserConfigsResponse(
+        results=documents, total_count=len(documents)
+    ).dict()
+
+    # ParseDict rejects fields the published protos do not have yet
+    fields = user_config_pb2.UserConfigsInfo.DESCRIPTOR.fields_by_name
+    response = {key: value for key, value in response.items() if key in fields}
+
+    json_format.ParseDict(response, user_config_pb2.UserConfigsInfo())
+
+
+def _serializer_path(documents: list) -> None:
+    to_message(
+        user_config_pb2.UserConfigsInfo,
+        {"results": documents, "total_count": len(documents)},
+    )
+
+
+def main():
+    print(
+        f"{'items':>6} {'data keys':>10} {'model (ms)':>12} {'direct (ms)':>12} "
+        f"{'ratio':>6}"
+    )
+
+    for count in [1, 100, 1000]:
+        for data_keys in [1, 10, 100]:
+            documents = _make_documents(count, data_keys)
+            model_time = timeit.timeit(lambda: _model_path(documents), number=NUMBER)
+            direct_time = timeit.timeit(
+                lambda: _serializer_path(documents), number=NUMBER
+            )
+
+            print(
+                f"{count:>6} {data_keys:>10} "
+                f"{model_time / NUMBER * 1000:>12.2f} "
+                f"{direct_time / NUMBER * 1000:>12.2f} "
+                f"{model_time / direct_time:>6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
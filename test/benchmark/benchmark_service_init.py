@@ -0,0 +1,103 @@
+"""Compare SharedConfig.get with eager and lazy IdentityManager construction.
+
+    python -m test.benchmark.benchmark_service_init
+
+The eager path is what every request did before: SharedConfigService built
+an IdentityManager, which decoded the token and built a SpaceConnector. The
+lazy path is the current service, where get never touches identity.
+
+SpaceConnector connects to identity when it is built, so TEST_IDENTITY_ENDPOINT
+must point to a running identity service. Set TEST_MONGO_HOST to measure
+against a real mongod, mongomock is used otherwise.
+"""
+
+import os
+import timeit
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.auth.jwt.jwt_util import JWTUtil
+from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.locator import Locator
+from spaceone.core.transaction import Transaction
+from spaceone.config.model import SharedConfig
+from spaceone.config.service.shared_config_service import SharedConfigService
+
+MONGO_HOST = os.environ.get("TEST_MONGO_HOST")
+IDENTITY_ENDPOINT = os.environ.get("TEST_IDENTITY_ENDPOINT", "grpc://localhost:50051")
+NUMBER = 1000
+
+
+class _EagerSharedConfigService(SharedConfigService):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        token = self.transaction.get_meta("token")
+        JWTUtil.get_value_from_token(token, "typ")
+        Locator.get_connector(SpaceConnector, service="identity")
+
+
+def _make_token() -> str:
+    private_jwk, _ = JWTUtil.generate_jwk()
+    return JWTUtil.encode({"typ": "ACCESS_TOKEN"}, private_jwk)
+
+
+def _get(service_class, transaction: Transaction, params: dict) -> None:
+    service_class(transaction=transaction).get(params.copy())
+
+
+def main():
+    config.init_conf(package="spaceone.config")
+    config.set_global(
+        CONNECTORS={"SpaceConnector": {"endpoints": {"identity": IDENTITY_ENDPOINT}}}
+    )
+    if MONGO_HOST:
+        connect("benchmark", host=MONGO_HOST)
+    else:
+        connect(
+            "benchmark",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    domain_id = utils.generate_id("domain")
+    SharedConfig(
+        name="config-benchmark",
+        data={"key": "value"},
+        resource_group="DOMAIN",
+        workspace_id="*",
+        project_id="*",
+        domain_id=domain_id,
+        version=1,
+    ).save()
+
+    transaction = Transaction(
+        {"service": "config", "api_class": "SharedConfig", "token": _make_token()}
+    )
+    transaction.method = "get"
+    params = {"name": "config-benchmark", "domain_id": domain_id}
+
+    try:
+        eager_time = timeit.timeit(
+            lambda: _get(_EagerSharedConfigService, transaction, params),
+            number=NUMBER,
+        )
+        lazy_time = timeit.timeit(
+            lambda: _get(SharedConfigService, transaction, params), number=NUMBER
+        )
+
+        print(f"{'eager (us/call)':>16} {'lazy (us/call)':>15} {'ratio':>6}")
+        print(
+            f"{eager_time / NUMBER * 1e6:>16.1f} "
+            f"{lazy_time / NUMBER * 1e6:>15.1f} "
+            f"{eager_time / lazy_time:>6.1f}"
+        )
+    finally:
+        SharedConfig.objects.filter(domain_id=domain_id).delete()
+        disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import unittest
+from datetime import datetime, timedelta
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.config.lib.change_feed import ChangeFeed
+from spaceone.config.model import UserConfig
+
+
+class TestChangeFeed(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.now = datetime(2024, 1, 1)
+        self.collection = UserConfig._get_collection()
+        self.events = []
+        self.change_feed = ChangeFeed(UserConfig)
+        self.change_feed._subscribers.append(self.events.append)
+
+    def tearDown(self) -> None:
+        UserConfig.objects.filter().delete()
+
+    def _write(self, name: str, seconds: int) -> None:
+        self.collection.update_one(
+            {"name": name},
+            {"$set": {"updated_at": self.now + timedelta(seconds=seconds)}},
+            upsert=True,
+        )
+
+    def _poll(self) -> list:
+        self.events.clear()
+        self.change_feed._poll_changes(self.collection)
+        return [event["document"]["name"] for event in self.events]
+
+    def test_poll_changes(self):
+        self._write("existing", 0)
+        self.change_feed._start_polling(self.collection)
+
+        self.assertEqual([], self._poll())
+
+        self._write("layout", 10)
+        self.assertEqual(["layout"], self._poll())
+        self.assertEqual([], self._poll())
+
+        self._write("layout", 12)
+        self.assertEqual(["layout"], self._poll())
+
+    def test_poll_changes_committed_late(self):
+        self.change_feed._start_polling(self.collection)
+        self._write("layout", 10)
+        self.assertEqual(["layout"], self._poll())
+
+        # Stamped before the high-water mark, but visible only after that poll
+        self._write("theme", 8)
+        self.assertEqual(["theme"], self._poll())
+
+        # Older than the clock skew window, it is not read again
+        self._write("late", 10 - self.change_feed.clock_skew - 1)
+        self.assertEqual([], self._poll())
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
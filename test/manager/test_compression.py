@@ -0,0 +1,271 @@
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import bson
+import mongomock
+from bson import ObjectId
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.config.lib import chunked_storage
+from spaceone.config.lib import compression
+from spaceone.config.lib.compression import get_vo_data, pack_data, unpack_document
+from spaceone.config.manager.user_config_manager import UserConfigManager
+from spaceone.config.model import UserConfig
+
+
+class _FakeGridOut:
+    def __init__(self, file: dict):
+        self._id = file["_id"]
+        self.metadata = file["metadata"]
+        self._content = file["content"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def read(self) -> bytes:
+        return self._content
+
+
+class _FakeBucket:
+    """In-memory GridFSBucket, gridfs does not run on mongomock"""
+
+    def __init__(self):
+        self.files = {}
+
+    def upload_from_stream(self, filename: str, content: bytes, metadata: dict):
+        file_id = ObjectId()
+        self.files[file_id] = {
+            "_id": file_id,
+            "filename": filename,
+            "content": content,
+            "metadata": metadata,
+            "uploadDate": datetime.utcnow(),
+        }
+        return file_id
+
+    def open_download_stream(self, file_id: ObjectId) -> _FakeGridOut:
+        return _FakeGridOut(self.files[file_id])
+
+    def find(self, query: dict) -> list:
+        return [
+            SimpleNamespace(_id=file["_id"])
+            for file in list(self.files.values())
+            if file["filename"] == query["filename"]
+            and file["uploadDate"] < query["uploadDate"]["$lt"]
+        ]
+
+    def delete(self, file_id: ObjectId) -> None:
+        del self.files[file_id]
+
+
+def _make_data(data_keys: int) -> dict:
+    return {
+        f"key-{key}": {"value": "v" * 32, "enabled": True} for key in range(data_keys)
+    }
+
+
+class TestCompression(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.user_id = utils.generate_id("user")
+        self.transaction = Transaction({"service": "config", "api_class": "UserConfig"})
+        self.user_config_mgr = UserConfigManager()
+
+        self.bucket = _FakeBucket()
+        get_bucket_patcher = patch.object(
+            chunked_storage, "_get_bucket", return_value=self.bucket
+        )
+        get_bucket_patcher.start()
+        self.addCleanup(get_bucket_patcher.stop)
+
+        self._set_conf(
+            DATA_COMPRESSION={"enabled": False, "threshold": 16384, "level": 3},
+            CHUNKED_STORAGE={"enabled": True, "threshold": 8388608},
+        )
+
+    def tearDown(self) -> None:
+        UserConfig.objects.filter().delete()
+
+    def _set_conf(self, **conf) -> None:
+        for key, value in conf.items():
+            self.addCleanup(
+                config.set_global_force, **{key: config.get_global(key, {})}
+            )
+            config.set_global_force(**{key: value})
+
+    def _round_trip(self, packed_data: dict) -> dict:
+        document = {"name": "layout", **packed_data}
+        return unpack_document(document, UserConfig)
+
+    def test_pack_small_data(self):
+        data = _make_data(1)
+
+        packed_data = pack_data(data, UserConfig)
+
+        self.assertEqual(
+            packed_data, {"data": data, "compressed_data": None, "data_file_id": None}
+        )
+        self.assertEqual(
+            self._round_trip(packed_data), {"name": "layout", "data": data}
+        )
+
+    def test_pack_none_data(self):
+        packed_data = pack_data(None, UserConfig)
+
+        self.assertEqual(
+            packed_data, {"data": None, "compressed_data": None, "data_file_id": None}
+        )
+
+    def test_pack_data_without_encoding(self):
+        self._set_conf(CHUNKED_STORAGE={"enabled": False})
+        data = _make_data(1)
+
+        with patch.object(compression.bson, "encode") as encode:
+            packed_data = pack_data(data, UserConfig)
+
+        encode.assert_not_called()
+        self.assertIs(packed_data["data"], data)
+
+    @unittest.skipIf(compression.zstandard is None, "requires zstandard")
+    def test_compression_threshold(self):
+        self._set_conf(DATA_COMPRESSION={"enabled": True, "threshold": 1024})
+        small_data = _make_data(1)
+        large_data = _make_data(100)
+
+        small_packed_data = pack_data(small_data, UserConfig)
+        large_packed_data = pack_data(large_data, UserConfig)
+
+        self.assertEqual(small_packed_data["data"], small_data)
+        self.assertIsNone(small_packed_data["compressed_data"])
+
+        self.assertIsNone(large_packed_data["data"])
+        self.assertIsNone(large_packed_data["data_file_id"])
+        self.assertLess(
+            len(large_packed_data["compressed_data"]), len(bson.encode(large_data))
+        )
+        self.assertEqual(self._round_trip(large_packed_data)["data"], large_data)
+
+    def test_compression_without_zstandard(self):
+        self._set_conf(DATA_COMPRESSION={"enabled": True, "threshold": 0})
+        data = _make_data(10)
+
+        with patch.object(compression, "zstandard", None):
+            self.assertFalse(compression.is_compression_enabled())
+            packed_data = pack_data(data, UserConfig)
+
+        self.assertEqual(packed_data["data"], data)
+        self.assertIsNone(packed_data["compressed_data"])
+
+    def test_chunked_storage_threshold(self):
+        self._set_conf(CHUNKED_STORAGE={"enabled": True, "threshold": 1024})
+        data = _make_data(100)
+
+        packed_data = pack_data(data, UserConfig)
+
+        self.assertIsNone(packed_data["data"])
+        self.assertIsNone(packed_data["compressed_data"])
+        stored_file = self.bucket.files[packed_data["data_file_id"]]
+        self.assertEqual(stored_file["content"], bson.encode(data))
+        self.assertEqual(stored_file["metadata"], {"compressed": False})
+        self.assertEqual(self._round_trip(packed_data)["data"], data)
+
+    @unittest.skipIf(compression.zstandard is None, "requires zstandard")
+    def test_chunked_storage_of_compressed_data(self):
+        self._set_conf(
+            DATA_COMPRESSION={"enabled": True, "threshold": 1024},
+            CHUNKED_STORAGE={"enabled": True, "threshold": 256},
+        )
+        data = {f"key-{key}": utils.random_string() for key in range(1000)}
+
+        packed_data = pack_data(data, UserConfig)
+
+        stored_file = self.bucket.files[packed_data["data_file_id"]]
+        self.assertEqual(stored_file["metadata"], {"compressed": True})
+        self.assertIsNone(packed_data["compressed_data"])
+        self.assertEqual(self._round_trip(packed_data)["data"], data)
+
+    def test_unpack_document_without_data(self):
+        # Projections without data have neither compressed_data nor data_file_id
+        document = {"name": "layout", "tags": {}}
+
+        self.assertEqual(
+            unpack_document(dict(document), UserConfig), {"name": "layout", "tags": {}}
+        )
+
+    def test_get_vo_data(self):
+        self._set_conf(CHUNKED_STORAGE={"enabled": True, "threshold": 1024})
+        data = _make_data(100)
+
+        user_config_vo = self.user_config_mgr.create_user_config(
+            {
+                "name": "layout",
+                "data": data,
+                "tags": {},
+                "domain_id": self.domain_id,
+                "user_id": self.user_id,
+            }
+        )
+
+        self.assertIsNone(user_config_vo.data)
+        self.assertIsNotNone(user_config_vo.data_file_id)
+        self.assertEqual(get_vo_data(user_config_vo), data)
+
+    def test_delete_orphan_data_files(self):
+        self._set_conf(CHUNKED_STORAGE={"enabled": True, "threshold": 1024})
+        user_config_vo = self.user_config_mgr.create_user_config(
+            {
+                "name": "layout",
+                "data": _make_data(100),
+                "tags": {},
+                "domain_id": self.domain_id,
+                "user_id": self.user_id,
+            }
+        )
+        old_file_id = user_config_vo.data_file_id
+
+        user_config_vo, _ = self.user_config_mgr.update_user_config_by_vo(
+            {"data": _make_data(200)}, user_config_vo
+        )
+        new_file_id = user_config_vo.data_file_id
+
+        # Updates keep the replaced file so that a rollback can restore it
+        self.assertNotEqual(old_file_id, new_file_id)
+        self.assertEqual(set(self.bucket.files), {old_file_id, new_file_id})
+
+        # Young files may belong to a write in progress
+        self.assertEqual(chunked_storage.delete_orphan_data_files([UserConfig]), 0)
+
+        for stored_file in self.bucket.files.values():
+            stored_file["uploadDate"] -= timedelta(hours=2)
+
+        self.assertEqual(chunked_storage.delete_orphan_data_files([UserConfig]), 1)
+        self.assertEqual(set(self.bucket.files), {new_file_id})
+        self.assertEqual(
+            get_vo_data(UserConfig.objects.get(id=user_config_vo.id)), _make_data(200)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,93 @@
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.config.manager.config_counter_manager import ConfigCounterManager
+from spaceone.config.model import ConfigCounter
+
+
+class TestConfigCounterManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.transaction = Transaction(
+            {"service": "config", "api_class": "UserConfig"}
+        )
+        self.config_counter_mgr = ConfigCounterManager()
+        self.count_calls = 0
+
+    def tearDown(self) -> None:
+        ConfigCounter.objects.filter().delete()
+
+    def _get_count(self, count_func) -> int:
+        def _count():
+            self.count_calls += 1
+            return count_func()
+
+        return self.config_counter_mgr.get_count(
+            "UserConfig", self.domain_id, "user-a", _count
+        )
+
+    def _increment(self, value: int = 1) -> None:
+        self.config_counter_mgr.increment("UserConfig", self.domain_id, "user-a", value)
+
+    def test_get_count(self):
+        self.assertEqual(5, self._get_count(lambda: 5))
+
+        self._increment()
+        self._increment(-2)
+
+        self.assertEqual(4, self._get_count(lambda: 0))
+        self.assertEqual(1, self.count_calls)
+
+    def test_increment_before_first_read(self):
+        # Only a change, it does not tell how many configs there are
+        self._increment()
+
+        self.assertEqual(5, self._get_count(lambda: 5))
+        self.assertEqual(5, self._get_count(lambda: 0))
+
+    def test_increment_during_first_count(self):
+        counts = [5, 6]
+
+        def _count():
+            # A config is created while the first count runs
+            if self.count_calls == 1:
+                self._increment()
+
+            return counts[self.count_calls - 1]
+
+        self.assertEqual(6, self._get_count(_count))
+        self.assertEqual(2, self.count_calls)
+
+        self._increment()
+        self.assertEqual(7, self._get_count(lambda: 0))
+
+    def test_increment_rollback(self):
+        self.assertEqual(5, self._get_count(lambda: 5))
+
+        self._increment()
+        self.config_counter_mgr.transaction.execute_rollback()
+
+        self.assertEqual(5, self._get_count(lambda: 0))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,194 @@
+import unittest
+from datetime import datetime, timedelta
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.core.transaction import Transaction
+from spaceone.config.manager.config_tombstone_manager import ConfigTombstoneManager
+from spaceone.config.model import ConfigTombstone, DomainConfig
+
+
+class TestConfigTombstoneManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.transaction = Transaction(
+            {"service": "config", "api_class": "DomainConfig"}
+        )
+        self.config_tombstone_mgr = ConfigTombstoneManager()
+        self.now = datetime.utcnow().replace(microsecond=0)
+
+    def tearDown(self) -> None:
+        DomainConfig.objects.filter().delete()
+        ConfigTombstone.objects.filter().delete()
+
+    def _changed_at(self, seconds: int) -> datetime:
+        return self.now - timedelta(minutes=10) + timedelta(seconds=seconds)
+
+    def _save_domain_config(self, name: str, seconds: int) -> DomainConfig:
+        domain_config_vo = DomainConfig(
+            name=name, data={}, tags={}, domain_id=self.domain_id
+        ).save()
+        DomainConfig.objects.filter(id=domain_config_vo.id).update(
+            set__updated_at=self._changed_at(seconds)
+        )
+        return domain_config_vo
+
+    def _add_tombstone(self, name: str, seconds: int) -> None:
+        self.config_tombstone_mgr.add_tombstones(
+            "DomainConfig", self.domain_id, [{"name": name}]
+        )
+        ConfigTombstone._get_collection().update_one(
+            {"name": name, "domain_id": self.domain_id},
+            {"$set": {"deleted_at": self._changed_at(seconds)}},
+        )
+
+    def _list_changes(self, page_size: int = None, page_token: str = None) -> dict:
+        return self.config_tombstone_mgr.list_changes(
+            "DomainConfig",
+            DomainConfig.objects.filter(domain_id=self.domain_id),
+            self.domain_id,
+            self._changed_at(0),
+            ["name"],
+            page_size,
+            page_token,
+        )
+
+    def _list_all_changes(self, page_size: int, page_token: str = None) -> list:
+        pages = [self._list_changes(page_size, page_token)]
+        while pages[-1]["next_page_token"]:
+            pages.append(self._list_changes(page_size, pages[-1]["next_page_token"]))
+
+        return pages
+
+    @staticmethod
+    def _get_names(pages: list) -> list:
+        return [
+            (key, info["name"])
+            for page in pages
+            for key in ["results", "deleted"]
+            for info in page[key]
+        ]
+
+    def test_list_changes(self):
+        self._save_domain_config("before", 0)
+        self._save_domain_config("config-a", 1)
+        self._add_tombstone("deleted-a", 2)
+
+        changes = self._list_changes()
+
+        self.assertEqual(["config-a"], [info["name"] for info in changes["results"]])
+        self.assertEqual(["deleted-a"], [info["name"] for info in changes["deleted"]])
+        self.assertNotIn("_id", changes["deleted"][0])
+        self.assertIsNone(changes["next_page_token"])
+        self.assertLess(changes["synced_at"], datetime.utcnow())
+
+    def test_list_changes_by_page(self):
+        self._save_domain_config("config-a", 1)
+        self._add_tombstone("deleted-a", 2)
+        self._save_domain_config("config-b", 3)
+        self._save_domain_config("config-c", 4)
+        self._add_tombstone("deleted-b", 5)
+
+        pages = self._list_all_changes(2)
+
+        self.assertEqual(3, len(pages))
+        self.assertEqual(
+            [
+                ("results", "config-a"),
+                ("deleted", "deleted-a"),
+                ("results", "config-b"),
+                ("results", "config-c"),
+                ("deleted", "deleted-b"),
+            ],
+            self._get_names(pages),
+        )
+        self.assertEqual(
+            [2, 2, 1],
+            [len(page["results"]) + len(page["deleted"]) for page in pages],
+        )
+
+        # synced_at is taken on the first page and carried by the token
+        self.assertEqual(1, len({page["synced_at"] for page in pages}))
+
+    def test_list_changes_at_the_same_time(self):
+        names = [f"config-{index}" for index in range(5)]
+        for name in names:
+            self._save_domain_config(name, 1)
+
+        pages = self._list_all_changes(2)
+
+        self.assertEqual(3, len(pages))
+        self.assertEqual(
+            sorted(names), sorted(name for _, name in self._get_names(pages))
+        )
+
+    def test_list_changes_between_pages(self):
+        config_a_vo = self._save_domain_config("config-a", 1)
+        self._save_domain_config("config-b", 2)
+        self._save_domain_config("config-c", 3)
+
+        first_page = self._list_changes(2)
+
+        # Changes after the position of the token are on the next pages
+        DomainConfig.objects.filter(id=config_a_vo.id).update(
+            set__updated_at=self._changed_at(10)
+        )
+        self._add_tombstone("config-b", 11)
+        DomainConfig.objects.filter(name="config-b").delete()
+
+        pages = self._list_all_changes(2, first_page["next_page_token"])
+
+        self.assertEqual(
+            [("results", "config-a"), ("results", "config-b")],
+            self._get_names([first_page]),
+        )
+        self.assertEqual(
+            [
+                ("results", "config-c"),
+                ("results", "config-a"),
+                ("deleted", "config-b"),
+            ],
+            self._get_names(pages),
+        )
+
+    def test_list_changes_page_token_of_other_since(self):
+        for seconds in range(1, 4):
+            self._save_domain_config(f"config-{seconds}", seconds)
+
+        next_page_token = self._list_changes(2)["next_page_token"]
+
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            self.config_tombstone_mgr.list_changes(
+                "DomainConfig",
+                DomainConfig.objects.filter(domain_id=self.domain_id),
+                self.domain_id,
+                self._changed_at(1),
+                ["name"],
+                2,
+                next_page_token,
+            )
+
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            self._list_changes(2, "malformed")
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,112 @@
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.config.lib.cursor import list_by_cursor
+from spaceone.config.model import SharedConfig
+
+
+class TestCursor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.keys = ["workspace_id", "project_id", "name"]
+        for workspace_id in ["*", "workspace-a", "workspace-b"]:
+            for name in ["layout", "theme"]:
+                SharedConfig(
+                    name=name,
+                    data={},
+                    tags={},
+                    resource_group="WORKSPACE",
+                    domain_id=self.domain_id,
+                    workspace_id=workspace_id,
+                    project_id="*",
+                ).save()
+
+    def tearDown(self) -> None:
+        SharedConfig.objects.filter().delete()
+
+    def _make_query(self, **conditions) -> dict:
+        conditions["domain_id"] = self.domain_id
+        return {
+            "filter": [
+                {"k": key, "v": value, "o": "eq"} for key, value in conditions.items()
+            ]
+        }
+
+    def test_list_by_cursor(self):
+        query = self._make_query()
+        names = []
+        page_token = None
+        while True:
+            shared_config_vos, page_token = list_by_cursor(
+                SharedConfig, query, self.keys, 4, page_token
+            )
+            names += [(vo.workspace_id, vo.name) for vo in shared_config_vos]
+            if page_token is None:
+                break
+
+        self.assertEqual(
+            [
+                ("*", "layout"),
+                ("*", "theme"),
+                ("workspace-a", "layout"),
+                ("workspace-a", "theme"),
+                ("workspace-b", "layout"),
+                ("workspace-b", "theme"),
+            ],
+            names,
+        )
+
+    def test_list_by_cursor_as_pymongo(self):
+        query = self._make_query()
+        first_page, page_token = list_by_cursor(
+            SharedConfig, query, self.keys, 3, as_pymongo=True
+        )
+        second_page, last_page_token = list_by_cursor(
+            SharedConfig, query, self.keys, 3, page_token, as_pymongo=True
+        )
+
+        self.assertEqual(3, len(first_page))
+        self.assertEqual("workspace-a", second_page[0]["workspace_id"])
+        self.assertIsNone(last_page_token)
+
+    def test_page_token_of_another_filter(self):
+        _, page_token = list_by_cursor(SharedConfig, self._make_query(), self.keys, 2)
+
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            list_by_cursor(
+                SharedConfig,
+                self._make_query(workspace_id="workspace-a"),
+                self.keys,
+                2,
+                page_token,
+            )
+
+    def test_malformed_page_token(self):
+        for page_token in ["not-a-token", "e30="]:
+            with self.assertRaises(ERROR_INVALID_PARAMETER):
+                list_by_cursor(
+                    SharedConfig, self._make_query(), self.keys, 2, page_token
+                )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,343 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import NotUniqueError, QuerySet, connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_NOT_FOUND, ERROR_SAVE_UNIQUE_VALUES
+from spaceone.core.transaction import Transaction
+from spaceone.config.error.config import ERROR_VERSION_CONFLICT
+from spaceone.config.lib import cache as config_cache
+from spaceone.config.manager import domain_config_manager
+from spaceone.config.manager.domain_config_manager import DomainConfigManager
+from spaceone.config.model import DomainConfig
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.messages = []
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode()
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def publish(self, channel, message):
+        self.messages.append((channel, message))
+
+
+class TestDomainConfigManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        config.set_global_force(
+            CACHES={"default": {}, "local": {"max_size": 128, "ttl": 300}}
+        )
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.transaction = Transaction(
+            {"service": "config", "api_class": "DomainConfig"}
+        )
+        self.domain_config_mgr = DomainConfigManager()
+        config_cache._LOCAL_CACHE = None
+
+    def tearDown(self) -> None:
+        DomainConfig.objects.filter().delete()
+
+    def _create_domain_config(self, name: str = "layout", data: dict = None):
+        return self.domain_config_mgr.create_domain_config(
+            {
+                "name": name,
+                "data": data or {"key": "value"},
+                "tags": {},
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def test_create_domain_config_duplicate(self):
+        DomainConfig.ensure_indexes()
+        self.addCleanup(DomainConfig._get_collection().drop_indexes)
+        self._create_domain_config()
+
+        with self.assertRaises(ERROR_SAVE_UNIQUE_VALUES):
+            self._create_domain_config()
+
+    def test_get_domain_config_info_from_cache(self):
+        self._create_domain_config()
+
+        domain_config_info = self.domain_config_mgr.get_domain_config_info(
+            "layout", self.domain_id
+        )
+        DomainConfig.objects.filter(domain_id=self.domain_id).delete()
+
+        self.assertEqual(
+            domain_config_info,
+            self.domain_config_mgr.get_domain_config_info("layout", self.domain_id),
+        )
+
+    def test_update_invalidates_cache(self):
+        domain_config_vo = self._create_domain_config()
+        self.domain_config_mgr.get_domain_config_info("layout", self.domain_id)
+
+        self.domain_config_mgr.update_domain_config_by_vo(
+            {"data": {"key": "changed"}}, domain_config_vo
+        )
+
+        domain_config_info = self.domain_config_mgr.get_domain_config_info(
+            "layout", self.domain_id
+        )
+        self.assertEqual({"key": "changed"}, domain_config_info["data"])
+
+    def test_set_and_delete_invalidate_cache(self):
+        self.domain_config_mgr.set_domain_config(
+            {"name": "layout", "data": {"key": "value"}, "domain_id": self.domain_id}
+        )
+        self.domain_config_mgr.get_domain_config_info("layout", self.domain_id)
+
+        domain_config_vo = self.domain_config_mgr.get_domain_config(
+            "layout", self.domain_id
+        )
+        self.domain_config_mgr.delete_domain_config_by_vo(domain_config_vo)
+
+        with self.assertRaises(ERROR_NOT_FOUND):
+            self.domain_config_mgr.get_domain_config_info("layout", self.domain_id)
+
+    def test_load_before_update_is_not_cached(self):
+        domain_config_vo = self._create_domain_config(data={"key": "old"})
+        get_document = domain_config_manager.get_document
+
+        def _get_document(*args, **kwargs):
+            # The config is updated after this reader loaded it
+            document = get_document(*args, **kwargs)
+            self.domain_config_mgr.update_domain_config_by_vo(
+                {"data": {"key": "new"}}, domain_config_vo
+            )
+            return document
+
+        with patch.object(
+            domain_config_manager, "get_document", side_effect=_get_document
+        ):
+            domain_config_info = self.domain_config_mgr.get_domain_config_info(
+                "layout", self.domain_id
+            )
+            self.assertEqual({"key": "old"}, domain_config_info["data"])
+
+        domain_config_info = self.domain_config_mgr.get_domain_config_info(
+            "layout", self.domain_id
+        )
+        self.assertEqual({"key": "new"}, domain_config_info["data"])
+
+    def _get_stored(self, domain_config_vo: DomainConfig) -> DomainConfig:
+        return DomainConfig.objects.get(id=domain_config_vo.id)
+
+    def test_update_version_conflict(self):
+        domain_config_vo = self._create_domain_config()
+        domain_config_vo, _ = self.domain_config_mgr.update_domain_config_by_vo(
+            {"data": {"key": "v2"}, "expected_version": 1}, domain_config_vo
+        )
+        self.assertEqual(2, domain_config_vo.version)
+
+        # Loaded at version 2, then updated by another request
+        stale_vo = self._get_stored(domain_config_vo)
+        self.domain_config_mgr.update_domain_config_by_vo(
+            {"data": {"key": "v3"}}, self._get_stored(domain_config_vo)
+        )
+
+        with self.assertRaises(ERROR_VERSION_CONFLICT):
+            self.domain_config_mgr.update_domain_config_by_vo(
+                {"data": {"key": "v4"}, "expected_version": 2}, stale_vo
+            )
+
+        with self.assertRaises(ERROR_VERSION_CONFLICT):
+            self.domain_config_mgr.update_domain_config_by_vo(
+                {"data": {"key": "v4"}, "expected_version": 1},
+                self._get_stored(domain_config_vo),
+            )
+
+        stored_vo = self._get_stored(domain_config_vo)
+        self.assertEqual({"key": "v3"}, stored_vo.data)
+        self.assertEqual(3, stored_vo.version)
+
+    def test_set_insert_and_update(self):
+        params = {"name": "layout", "domain_id": self.domain_id}
+
+        domain_config_vo, written = self.domain_config_mgr.set_domain_config(
+            {**params, "data": {"key": "v1"}}
+        )
+
+        self.assertTrue(written)
+        self.assertEqual(1, domain_config_vo.version)
+        self.assertEqual(domain_config_vo.created_at, domain_config_vo.updated_at)
+        stored_vo = DomainConfig.objects.get(**params)
+        self.assertEqual({"key": "v1"}, stored_vo.data)
+        self.assertEqual(1, stored_vo.version)
+
+        created_at = stored_vo.created_at - timedelta(days=1)
+        DomainConfig.objects.filter(id=stored_vo.id).update(set__created_at=created_at)
+
+        domain_config_vo, written = self.domain_config_mgr.set_domain_config(
+            {**params, "data": {"key": "v2"}}
+        )
+
+        self.assertTrue(written)
+        self.assertEqual(stored_vo.id, domain_config_vo.id)
+        self.assertEqual(2, domain_config_vo.version)
+        self.assertEqual(created_at, domain_config_vo.created_at)
+        self.assertEqual(1, DomainConfig.objects.filter(**params).count())
+        stored_vo = self._get_stored(domain_config_vo)
+        self.assertEqual({"key": "v2"}, stored_vo.data)
+        self.assertEqual(2, stored_vo.version)
+        self.assertEqual(created_at, stored_vo.created_at)
+        self.assertGreater(stored_vo.updated_at, created_at)
+
+    def test_set_version_conflict(self):
+        params = {"name": "layout", "domain_id": self.domain_id}
+
+        with self.assertRaises(ERROR_NOT_FOUND):
+            self.domain_config_mgr.set_domain_config(
+                {**params, "data": {"key": "v1"}, "expected_version": 1}
+            )
+
+        domain_config_vo = self._create_domain_config(data={"key": "v1"})
+        _, written = self.domain_config_mgr.set_domain_config(
+            {**params, "data": {"key": "v2"}, "expected_version": 1}
+        )
+        self.assertTrue(written)
+
+        with self.assertRaises(ERROR_VERSION_CONFLICT):
+            self.domain_config_mgr.set_domain_config(
+                {**params, "data": {"key": "v3"}, "expected_version": 1}
+            )
+
+        # expected_version 0 only creates. An existing config collides with the
+        # upsert on the unique index, which mongomock does not upsert like mongod.
+        with patch.object(
+            QuerySet, "modify", side_effect=NotUniqueError("duplicate key error")
+        ):
+            with self.assertRaises(ERROR_VERSION_CONFLICT):
+                self.domain_config_mgr.set_domain_config(
+                    {**params, "data": {"key": "v3"}, "expected_version": 0}
+                )
+
+        stored_vo = self._get_stored(domain_config_vo)
+        self.assertEqual({"key": "v2"}, stored_vo.data)
+        self.assertEqual(2, stored_vo.version)
+
+    def test_patch_after_concurrent_set(self):
+        domain_config_vo = self._create_domain_config(data={"key": "v1"})
+
+        # Another request sets other data after the config was loaded
+        self.domain_config_mgr.set_domain_config(
+            {"name": "layout", "data": {"key": "v2"}, "domain_id": self.domain_id}
+        )
+
+        self.domain_config_mgr.patch_domain_config_by_vo(
+            {"lang": "ko"}, domain_config_vo
+        )
+
+        stored_vo = self._get_stored(domain_config_vo)
+        self.assertEqual({"key": "v2", "lang": "ko"}, stored_vo.data)
+        self.assertEqual(3, stored_vo.version)
+
+    def test_patch_version_conflict(self):
+        domain_config_vo = self._create_domain_config()
+        stale_vo = self._get_stored(domain_config_vo)
+        self.domain_config_mgr.update_domain_config_by_vo(
+            {"data": {"key": "v2"}}, self._get_stored(domain_config_vo)
+        )
+
+        # The config keeps changing between every read and write
+        with patch.object(DomainConfig, "reload"):
+            with self.assertRaises(ERROR_VERSION_CONFLICT):
+                self.domain_config_mgr.patch_domain_config_by_vo(
+                    {"lang": "ko"}, stale_vo
+                )
+
+        self.assertEqual({"key": "v2"}, self._get_stored(domain_config_vo).data)
+
+    def test_rollback_does_not_reset_version(self):
+        domain_config_vo = DomainConfig(
+            name="layout",
+            data={"key": "v1"},
+            tags={},
+            domain_id=self.domain_id,
+            version=1,
+        ).save()
+
+        self.domain_config_mgr.update_domain_config_by_vo(
+            {"data": {"key": "v2"}}, domain_config_vo
+        )
+        self.domain_config_mgr.transaction.execute_rollback()
+
+        stored_vo = self._get_stored(domain_config_vo)
+        self.assertEqual({"key": "v1"}, stored_vo.data)
+        self.assertEqual(3, stored_vo.version)
+
+    def test_delete_uncached_key(self):
+        self.domain_config_mgr._delete_domain_config_cache("unknown", self.domain_id)
+
+    def test_redis_tier(self):
+        redis_client = _FakeRedis()
+
+        with patch.object(config_cache, "_get_redis_client", return_value=redis_client):
+            self._create_domain_config()
+            domain_config_info = self.domain_config_mgr.get_domain_config_info(
+                "layout", self.domain_id
+            )
+            cache_key = self.domain_config_mgr._get_domain_config_cache_key(
+                "layout", self.domain_id
+            )
+            self.assertIn(cache_key, redis_client.values)
+
+            # Another replica reads the shared copy, datetimes included.
+            config_cache._LOCAL_CACHE = None
+            cached_info = config_cache.get(cache_key)
+            self.assertEqual(domain_config_info, cached_info)
+            self.assertIsInstance(cached_info["created_at"], datetime)
+
+            config_cache.delete(cache_key)
+            self.assertNotIn(cache_key, redis_client.values)
+            self.assertEqual(
+                (config_cache.INVALIDATION_CHANNEL, f'{{"key": "{cache_key}"}}'),
+                redis_client.messages[-1],
+            )
+
+    def test_redis_engine_conf(self):
+        with patch.object(
+            config,
+            "get_global",
+            return_value={"default": {"engine": "RedisCache", "host": "redis"}},
+        ):
+            self.assertEqual({"host": "redis"}, config_cache._get_redis_options())
+
+        with patch.object(
+            config,
+            "get_global",
+            return_value={
+                "default": {"backend": "spaceone.core.cache.redis_cache.RedisCache"}
+            },
+        ):
+            self.assertEqual({}, config_cache._get_redis_options())
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,118 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_NOT_FOUND
+from spaceone.core.transaction import Transaction
+from spaceone.config.lib import cache as config_cache
+from spaceone.config.manager import identity_manager
+from spaceone.config.manager.identity_manager import IdentityManager
+
+_TIMEOUT = 5
+
+
+@patch.object(identity_manager.JWTUtil, "get_value_from_token", return_value="USER")
+@patch.object(identity_manager, "get_connector")
+class TestIdentityManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        config.set_global_force(
+            CACHES={"default": {}, "local": {"max_size": 128, "ttl": 86400}},
+            IDENTITY_CACHE={
+                "project_expire": 10,
+                "project_stale_expire": 3600,
+                "jitter": 0,
+            },
+        )
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.project_id = utils.generate_id("project")
+        self.identity_mgr = IdentityManager(
+            transaction=Transaction({"token": "token"})
+        )
+        config_cache._LOCAL_CACHE = None
+        self.now = time.time()
+
+        time_patcher = patch.object(config_cache, "time")
+        self.addCleanup(time_patcher.stop)
+        time_patcher.start().time.side_effect = lambda: self.now
+
+    def _get_project(self) -> dict:
+        return self.identity_mgr.get_project(self.project_id, self.domain_id)
+
+    def _wait_for_refresh(self) -> None:
+        deadline = time.monotonic() + _TIMEOUT
+        while config_cache._REFRESHING and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual({}, config_cache._REFRESHING)
+
+    def test_get_project_from_cache(self, get_connector, *args):
+        dispatch = get_connector.return_value.dispatch
+        dispatch.return_value = {"project_id": self.project_id, "name": "v1"}
+
+        self.assertEqual("v1", self._get_project()["name"])
+        self.assertEqual("v1", self._get_project()["name"])
+        dispatch.assert_called_once()
+
+    def test_stale_while_revalidate(self, get_connector, *args):
+        dispatch = get_connector.return_value.dispatch
+        dispatch.return_value = {"project_id": self.project_id, "name": "v1"}
+        self._get_project()
+
+        dispatch.return_value = {"project_id": self.project_id, "name": "v2"}
+        self.now += 11
+
+        self.assertEqual("v1", self._get_project()["name"])
+        self._wait_for_refresh()
+        self.assertEqual(2, dispatch.call_count)
+        self.assertEqual("v2", self._get_project()["name"])
+
+    def test_stale_expire_is_capped(self, get_connector, *args):
+        dispatch = get_connector.return_value.dispatch
+        dispatch.return_value = {"project_id": self.project_id, "name": "v1"}
+        self._get_project()
+
+        # project_stale_expire is 3600, but at most 2x the fresh window is stale
+        dispatch.return_value = {"project_id": self.project_id, "name": "v2"}
+        self.now += 10 + 10 * config_cache.MAX_STALE_RATIO + 1
+
+        self.assertEqual("v2", self._get_project()["name"])
+        self.assertEqual(2, dispatch.call_count)
+
+    def test_refresh_not_found(self, get_connector, *args):
+        dispatch = get_connector.return_value.dispatch
+        dispatch.return_value = {"project_id": self.project_id, "name": "v1"}
+        self._get_project()
+
+        dispatch.side_effect = ERROR_NOT_FOUND(key="project_id", value=self.project_id)
+        self.now += 11
+
+        self.assertEqual("v1", self._get_project()["name"])
+        self._wait_for_refresh()
+
+        with self.assertRaises(ERROR_NOT_FOUND):
+            self._get_project()
+
+    def test_refresh_error_keeps_stale_project(self, get_connector, *args):
+        dispatch = get_connector.return_value.dispatch
+        dispatch.return_value = {"project_id": self.project_id, "name": "v1"}
+        self._get_project()
+
+        dispatch.side_effect = ConnectionError("identity is unavailable")
+        self.now += 11
+
+        self.assertEqual("v1", self._get_project()["name"])
+        self._wait_for_refresh()
+        self.assertEqual("v1", self._get_project()["name"])
+        self._wait_for_refresh()
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,216 @@
+import os
+from datetime import datetime
+import unittest
+from mongoengine import connect, disconnect
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.config.manager.user_config_manager import UserConfigManager
+from spaceone.config.manager.domain_config_manager import DomainConfigManager
+from spaceone.config.manager.public_config_manager import PublicConfigManager
+from spaceone.config.manager.shared_config_manager import SharedConfigManager
+from spaceone.config.model import DomainConfig, PublicConfig, SharedConfig, UserConfig
+
+# explain() is not supported by mongomock, so this test needs a real mongod.
+MONGO_HOST = os.environ.get("TEST_MONGO_HOST", "mongodb://localhost:27017/test")
+
+
+def _is_mongo_available() -> bool:
+    try:
+        MongoClient(MONGO_HOST, serverSelectionTimeoutMS=500).admin.command("ping")
+        return True
+    except PyMongoError:
+        return False
+
+
+def _find_index_scans(plan: dict) -> list:
+    index_names = []
+    if plan.get("stage") == "IXSCAN":
+        index_names.append(plan.get("indexName"))
+
+    for child in [plan.get("inputStage")] + plan.get("inputStages", []):
+        if child:
+            index_names += _find_index_scans(child)
+
+    return index_names
+
+
+def _has_collection_scan(plan: dict) -> bool:
+    return _has_stage(plan, "COLLSCAN")
+
+
+def _has_stage(plan: dict, stage: str) -> bool:
+    if plan.get("stage") == stage:
+        return True
+
+    for child in [plan.get("inputStage")] + plan.get("inputStages", []):
+        if child and _has_stage(child, stage):
+            return True
+
+    return False
+
+
+@unittest.skipUnless(_is_mongo_available(), "requires a running mongod")
+class TestIndexUsage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect("test", host=MONGO_HOST)
+
+        for model in [UserConfig, DomainConfig, PublicConfig, SharedConfig]:
+            model.ensure_indexes()
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.user_id = utils.generate_id("user")
+        cls.workspace_id = utils.generate_id("workspace")
+        cls.project_id = utils.generate_id("project")
+        cls.transaction = Transaction({"service": "config", "api_class": "Config"})
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        for model in [UserConfig, DomainConfig, PublicConfig, SharedConfig]:
+            model.drop_collection()
+        disconnect()
+
+    def assertIndexScan(self, queryset, index_name: str) -> None:
+        plan = queryset.explain()["queryPlanner"]["winningPlan"]
+        # Slot-based execution engine (MongoDB 5.1+) nests the classic plan
+        plan = plan.get("queryPlan", plan)
+        self.assertFalse(_has_collection_scan(plan), plan)
+        self.assertIn(index_name, _find_index_scans(plan), plan)
+
+    def assertCoveredQuery(self, queryset, index_name: str) -> None:
+        self.assertIndexScan(queryset, index_name)
+        plan = queryset.explain()["queryPlanner"]["winningPlan"]
+        plan = plan.get("queryPlan", plan)
+        self.assertFalse(_has_stage(plan, "FETCH"), plan)
+
+    def test_user_config_queries(self):
+        user_config_mgr = UserConfigManager(transaction=self.transaction)
+
+        self.assertIndexScan(
+            user_config_mgr.filter_user_configs(
+                name="layout", domain_id=self.domain_id, user_id=self.user_id
+            ),
+            "COMPOUND_INDEX_FOR_SEARCH",
+        )
+        self.assertIndexScan(
+            user_config_mgr.filter_user_configs(
+                domain_id=self.domain_id, user_id=self.user_id
+            ).order_by("name"),
+            "COMPOUND_INDEX_FOR_SEARCH",
+        )
+        self.assertIndexScan(
+            user_config_mgr.filter_user_configs(
+                domain_id=self.domain_id,
+                user_id=self.user_id,
+                updated_at__gt=datetime.utcnow(),
+            ).order_by("updated_at"),
+            "COMPOUND_INDEX_FOR_SYNC",
+        )
+        self.assertCoveredQuery(
+            user_config_mgr.filter_user_configs(
+                name="layout", domain_id=self.domain_id, user_id=self.user_id
+            )
+            .only("version")
+            .exclude("id"),
+            "COMPOUND_INDEX_FOR_VERSION",
+        )
+
+    def test_domain_config_queries(self):
+        domain_config_mgr = DomainConfigManager(transaction=self.transaction)
+
+        self.assertIndexScan(
+            domain_config_mgr.filter_domain_configs(
+                name="settings", domain_id=self.domain_id
+            ),
+            "COMPOUND_INDEX_FOR_SEARCH",
+        )
+        self.assertIndexScan(
+            domain_config_mgr.filter_domain_configs(
+                domain_id=self.domain_id
+            ).order_by("name"),
+            "COMPOUND_INDEX_FOR_SEARCH",
+        )
+        self.assertIndexScan(
+            domain_config_mgr.filter_domain_configs(
+                domain_id=self.domain_id, updated_at__gt=datetime.utcnow()
+            ).order_by("updated_at"),
+            "COMPOUND_INDEX_FOR_SYNC",
+        )
+        self.assertCoveredQuery(
+            domain_config_mgr.filter_domain_configs(
+                name="settings", domain_id=self.domain_id
+            )
+            .only("version")
+            .exclude("id"),
+            "COMPOUND_INDEX_FOR_VERSION",
+        )
+
+    def test_public_config_queries(self):
+        public_config_mgr = PublicConfigManager(transaction=self.transaction)
+
+        self.assertIndexScan(
+            public_config_mgr.filter_public_configs(
+                name="login", domain_id=self.domain_id
+            ),
+            "COMPOUND_INDEX_FOR_SEARCH",
+        )
+        self.assertIndexScan(
+            public_config_mgr.filter_public_configs(
+                domain_id=self.domain_id
+            ).order_by("name"),
+            "COMPOUND_INDEX_FOR_SEARCH",
+        )
+
+    def test_shared_config_queries(self):
+        shared_config_mgr = SharedConfigManager(transaction=self.transaction)
+
+        self.assertIndexScan(
+            shared_config_mgr.filter_shared_configs(
+                name="dashboard",
+                domain_id=self.domain_id,
+                workspace_id=[self.workspace_id, "*"],
+                project_id=[self.project_id, "*"],
+            ),
+            "COMPOUND_INDEX_FOR_SEARCH",
+        )
+        self.assertIndexScan(
+            shared_config_mgr.filter_shared_configs(
+                domain_id=self.domain_id,
+                workspace_id=[self.workspace_id, "*"],
+            ).order_by("name"),
+            "COMPOUND_INDEX_FOR_SEARCH",
+        )
+        self.assertIndexScan(
+            shared_config_mgr.filter_shared_configs(
+                domain_id=self.domain_id,
+                workspace_id=[self.workspace_id, "*"],
+                updated_at__gt=datetime.utcnow(),
+            ).order_by("updated_at"),
+            "COMPOUND_INDEX_FOR_SYNC",
+        )
+
+    def test_change_feed_queries(self):
+        for model in [UserConfig, DomainConfig, PublicConfig, SharedConfig]:
+            with self.subTest(model=model.__name__):
+                self.assertIndexScan(
+                    model.objects.filter(updated_at__gte=datetime.utcnow()).order_by(
+                        "updated_at"
+                    ),
+                    "CHANGE_FEED_INDEX",
+                )
+                self.assertIndexScan(
+                    model.objects.order_by("-updated_at").limit(1),
+                    "CHANGE_FEED_INDEX",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
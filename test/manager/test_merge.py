@@ -0,0 +1,73 @@
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.config.lib.merge import (
+    apply_merge_patch,
+    deep_merge,
+    make_merge_patch_update,
+)
+
+
+class TestMerge(unittest.TestCase):
+    def test_deep_merge(self):
+        base = {"a": 1, "b": {"c": 1, "d": 1}}
+
+        self.assertEqual(
+            {"a": 1, "b": {"c": 2, "d": 1}, "e": [1]},
+            deep_merge(base, {"b": {"c": 2}, "e": [1]}),
+        )
+        self.assertEqual({"a": 1, "b": {"c": 1, "d": 1}}, base)
+
+    def test_apply_merge_patch(self):
+        # Examples of RFC 7386, Appendix A
+        for target, patch, result in [
+            ({"a": "b"}, {"a": "c"}, {"a": "c"}),
+            ({"a": "b"}, {"b": "c"}, {"a": "b", "b": "c"}),
+            ({"a": "b"}, {"a": None}, {}),
+            ({"a": "b", "b": "c"}, {"a": None}, {"b": "c"}),
+            ({"a": ["b"]}, {"a": "c"}, {"a": "c"}),
+            ({"a": "c"}, {"a": ["b"]}, {"a": ["b"]}),
+            ({"a": {"b": "c"}}, {"a": {"b": "d", "c": None}}, {"a": {"b": "d"}}),
+            ({"a": [{"b": "c"}]}, {"a": [1]}, {"a": [1]}),
+            (["a", "b"], ["c", "d"], ["c", "d"]),
+            ({"a": "b"}, ["c"], ["c"]),
+            ({"a": "foo"}, None, None),
+            ({"e": None}, {"a": 1}, {"e": None, "a": 1}),
+            ([1, 2], {"a": "b", "c": None}, {"a": "b"}),
+            ({}, {"a": {"bb": {"ccc": None}}}, {"a": {"bb": {}}}),
+        ]:
+            with self.subTest(target=target, patch=patch):
+                self.assertEqual(result, apply_merge_patch(target, patch))
+
+    def test_apply_merge_patch_shares_untouched_subtrees(self):
+        target = {"a": {"b": 1}, "c": {"d": 1}}
+        result = apply_merge_patch(target, {"a": {"b": 2}})
+
+        self.assertIs(target["c"], result["c"])
+        self.assertEqual({"b": 1}, target["a"])
+
+    def test_make_merge_patch_update(self):
+        set_fields, unset_fields = make_merge_patch_update(
+            {"a": {"b": 1, "c": 1}, "d": 1, "e": "f"},
+            {"a": {"b": 2, "c": None}, "d": None, "e": {"g": None}, "x": None},
+            "data",
+        )
+
+        self.assertEqual({"data.a.b": 2, "data.e": {}}, set_fields)
+        self.assertEqual(["data.a.c", "data.d"], unset_fields)
+
+    def test_make_merge_patch_update_without_target(self):
+        self.assertEqual(
+            ({"data": {"a": 1}}, []),
+            make_merge_patch_update(None, {"a": 1, "b": None}, "data"),
+        )
+
+    def test_make_merge_patch_update_invalid_key(self):
+        for key in ["", "a.b", "$set"]:
+            with self.assertRaises(ERROR_INVALID_PARAMETER):
+                make_merge_patch_update({}, {key: 1}, "data")
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,119 @@
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import mongomock
+from bson import ObjectId
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.config.lib import chunked_storage
+from spaceone.config.lib import migration
+from spaceone.config.lib.migration import migrate_indexes
+from spaceone.config.model import DomainConfig, SharedConfig, UserConfig
+
+
+class TestMigration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self) -> None:
+        for model in [UserConfig, DomainConfig, SharedConfig]:
+            model.drop_collection()
+
+    def test_migrate_indexes(self):
+        UserConfig._get_collection().create_index("user_id", name="user_id_1")
+        SharedConfig._get_collection().create_index("project_id", name="project_id_1")
+
+        migrate_indexes()
+
+        user_config_indexes = UserConfig._get_collection().index_information()
+        self.assertNotIn("user_id_1", user_config_indexes)
+        self.assertIn("COMPOUND_INDEX_FOR_SEARCH", user_config_indexes)
+
+        shared_config_indexes = SharedConfig._get_collection().index_information()
+        self.assertNotIn("project_id_1", shared_config_indexes)
+        self.assertIn("COMPOUND_INDEX_FOR_SEARCH", shared_config_indexes)
+
+    def test_migrate_indexes_again(self):
+        migrate_indexes()
+        migrate_indexes()
+
+        self.assertIn(
+            "COMPOUND_INDEX_FOR_SEARCH",
+            DomainConfig._get_collection().index_information(),
+        )
+
+    @patch.object(chunked_storage, "_get_bucket")
+    def test_delete_orphan_data_files(self, get_bucket):
+        data_file_id = ObjectId()
+        orphan_file_id = ObjectId()
+        UserConfig(
+            name="layout",
+            data_file_id=data_file_id,
+            tags={},
+            domain_id="domain-a",
+            user_id="user-a",
+        ).save()
+
+        bucket = get_bucket.return_value
+        bucket.find.return_value = [
+            SimpleNamespace(_id=data_file_id),
+            SimpleNamespace(_id=orphan_file_id),
+        ]
+
+        deleted_count = chunked_storage.delete_orphan_data_files([UserConfig], 0)
+
+        self.assertEqual(1, deleted_count)
+        bucket.delete.assert_called_once_with(orphan_file_id)
+
+
+class TestMigrationCommand(unittest.TestCase):
+    def tearDown(self) -> None:
+        disconnect()
+
+    def _run(self, *argv: str) -> None:
+        init_conf = config.init_conf
+
+        def _init_conf(*args, **kwargs):
+            init_conf(*args, **kwargs)
+            config.set_global_force(
+                DATABASES={
+                    "default": {
+                        "engine": "MongoModel",
+                        "db": "test",
+                        "host": "mongodb://localhost",
+                        "username": "config",
+                        "mongo_client_class": mongomock.MongoClient,
+                    }
+                }
+            )
+
+        with patch.object(config, "init_conf", side_effect=_init_conf):
+            with patch.object(sys, "argv", ["migration", *argv]):
+                migration.main()
+
+    def test_migrate_indexes(self):
+        # Nothing is connected beforehand, the command connects on its own
+        self._run("migrate-indexes")
+
+        self.assertIn(
+            "COMPOUND_INDEX_FOR_SEARCH",
+            UserConfig._get_collection().index_information(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
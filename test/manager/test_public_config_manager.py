@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import NotUniqueError, QuerySet, connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_SAVE_UNIQUE_VALUES
+from spaceone.core.transaction import Transaction
+from spaceone.config.manager.public_config_manager import PublicConfigManager
+from spaceone.config.model import PublicConfig
+
+
+class TestPublicConfigManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.transaction = Transaction(
+            {"service": "config", "api_class": "PublicConfig"}
+        )
+        self.public_config_mgr = PublicConfigManager()
+
+    def tearDown(self) -> None:
+        PublicConfig.objects.filter().delete()
+
+    def _create_public_config(self, name: str = "console.banner", data: dict = None):
+        return self.public_config_mgr.create_public_config(
+            {
+                "name": name,
+                "data": data or {"key": "value"},
+                "tags": {},
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def _set_public_config(self, data: dict, tags: dict = None):
+        params = {"name": "console.banner", "data": data, "domain_id": self.domain_id}
+        if tags is not None:
+            params["tags"] = tags
+
+        return self.public_config_mgr.set_public_config(params)
+
+    def test_create_public_config_duplicate(self):
+        PublicConfig.ensure_indexes()
+        self.addCleanup(PublicConfig._get_collection().drop_indexes)
+        self._create_public_config()
+
+        with self.assertRaises(ERROR_SAVE_UNIQUE_VALUES):
+            self._create_public_config()
+
+
+    def test_set_public_config_not_modified(self):
+        self._create_public_config(data={"a": 1})
+
+        # An unchanged config does not match, and the upsert collides with it on
+        # the unique index. mongomock does not upsert conditional filters.
+        with patch.object(
+            QuerySet, "modify", side_effect=NotUniqueError("duplicate key error")
+        ):
+            _, written = self._set_public_config({"a": 1}, {})
+            self.assertFalse(written)
+
+            with self.assertRaises(NotUniqueError):
+                self._set_public_config({"a": 2})
+
+    def test_set_public_config_after_concurrent_insert(self):
+        modify = QuerySet.modify
+
+        def _modify(queryset, *args, **kwargs):
+            # Another request inserts other data between the match and the upsert
+            if _modify.calls == 0:
+                _modify.calls += 1
+                self._create_public_config(data={"other": True})
+                raise NotUniqueError("duplicate key error")
+
+            return modify(queryset, *args, **kwargs)
+
+        _modify.calls = 0
+
+        with patch.object(QuerySet, "modify", autospec=True, side_effect=_modify):
+            public_config_vo, written = self._set_public_config({"a": 1})
+
+        self.assertTrue(written)
+        self.assertEqual(
+            {"a": 1}, PublicConfig.objects.get(id=public_config_vo.id).data
+        )
+
+    def test_set_public_config_after_concurrent_delete(self):
+        modify = QuerySet.modify
+
+        def _modify(queryset, *args, **kwargs):
+            # The config that collided is deleted before it is read again
+            if _modify.calls == 0:
+                _modify.calls += 1
+                raise NotUniqueError("duplicate key error")
+
+            return modify(queryset, *args, **kwargs)
+
+        _modify.calls = 0
+
+        with patch.object(QuerySet, "modify", autospec=True, side_effect=_modify):
+            public_config_vo, written = self._set_public_config({"a": 1})
+
+        self.assertTrue(written)
+        self.assertEqual({"a": 1}, public_config_vo.data)
+        self.assertEqual(
+            1, PublicConfig.objects.filter(domain_id=self.domain_id).count()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.config.lib import public_config_store
+from spaceone.config.lib.public_config_store import PublicConfigStore
+from spaceone.config.model import PublicConfig
+
+
+class TestPublicConfigStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        for name in ["console.banner", "console.theme"]:
+            PublicConfig(
+                name=name, data={"key": name}, tags={}, domain_id=self.domain_id
+            ).save()
+
+    def tearDown(self) -> None:
+        PublicConfig.objects.filter().delete()
+
+    @patch.object(public_config_store, "get_change_feed")
+    def test_start(self, *args):
+        store = PublicConfigStore()
+        store.start()
+
+        self.assertTrue(store.is_ready)
+        self.assertEqual(
+            {"key": "console.theme"}, store.get(self.domain_id, "console.theme")["data"]
+        )
+
+        results, total_count = store.list(
+            {
+                "filter": [{"k": "domain_id", "v": self.domain_id, "o": "eq"}],
+                "sort": [{"key": "name", "desc": True}],
+            }
+        )
+        self.assertEqual(2, total_count)
+        self.assertEqual("console.theme", results[0]["name"])
+
+    @patch.object(public_config_store.time, "sleep")
+    @patch.object(public_config_store, "get_change_feed")
+    def test_start_retries_load(self, *args):
+        find = PublicConfig._get_collection().find
+        calls = []
+
+        def _find(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise ConnectionError("mongod is not reachable")
+
+            return find(*args, **kwargs)
+
+        store = PublicConfigStore()
+        with patch.object(PublicConfig, "_get_collection") as get_collection:
+            get_collection.return_value.find.side_effect = _find
+            store.start()
+
+        self.assertTrue(store.is_ready)
+        self.assertEqual(2, len(calls))
+        self.assertIsNotNone(store.get(self.domain_id, "console.banner"))
+
+    @patch.object(public_config_store, "get_change_feed")
+    def test_on_change(self, *args):
+        store = PublicConfigStore()
+        store.start()
+
+        public_config_vo = PublicConfig.objects.get(
+            domain_id=self.domain_id, name="console.banner"
+        )
+        store._on_change(
+            {
+                "operation": "delete",
+                "document_key": public_config_vo.id,
+                "document": None,
+            }
+        )
+
+        self.assertIsNone(store.get(self.domain_id, "console.banner"))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
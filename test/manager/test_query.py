@@ -0,0 +1,113 @@
+import unittest
+from unittest.mock import patch
+
+import bson
+import mongomock
+from bson import ObjectId
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.config.lib import compression
+from spaceone.config.lib.query import (
+    iterate_by_batch,
+    query_without_count,
+    set_projection,
+)
+from spaceone.config.model import DomainConfig
+
+
+class TestQuery(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        for name in ["banner", "layout", "theme"]:
+            DomainConfig(
+                name=name, data={"key": name}, tags={}, domain_id=self.domain_id
+            ).save()
+
+    def tearDown(self) -> None:
+        DomainConfig.objects.filter().delete()
+
+    def _make_query(self, **query) -> dict:
+        query["filter"] = [{"k": "domain_id", "v": self.domain_id, "o": "eq"}]
+        return query
+
+    def test_sort_options(self):
+        for sort in [
+            [{"key": "name", "desc": True}],
+            {"key": "name", "desc": True},
+            {"keys": [{"key": "name", "desc": True}]},
+        ]:
+            domain_config_vos = query_without_count(
+                DomainConfig, self._make_query(sort=sort)
+            )
+            self.assertEqual(
+                ["theme", "layout", "banner"], [vo.name for vo in domain_config_vos]
+            )
+
+    def test_page(self):
+        domain_configs_info = query_without_count(
+            DomainConfig,
+            self._make_query(
+                sort={"keys": [{"key": "name"}]}, page={"start": 2, "limit": 1}
+            ),
+            as_pymongo=True,
+        )
+
+        self.assertEqual(["layout"], [info["name"] for info in domain_configs_info])
+
+    def test_query_keys_left_to_mongo_model(self):
+        self.assertEqual(
+            [],
+            query_without_count(
+                DomainConfig, self._make_query(count_only=True), as_pymongo=True
+            ),
+        )
+        self.assertEqual(
+            [], list(iterate_by_batch(DomainConfig, self._make_query(count_only=True)))
+        )
+
+        domain_configs_info = query_without_count(
+            DomainConfig, self._make_query(exclude=["data"]), as_pymongo=True
+        )
+        self.assertEqual(3, len(domain_configs_info))
+        self.assertTrue(all("data" not in info for info in domain_configs_info))
+
+    @patch.object(compression, "load_data_file")
+    def test_data_files_only_read_for_data(self, load_data_file):
+        load_data_file.return_value = (bson.encode({"key": "large"}), False)
+        DomainConfig(
+            name="large",
+            data=None,
+            data_file_id=ObjectId(),
+            tags={},
+            domain_id=self.domain_id,
+        ).save()
+
+        query = set_projection(DomainConfig, self._make_query())
+        domain_configs_info = query_without_count(DomainConfig, query, as_pymongo=True)
+        self.assertEqual(4, len(domain_configs_info))
+        load_data_file.assert_not_called()
+
+        query = set_projection(DomainConfig, self._make_query(), only=["name", "data"])
+        domain_configs_info = query_without_count(DomainConfig, query, as_pymongo=True)
+        load_data_file.assert_called_once()
+        self.assertIn({"key": "large"}, [info["data"] for info in domain_configs_info])
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,190 @@
+import unittest
+from datetime import datetime
+
+from bson import ObjectId
+from google.protobuf import (
+    descriptor_pb2,
+    descriptor_pool,
+    json_format,
+    message_factory,
+    struct_pb2,
+)
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import utils
+from spaceone.config.lib.serializer import to_message
+
+_FIELD = descriptor_pb2.FieldDescriptorProto
+
+
+def _make_message_classes() -> tuple:
+    """Build messages shaped like the spaceone-api config messages.
+
+    spaceone-api is not needed, and every field kind to_message handles is used.
+    """
+
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="test/manager/serializer_test.proto",
+        package="config.test",
+        syntax="proto3",
+        dependency=["google/protobuf/struct.proto"],
+    )
+
+    state_enum = file_proto.enum_type.add(name="State")
+    for number, name in enumerate(["NONE", "ENABLED", "DISABLED"]):
+        state_enum.value.add(name=name, number=number)
+
+    item_proto = file_proto.message_type.add(name="ItemInfo")
+    item_proto.field.add(
+        name="name", number=1, type=_FIELD.TYPE_STRING, label=_FIELD.LABEL_OPTIONAL
+    )
+    item_proto.field.add(
+        name="data",
+        number=2,
+        type=_FIELD.TYPE_MESSAGE,
+        type_name=".google.protobuf.Struct",
+        label=_FIELD.LABEL_OPTIONAL,
+    )
+    item_proto.field.add(
+        name="state",
+        number=3,
+        type=_FIELD.TYPE_ENUM,
+        type_name=".config.test.State",
+        label=_FIELD.LABEL_OPTIONAL,
+    )
+    item_proto.field.add(
+        name="created_at",
+        number=4,
+        type=_FIELD.TYPE_STRING,
+        label=_FIELD.LABEL_OPTIONAL,
+    )
+    item_proto.field.add(
+        name="values",
+        number=5,
+        type=_FIELD.TYPE_MESSAGE,
+        type_name=".google.protobuf.ListValue",
+        label=_FIELD.LABEL_OPTIONAL,
+    )
+    item_proto.field.add(
+        name="names", number=6, type=_FIELD.TYPE_STRING, label=_FIELD.LABEL_REPEATED
+    )
+    item_proto.field.add(
+        name="version", number=7, type=_FIELD.TYPE_INT32, label=_FIELD.LABEL_OPTIONAL
+    )
+
+    labels_entry = item_proto.nested_type.add(name="LabelsEntry")
+    labels_entry.options.map_entry = True
+    labels_entry.field.add(
+        name="key", number=1, type=_FIELD.TYPE_STRING, label=_FIELD.LABEL_OPTIONAL
+    )
+    labels_entry.field.add(
+        name="value", number=2, type=_FIELD.TYPE_STRING, label=_FIELD.LABEL_OPTIONAL
+    )
+    item_proto.field.add(
+        name="labels",
+        number=8,
+        type=_FIELD.TYPE_MESSAGE,
+        type_name=".config.test.ItemInfo.LabelsEntry",
+        label=_FIELD.LABEL_REPEATED,
+    )
+
+    items_proto = file_proto.message_type.add(name="ItemsInfo")
+    items_proto.field.add(
+        name="results",
+        number=1,
+        type=_FIELD.TYPE_MESSAGE,
+        type_name=".config.test.ItemInfo",
+        label=_FIELD.LABEL_REPEATED,
+    )
+    items_proto.field.add(
+        name="total_count",
+        number=2,
+        type=_FIELD.TYPE_INT32,
+        label=_FIELD.LABEL_OPTIONAL,
+    )
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.AddSerializedFile(struct_pb2.DESCRIPTOR.serialized_pb)
+    pool.Add(file_proto)
+    factory = message_factory.MessageFactory(pool)
+
+    return (
+        factory.GetPrototype(pool.FindMessageTypeByName("config.test.ItemInfo")),
+        factory.GetPrototype(pool.FindMessageTypeByName("config.test.ItemsInfo")),
+    )
+
+
+ItemInfo, ItemsInfo = _make_message_classes()
+
+
+class TestSerializer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.created_at = datetime(2024, 1, 2, 3, 4, 5)
+        self.document = {
+            "_id": ObjectId(),
+            "name": "layout",
+            "data": {"columns": 3, "theme": {"dark": True}, "tags": ["a", "b"]},
+            "state": "ENABLED",
+            "created_at": self.created_at,
+            "values": [1, "two", None, {"three": 3}],
+            "names": ["a", "b"],
+            "version": 2,
+            "labels": {"env": "prod"},
+        }
+
+    def _parse_dict(self, message_cls, info: dict):
+        # What the response models and BaseAPI.dict_to_message produce
+        return json_format.ParseDict(info, message_cls())
+
+    def _to_model_dict(self, document: dict) -> dict:
+        info = {key: value for key, value in document.items() if key != "_id"}
+        info["created_at"] = utils.datetime_to_iso8601(info["created_at"])
+        return info
+
+    def test_same_as_parse_dict(self):
+        self.assertEqual(
+            self._parse_dict(ItemInfo, self._to_model_dict(self.document)),
+            to_message(ItemInfo, self.document),
+        )
+
+    def test_repeated_messages(self):
+        documents = [self.document, {**self.document, "name": "theme"}]
+
+        message = to_message(ItemsInfo, {"results": documents, "total_count": 2})
+
+        self.assertEqual(
+            self._parse_dict(
+                ItemsInfo,
+                {
+                    "results": [self._to_model_dict(info) for info in documents],
+                    "total_count": 2,
+                },
+            ),
+            message,
+        )
+        self.assertEqual(["layout", "theme"], [info.name for info in message.results])
+
+    def test_field_kinds(self):
+        message = to_message(ItemInfo, self.document)
+
+        self.assertEqual("2024-01-02T03:04:05.000Z", message.created_at)
+        state_enum = ItemInfo.DESCRIPTOR.fields_by_name["state"].enum_type
+        self.assertEqual(state_enum.values_by_name["ENABLED"].number, message.state)
+        self.assertEqual(self.document["data"], json_format.MessageToDict(message.data))
+        self.assertEqual(
+            self.document["values"], json_format.MessageToDict(message.values)
+        )
+        self.assertEqual({"env": "prod"}, dict(message.labels))
+
+    def test_unknown_keys_and_none_are_skipped(self):
+        info = {"name": "layout", "data": None, "next_page_token": "token"}
+
+        self.assertEqual(ItemInfo(name="layout"), to_message(ItemInfo, info))
+
+        # dict_to_message rejects them instead
+        with self.assertRaises(json_format.ParseError):
+            self._parse_dict(ItemInfo, info)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,182 @@
+import unittest
+from datetime import datetime, timedelta
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_SAVE_UNIQUE_VALUES
+from spaceone.core.transaction import Transaction
+from spaceone.config.lib import cache as config_cache
+from spaceone.config.manager.shared_config_manager import SharedConfigManager
+from spaceone.config.model import SharedConfig
+from spaceone.config.model.shared_config.request import (
+    SharedConfigListChangesRequest,
+)
+
+
+class TestSharedConfigManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        config.set_global_force(
+            CACHES={"default": {}, "local": {"max_size": 128, "ttl": 300}}
+        )
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.workspace_id = utils.generate_id("workspace")
+        self.project_id = utils.generate_id("project")
+        self.transaction = Transaction(
+            {"service": "config", "api_class": "SharedConfig"}
+        )
+        self.shared_config_mgr = SharedConfigManager()
+        config_cache._LOCAL_CACHE = None
+
+    def tearDown(self) -> None:
+        SharedConfig.objects.filter().delete()
+
+    def _create_shared_config(
+        self,
+        name: str,
+        data: dict,
+        resource_group: str = "DOMAIN",
+        workspace_id: str = "*",
+        project_id: str = "*",
+    ) -> SharedConfig:
+        return self.shared_config_mgr.create_shared_config(
+            {
+                "name": name,
+                "data": data,
+                "tags": {},
+                "resource_group": resource_group,
+                "domain_id": self.domain_id,
+                "workspace_id": workspace_id,
+                "project_id": project_id,
+            }
+        )
+
+    def _resolve(self, name: str, merge: bool = False) -> dict:
+        return self.shared_config_mgr.resolve_shared_config(
+            name, self.domain_id, self.workspace_id, self.project_id, merge
+        )
+
+    def test_create_shared_config_duplicate(self):
+        SharedConfig.ensure_indexes()
+        self.addCleanup(SharedConfig._get_collection().drop_indexes)
+        self._create_shared_config("layout", {"key": "domain"})
+        self._create_shared_config(
+            "layout", {"key": "workspace"}, "WORKSPACE", self.workspace_id
+        )
+
+        with self.assertRaises(ERROR_SAVE_UNIQUE_VALUES):
+            self._create_shared_config("layout", {"key": "other"})
+
+    def test_patch_after_concurrent_update(self):
+        shared_config_vo = self._create_shared_config("layout", {"key": "v1"})
+
+        # Another request updates the config after it was loaded
+        self.shared_config_mgr.update_shared_config_by_vo(
+            {"data": {"key": "v2"}}, SharedConfig.objects.get(id=shared_config_vo.id)
+        )
+
+        self.shared_config_mgr.patch_shared_config_by_vo(
+            {"lang": "ko"}, shared_config_vo
+        )
+
+        stored_vo = SharedConfig.objects.get(id=shared_config_vo.id)
+        self.assertEqual({"key": "v2", "lang": "ko"}, stored_vo.data)
+        self.assertEqual(3, stored_vo.version)
+
+    def test_resolve(self):
+        self._create_shared_config("layout", {"a": 1, "b": {"c": 1}})
+        self._create_shared_config(
+            "layout", {"b": {"d": 2}}, "WORKSPACE", self.workspace_id
+        )
+
+        self.assertEqual({"b": {"d": 2}}, self._resolve("layout")["data"])
+        self.assertEqual(
+            {"a": 1, "b": {"c": 1, "d": 2}}, self._resolve("layout", True)["data"]
+        )
+
+    def test_resolve_cache_invalidation(self):
+        for name in ["layout", "layout.*[a-z]?"]:
+            shared_config_vo = self._create_shared_config(name, {"key": "old"})
+            self.assertEqual({"key": "old"}, self._resolve(name)["data"])
+
+            self.shared_config_mgr.update_shared_config_by_vo(
+                {"data": {"key": "new"}}, shared_config_vo
+            )
+            self.assertEqual({"key": "new"}, self._resolve(name)["data"])
+
+            self._create_shared_config(
+                name,
+                {"key": "project"},
+                "PROJECT",
+                self.workspace_id,
+                self.project_id,
+            )
+            self.assertEqual({"key": "project"}, self._resolve(name)["data"])
+
+    def test_resolve_cache_scope(self):
+        shared_config_vo = self._create_shared_config("layout", {"key": "old"})
+        self._create_shared_config("other", {"key": "other"})
+        self._resolve("other")
+        other_cache_key = next(
+            key
+            for key in config_cache._LOCAL_CACHE._cache.keys()
+            if key.startswith(f"config:shared-config:resolve:{self.domain_id}:other:")
+        )
+
+        self.shared_config_mgr.update_shared_config_by_vo(
+            {"data": {"key": "new"}}, shared_config_vo
+        )
+
+        self.assertIsNotNone(config_cache.get(other_cache_key))
+
+    def test_list_shared_config_changes(self):
+        since = datetime.utcnow() - timedelta(seconds=10)
+        self._create_shared_config("layout", {"key": "domain"})
+        self._create_shared_config(
+            "layout", {"key": "project"}, "PROJECT", self.workspace_id, self.project_id
+        )
+        self._create_shared_config(
+            "layout", {"key": "other"}, "PROJECT", self.workspace_id, "other-project"
+        )
+
+        changes = self.shared_config_mgr.list_shared_config_changes(
+            since, self.domain_id, [self.workspace_id, "*"], [self.project_id, "*"]
+        )
+
+        self.assertEqual(
+            ["domain", "project"],
+            sorted(info["data"]["key"] for info in changes["results"]),
+        )
+
+    def test_list_changes_request_since(self):
+        for since, expected in [
+            ("2024-01-01T09:00:00+09:00", datetime(2024, 1, 1)),
+            ("2024-01-01T00:00:00Z", datetime(2024, 1, 1)),
+            (datetime(2024, 1, 1), datetime(2024, 1, 1)),
+        ]:
+            with self.subTest(since=since):
+                request = SharedConfigListChangesRequest(
+                    since=since, domain_id=self.domain_id
+                )
+                self.assertEqual(expected, request.since)
+                self.assertIsNone(request.since.tzinfo)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
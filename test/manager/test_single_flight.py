@@ -0,0 +1,115 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.config.lib import single_flight as single_flight_module
+from spaceone.config.lib.single_flight import single_flight
+
+_TIMEOUT = 5
+
+
+class _WaitingEvent(threading.Event):
+    """Event that tells the test when a follower starts waiting on it"""
+
+    waiting = None
+
+    def wait(self, timeout=None):
+        self.waiting.release()
+        return super().wait(timeout)
+
+
+class _Call(single_flight_module._Call):
+    def __init__(self):
+        super().__init__()
+        self.done = _WaitingEvent()
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self) -> None:
+        _WaitingEvent.waiting = threading.Semaphore(0)
+        self.release = threading.Event()
+        self.calls = 0
+
+    def _run_concurrently(self, func, follower_count: int = 4) -> list:
+        """Run single_flight in a leader and followers, return their outcomes"""
+
+        outcomes = []
+
+        def _call():
+            try:
+                outcomes.append(single_flight("key", func))
+            except Exception as e:
+                outcomes.append(e)
+
+        threads = [threading.Thread(target=_call)]
+        threads[0].start()
+        self.assertTrue(self.started.wait(_TIMEOUT))
+
+        for _ in range(follower_count):
+            threads.append(threading.Thread(target=_call))
+            threads[-1].start()
+            self.assertTrue(_WaitingEvent.waiting.acquire(timeout=_TIMEOUT))
+
+        self.release.set()
+        for thread in threads:
+            thread.join(_TIMEOUT)
+
+        return outcomes
+
+    def _make_func(self, result=None, error: Exception = None):
+        self.started = threading.Event()
+
+        def _func():
+            self.calls += 1
+            self.started.set()
+            self.release.wait(_TIMEOUT)
+            if error:
+                raise error
+
+            return result
+
+        return _func
+
+    @patch.object(single_flight_module, "_Call", _Call)
+    def test_shared_result(self):
+        result = {"key": "value"}
+        outcomes = self._run_concurrently(self._make_func(result))
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual(5, len(outcomes))
+        self.assertTrue(all(outcome is result for outcome in outcomes))
+
+    @patch.object(single_flight_module, "_Call", _Call)
+    def test_shared_error(self):
+        error = ValueError("identity is unavailable")
+        outcomes = self._run_concurrently(self._make_func(error=error))
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual(5, len(outcomes))
+        self.assertTrue(all(outcome is error for outcome in outcomes))
+
+    def test_sequential_calls(self):
+        self.release.set()
+        func = self._make_func("value")
+
+        self.assertEqual("value", single_flight("key", func))
+        self.assertEqual("value", single_flight("key", func))
+        self.assertEqual(2, self.calls)
+
+    def test_other_keys(self):
+        leader = threading.Thread(
+            target=single_flight, args=("key", self._make_func("value"))
+        )
+        leader.start()
+        self.assertTrue(self.started.wait(_TIMEOUT))
+
+        self.assertEqual("other", single_flight("other-key", lambda: "other"))
+
+        self.release.set()
+        leader.join(_TIMEOUT)
+        self.assertEqual(1, self.calls)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,266 @@
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import NotUniqueError, QuerySet, connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_INVALID_PARAMETER, ERROR_SAVE_UNIQUE_VALUES
+from spaceone.core.transaction import Transaction
+from spaceone.config.lib.content_hash import make_data_hash
+from spaceone.config.manager.user_config_manager import UserConfigManager
+from spaceone.config.model import UserConfig
+
+
+class TestUserConfigManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.user_id = utils.generate_id("user")
+        self.transaction = Transaction({"service": "config", "api_class": "UserConfig"})
+        self.user_config_mgr = UserConfigManager()
+
+    def tearDown(self) -> None:
+        UserConfig.objects.filter().delete()
+
+    def _create_user_config(self, name: str = "layout", data: dict = None):
+        return self.user_config_mgr.create_user_config(
+            {
+                "name": name,
+                "data": data or {"key": "value"},
+                "tags": {},
+                "domain_id": self.domain_id,
+                "user_id": self.user_id,
+            }
+        )
+
+    def _set_user_config(self, data: dict, tags: dict = None):
+        params = {
+            "name": "layout",
+            "data": data,
+            "domain_id": self.domain_id,
+            "user_id": self.user_id,
+        }
+        if tags is not None:
+            params["tags"] = tags
+
+        return self.user_config_mgr.set_user_config(params)
+
+    def _get_stored_user_config(self) -> UserConfig:
+        return UserConfig.objects.get(
+            name="layout", domain_id=self.domain_id, user_id=self.user_id
+        )
+
+    def test_create_user_config_duplicate(self):
+        UserConfig.ensure_indexes()
+        self.addCleanup(UserConfig._get_collection().drop_indexes)
+        self._create_user_config()
+
+        with self.assertRaises(ERROR_SAVE_UNIQUE_VALUES):
+            self._create_user_config()
+
+    def test_update_user_config_not_modified(self):
+        user_config_vo = self._create_user_config(data={"a": 1, "b": 2})
+
+        user_config_vo, written = self.user_config_mgr.update_user_config_by_vo(
+            {"data": {"b": 2, "a": 1}, "tags": {}}, user_config_vo
+        )
+        self.assertFalse(written)
+        self.assertEqual(1, user_config_vo.version)
+
+        user_config_vo, written = self.user_config_mgr.update_user_config_by_vo(
+            {"tags": {"key": "value"}}, user_config_vo
+        )
+        self.assertTrue(written)
+        self.assertEqual(2, user_config_vo.version)
+
+    def test_set_user_config_insert_and_update(self):
+        # Without tags, mongomock does not upsert the $or filter of a tags change
+        user_config_vo, written = self._set_user_config({"a": 1})
+
+        self.assertTrue(written)
+        self.assertEqual(1, user_config_vo.version)
+        self.assertEqual(user_config_vo.created_at, user_config_vo.updated_at)
+        stored_vo = self._get_stored_user_config()
+        self.assertEqual({"a": 1}, stored_vo.data)
+        self.assertEqual(1, stored_vo.version)
+        self.assertEqual(make_data_hash({"a": 1}), stored_vo.data_hash)
+
+        created_at = stored_vo.created_at - timedelta(days=1)
+        UserConfig.objects.filter(id=stored_vo.id).update(set__created_at=created_at)
+
+        # The update only sets the given fields, created_at is set on insert only
+        user_config_vo, written = self._set_user_config({"a": 2}, {"key": "value"})
+
+        self.assertTrue(written)
+        self.assertEqual(stored_vo.id, user_config_vo.id)
+        self.assertEqual(2, user_config_vo.version)
+        self.assertEqual(created_at, user_config_vo.created_at)
+        self.assertEqual(1, UserConfig.objects.filter(name="layout").count())
+        stored_vo = self._get_stored_user_config()
+        self.assertEqual({"a": 2}, stored_vo.data)
+        self.assertEqual({"key": "value"}, stored_vo.tags)
+        self.assertEqual(2, stored_vo.version)
+        self.assertEqual(created_at, stored_vo.created_at)
+        self.assertGreater(stored_vo.updated_at, created_at)
+
+    def test_set_user_config_not_modified(self):
+        self._create_user_config(data={"a": 1})
+
+        # An unchanged config does not match, and the upsert collides with it on
+        # the unique index. mongomock does not upsert conditional filters.
+        with patch.object(
+            QuerySet, "modify", side_effect=NotUniqueError("duplicate key error")
+        ):
+            user_config_vo, written = self._set_user_config({"a": 1}, {})
+            self.assertFalse(written)
+            self.assertEqual(1, user_config_vo.version)
+
+            _, written = self._set_user_config({"a": 1})
+            self.assertFalse(written)
+
+            with self.assertRaises(NotUniqueError):
+                self._set_user_config({"a": 2})
+
+        user_config_vo, written = self._set_user_config({"a": 1}, {"key": "value"})
+        self.assertTrue(written)
+        self.assertEqual(2, UserConfig.objects.get(id=user_config_vo.id).version)
+
+    def test_set_user_config_after_concurrent_insert(self):
+        modify = QuerySet.modify
+
+        def _modify(queryset, *args, **kwargs):
+            # Another request inserts other data between the match and the upsert
+            if _modify.calls == 0:
+                _modify.calls += 1
+                self._create_user_config(data={"other": True})
+                raise NotUniqueError("duplicate key error")
+
+            return modify(queryset, *args, **kwargs)
+
+        _modify.calls = 0
+
+        with patch.object(QuerySet, "modify", autospec=True, side_effect=_modify):
+            user_config_vo, written = self._set_user_config({"a": 1})
+
+        self.assertTrue(written)
+        self.assertEqual(
+            {"a": 1}, UserConfig.objects.get(id=user_config_vo.id).data
+        )
+
+    def test_patch_user_config(self):
+        user_config_vo = self._create_user_config(
+            data={"layout": {"columns": 2, "rows": 3}, "theme": "dark"}
+        )
+
+        self.user_config_mgr.patch_user_config_by_vo(
+            {"layout": {"columns": 3, "rows": None}, "theme": None, "lang": "en"},
+            user_config_vo,
+        )
+
+        expected_data = {"layout": {"columns": 3}, "lang": "en"}
+        self.assertEqual(expected_data, user_config_vo.data)
+        self.assertEqual(
+            expected_data, UserConfig.objects.get(id=user_config_vo.id).data
+        )
+
+    def test_patch_user_config_rollback(self):
+        # Saved directly, so that the only rollback is the one of the patch
+        user_config_vo = UserConfig(
+            name="layout",
+            data={"theme": "dark"},
+            tags={},
+            domain_id=self.domain_id,
+            user_id=self.user_id,
+            version=1,
+        ).save()
+
+        self.user_config_mgr.patch_user_config_by_vo({"theme": "light"}, user_config_vo)
+        self.user_config_mgr.transaction.execute_rollback()
+
+        self.assertEqual(
+            {"theme": "dark"}, UserConfig.objects.get(id=user_config_vo.id).data
+        )
+
+    def test_patch_user_config_after_concurrent_set(self):
+        user_config_vo = self._create_user_config(data={"theme": "dark"})
+
+        # Another request sets other data after the config was loaded
+        self._set_user_config({"theme": "dark", "lang": "ko"})
+
+        user_config_vo = self.user_config_mgr.patch_user_config_by_vo(
+            {"theme": "light"}, user_config_vo
+        )
+
+        stored_vo = UserConfig.objects.get(id=user_config_vo.id)
+        self.assertEqual({"theme": "light", "lang": "ko"}, stored_vo.data)
+        self.assertEqual(make_data_hash(stored_vo.data), stored_vo.data_hash)
+        self.assertEqual(3, stored_vo.version)
+
+        # The stored data_hash is the one of the stored data, so this is written
+        _, written = self._set_user_config({"theme": "light"})
+        self.assertTrue(written)
+        self.assertEqual(
+            {"theme": "light"}, UserConfig.objects.get(id=user_config_vo.id).data
+        )
+
+    def test_filter_user_configs_by_names(self):
+        for name in ["layout", "theme", "other"]:
+            self._create_user_config(name)
+
+        user_config_vos = self.user_config_mgr.filter_user_configs(
+            name=["layout", "theme", "missing"],
+            domain_id=self.domain_id,
+            user_id=self.user_id,
+        )
+
+        self.assertEqual(
+            ["layout", "theme"], sorted(vo.name for vo in user_config_vos)
+        )
+
+    def test_list_user_configs_count_only(self):
+        for name in ["layout", "theme"]:
+            self._create_user_config(name)
+
+        user_configs_info, total_count = self.user_config_mgr.list_user_configs(
+            {
+                "filter": [{"k": "domain_id", "v": self.domain_id, "o": "eq"}],
+                "count_only": True,
+            },
+            as_pymongo=True,
+        )
+
+        self.assertEqual([], user_configs_info)
+        self.assertEqual(2, total_count)
+
+    def test_bulk_write_validates_operations(self):
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            self.user_config_mgr.bulk_write_user_configs(
+                [
+                    {"operation": "SET", "name": "valid", "data": {}},
+                    {"operation": "SET", "name": "x" * 256, "data": {}},
+                ],
+                self.domain_id,
+                self.user_id,
+            )
+
+        self.assertEqual(0, UserConfig.objects.filter(domain_id=self.domain_id).count())
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,151 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.config.error.config import ERROR_TOO_MANY_WATCHERS
+from spaceone.config.lib import watch
+from spaceone.config.lib.watch import ConfigWatcher, watch_configs
+from spaceone.config.model import UserConfig
+
+
+@patch.object(watch, "get_change_feed")
+class TestWatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        config.set_global_force(
+            CONFIG_WATCH={"heartbeat_interval": 0.01, "max_watchers": 2}
+        )
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.user_id = utils.generate_id("user")
+        watch._WATCH_HUBS.clear()
+        watch._WATCH_SLOTS = None
+
+    def tearDown(self) -> None:
+        UserConfig.objects.filter().delete()
+
+    def _watch(self, name_prefixes: list = None):
+        return watch_configs(
+            UserConfig,
+            {"domain_id": self.domain_id, "user_id": self.user_id},
+            name_prefixes,
+        )
+
+    def _make_event(self, name: str, user_id: str = None) -> dict:
+        user_config_vo = UserConfig(
+            name=name,
+            data={"key": name},
+            tags={},
+            domain_id=self.domain_id,
+            user_id=user_id or self.user_id,
+        ).save()
+        document = UserConfig._get_collection().find_one({"_id": user_config_vo.id})
+        return {
+            "operation": "insert",
+            "document_key": user_config_vo.id,
+            "document": document,
+        }
+
+    def test_watch(self, *args):
+        events = self._watch(["layout."])
+        self.assertIsNone(next(events))
+
+        watch_hub = watch._WATCH_HUBS[UserConfig]
+        watch_hub._on_change(self._make_event("theme"))
+        watch_hub._on_change(self._make_event("layout.table"))
+        watch_hub._on_change(self._make_event("layout.other", "other-user"))
+
+        event = next(events)
+        self.assertEqual("CREATED", event["event_type"])
+        self.assertEqual("layout.table", event["name"])
+        self.assertEqual({"key": "layout.table"}, event["config"]["data"])
+        self.assertIsNone(next(events))
+        events.close()
+
+    def test_unpack_once_per_event(self, *args):
+        watchers = [self._watch(), self._watch()]
+        for events in watchers:
+            next(events)
+
+        watch_hub = watch._WATCH_HUBS[UserConfig]
+        with patch.object(
+            watch, "unpack_document", wraps=watch.unpack_document
+        ) as unpack_document:
+            watch_hub._on_change(self._make_event("layout", "other-user"))
+            unpack_document.assert_not_called()
+
+            watch_hub._on_change(self._make_event("layout"))
+            unpack_document.assert_called_once()
+
+        for events in watchers:
+            self.assertEqual("layout", next(events)["name"])
+            events.close()
+
+    def test_max_watchers(self, *args):
+        watchers = [self._watch(), self._watch()]
+        for events in watchers:
+            next(events)
+
+        with self.assertRaises(ERROR_TOO_MANY_WATCHERS):
+            next(self._watch())
+
+        watchers[0].close()
+        events = self._watch()
+        self.assertIsNone(next(events))
+
+        events.close()
+        watchers[1].close()
+
+    def test_max_watchers_from_max_workers(self, *args):
+        watch_conf = config.get_global("CONFIG_WATCH")
+        max_workers = config.get_global("MAX_WORKERS")
+        self.addCleanup(
+            config.set_global_force, CONFIG_WATCH=watch_conf, MAX_WORKERS=max_workers
+        )
+        config.set_global_force(
+            CONFIG_WATCH={**watch_conf, "max_watchers": None}, MAX_WORKERS=3
+        )
+
+        events = self._watch()
+        next(events)
+
+        # Streams may hold half of the workers, rounded down
+        with self.assertRaises(ERROR_TOO_MANY_WATCHERS):
+            next(self._watch())
+
+        events.close()
+
+    def test_accepts_deletes_by_id(self, *args):
+        event = self._make_event("layout")
+        watcher = ConfigWatcher(UserConfig, {"domain_id": self.domain_id})
+        watcher._load_names()
+
+        delete_event = {
+            "operation": "delete",
+            "document_key": event["document_key"],
+            "document": None,
+        }
+        self.assertTrue(watcher.accepts(delete_event))
+        self.assertFalse(
+            watcher.accepts({**delete_event, "document_key": "unknown"})
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
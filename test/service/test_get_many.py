@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.config.lib import query
+from spaceone.config.model import DomainConfig, UserConfig
+from spaceone.config.service.domain_config_service import DomainConfigService
+from spaceone.config.service.user_config_service import UserConfigService
+
+
+class TestGetMany(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.user_id = utils.generate_id("user")
+
+    def tearDown(self) -> None:
+        UserConfig.objects.filter().delete()
+        DomainConfig.objects.filter().delete()
+
+    def test_user_config_get_many(self):
+        for name in ["layout", "theme"]:
+            UserConfig(
+                name=name,
+                data={"name": name},
+                tags={},
+                domain_id=self.domain_id,
+                user_id=self.user_id,
+            ).save()
+
+        UserConfig(
+            name="layout",
+            data={"name": "other"},
+            tags={},
+            domain_id=self.domain_id,
+            user_id=utils.generate_id("user"),
+        ).save()
+
+        response = UserConfigService().get_many(
+            {
+                "names": ["theme", "missing", "layout", "theme"],
+                "domain_id": self.domain_id,
+                "user_id": self.user_id,
+            }
+        )
+
+        self.assertEqual(
+            ["theme", "layout"], [info["name"] for info in response["results"]]
+        )
+        self.assertEqual({"name": "theme"}, response["results"][0]["data"])
+        self.assertEqual(["missing"], response["missing"])
+
+    def test_domain_config_get_many(self):
+        DomainConfig(
+            name="layout", data={"key": "value"}, tags={}, domain_id=self.domain_id
+        ).save()
+
+        response = DomainConfigService().get_many(
+            {"names": ["layout", "missing"], "domain_id": self.domain_id}
+        )
+
+        self.assertEqual(["layout"], [info["name"] for info in response["results"]])
+        self.assertEqual({"key": "value"}, response["results"][0]["data"])
+        self.assertEqual(["missing"], response["missing"])
+
+    def test_get_many_reads_raw_documents(self):
+        DomainConfig(
+            name="layout", data={"key": "value"}, tags={}, domain_id=self.domain_id
+        ).save()
+        unpack_document = query.unpack_document
+
+        def _unpack_document(document, model):
+            self.assertNotIn("data_hash", document)
+            self.assertNotIn("version", document)
+            return unpack_document(document, model)
+
+        with patch.object(DomainConfig, "to_dict", side_effect=AssertionError):
+            with patch.object(
+                query, "unpack_document", side_effect=_unpack_document
+            ) as unpack:
+                DomainConfigService().get_many(
+                    {"names": ["layout"], "domain_id": self.domain_id}
+                )
+
+        unpack.assert_called_once()
+
+    def test_get_many_names_limit(self):
+        names = [f"config-{index}" for index in range(101)]
+
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            DomainConfigService().get_many(
+                {"names": names, "domain_id": self.domain_id}
+            )
+
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            UserConfigService().get_many(
+                {"names": names, "domain_id": self.domain_id, "user_id": self.user_id}
+            )
+
+        response = DomainConfigService().get_many(
+            {"names": names[:100], "domain_id": self.domain_id}
+        )
+        self.assertEqual(names[:100], response["missing"])
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,136 @@
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.config.model import DomainConfig, PublicConfig, SharedConfig, UserConfig
+from spaceone.config.service.domain_config_service import DomainConfigService
+from spaceone.config.service.public_config_service import PublicConfigService
+from spaceone.config.service.shared_config_service import SharedConfigService
+from spaceone.config.service.user_config_service import UserConfigService
+
+
+class TestListStream(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.config")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.domain_id = utils.generate_id("domain")
+        self.user_id = utils.generate_id("user")
+
+    def tearDown(self) -> None:
+        for model in [UserConfig, DomainConfig, PublicConfig, SharedConfig]:
+            model.objects.filter().delete()
+
+    def _create_configs(self, model, count: int, **fields) -> list:
+        # Insert in reverse so the sort, not the insertion order, is checked
+        names = [f"config-{index}" for index in range(count)]
+        for name in reversed(names):
+            model(
+                name=name,
+                data={"name": name},
+                tags={},
+                domain_id=self.domain_id,
+                **fields,
+            ).save()
+
+        return names
+
+    def _stream(self, service, params: dict) -> list:
+        params = {
+            "domain_id": self.domain_id,
+            "page_size": 2,
+            "query": {"sort": [{"key": "name"}]},
+            **params,
+        }
+        return list(service.list_stream(params))
+
+    def _assert_batches(self, batches: list, names: list) -> None:
+        self.assertEqual([len(batch["results"]) for batch in batches], [2, 2, 1])
+        self.assertEqual(
+            [info["name"] for batch in batches for info in batch["results"]], names
+        )
+        for batch in batches:
+            self.assertEqual(set(batch.keys()), {"results"})
+            for info in batch["results"]:
+                self.assertEqual(info["data"], {"name": info["name"]})
+
+    def test_user_config_list_stream(self):
+        names = self._create_configs(UserConfig, 5, user_id=self.user_id)
+        self._create_configs(UserConfig, 2, user_id=utils.generate_id("user"))
+
+        batches = self._stream(UserConfigService(), {"user_id": self.user_id})
+
+        self._assert_batches(batches, names)
+
+    def test_domain_config_list_stream(self):
+        names = self._create_configs(DomainConfig, 5)
+
+        batches = self._stream(DomainConfigService(), {})
+
+        self._assert_batches(batches, names)
+
+    def test_public_config_list_stream(self):
+        names = self._create_configs(PublicConfig, 5)
+
+        batches = self._stream(PublicConfigService(), {})
+
+        self._assert_batches(batches, names)
+
+    def test_shared_config_list_stream(self):
+        names = self._create_configs(
+            SharedConfig,
+            5,
+            resource_group="DOMAIN",
+            workspace_id="*",
+            project_id="*",
+        )
+
+        batches = self._stream(SharedConfigService(), {})
+
+        self._assert_batches(batches, names)
+
+    def test_list_stream_ends_after_last_batch(self):
+        self._create_configs(DomainConfig, 4)
+
+        stream = DomainConfigService().list_stream(
+            {
+                "domain_id": self.domain_id,
+                "page_size": 2,
+                "query": {"sort": [{"key": "name"}]},
+            }
+        )
+
+        self.assertEqual(len(next(stream)["results"]), 2)
+        self.assertEqual(len(next(stream)["results"]), 2)
+        with self.assertRaises(StopIteration):
+            next(stream)
+
+    def test_list_stream_default_batch_size(self):
+        names = self._create_configs(DomainConfig, 3)
+        config.set_global_force(LIST_STREAM_BATCH_SIZE=2)
+        self.addCleanup(config.set_global_force, LIST_STREAM_BATCH_SIZE=100)
+
+        batches = self._stream(DomainConfigService(), {"page_size": None})
+
+        self.assertEqual([len(batch["results"]) for batch in batches], [2, 1])
+        self.assertEqual(
+            [info["name"] for batch in batches for info in batch["results"]], names
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
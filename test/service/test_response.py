@@ -0,0 +1,63 @@
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.config.model.domain_config.response import (
+    DomainConfigResponse,
+    DomainConfigsResponse,
+)
+from spaceone.config.model.public_config.response import (
+    PublicConfigResponse,
+    PublicConfigsResponse,
+)
+from spaceone.config.model.shared_config.response import (
+    SharedConfigResponse,
+    SharedConfigsResponse,
+)
+from spaceone.config.model.user_config.response import (
+    UserConfigGetManyResponse,
+    UserConfigResponse,
+    UserConfigsResponse,
+)
+
+
+class TestResponse(unittest.TestCase):
+    def test_fields_pending_in_protos(self):
+        # dict_to_message rejects fields the spaceone-api messages do not have.
+        for response_class, fields in [
+            (UserConfigResponse, ["version", "written", "not_modified"]),
+            (DomainConfigResponse, ["version", "written", "not_modified"]),
+            (SharedConfigResponse, ["version", "written", "not_modified"]),
+            (PublicConfigResponse, ["written"]),
+        ]:
+            with self.subTest(response=response_class.__name__):
+                response = response_class(
+                    name="layout", **{field: True for field in fields}
+                )
+
+                for field in fields:
+                    self.assertTrue(getattr(response, field))
+                    self.assertNotIn(field, response.dict())
+
+    def test_nested_fields_pending_in_protos(self):
+        response = UserConfigGetManyResponse(
+            results=[UserConfigResponse(name="layout", version=2)], missing=[]
+        )
+
+        self.assertNotIn("version", response.dict()["results"][0])
+
+    def test_next_page_token_pending_in_protos(self):
+        for response_class in [
+            UserConfigsResponse,
+            DomainConfigsResponse,
+            SharedConfigsResponse,
+            PublicConfigsResponse,
+        ]:
+            with self.subTest(response=response_class.__name__):
+                response = response_class(results=[], next_page_token="token")
+
+                self.assertEqual("token", response.next_page_token)
+                self.assertNotIn("next_page_token", response.dict())
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,17 @@
+import importlib
+import pkgutil
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.config import service
+
+
+class TestServiceImport(unittest.TestCase):
+    def test_import_services(self):
+        for module_info in pkgutil.iter_modules(service.__path__):
+            with self.subTest(module=module_info.name):
+                importlib.import_module(f"{service.__name__}.{module_info.name}")
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)